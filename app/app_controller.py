@@ -32,13 +32,10 @@ class AppController:
 
         REQUIRES: path is a valid .xlsx file path
         MODIFIES: BudgetManager, main_window
-        EFFECTS: Loads budget data and updates main window UI.
+        EFFECTS: Loads budget data, updates main window UI, and watches the file for edits.
         """
-        data = ExcelLoader.load_budget_data(path)
-        if data:
+        if self.main_window.load_budget_data(path):
             BudgetManager().reset()  # Ensure clean state
-            self.main_window.budget_data = data
-            self.main_window.update_ui()
             self.stack.setCurrentWidget(self.main_window)
 
     def continue_without_file(self):
@@ -57,7 +54,9 @@ class AppController:
         Saves the session data to an Excel file and exits the app.
 
         REQUIRES: nothing
-        MODIFIES: Excel file
+        MODIFIES: Excel file, attached SQLite store
         EFFECTS: Writes session data to file and closes the app.
         """
-        ExcelLoader.save_budget_data(BudgetManager().transactions, self.main_window.budget_data)
+        manager = BudgetManager()
+        ExcelLoader.save_budget_data(manager.transactions, self.main_window.budget_data)
+        manager.save_session(self.main_window.budget_data)
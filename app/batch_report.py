@@ -0,0 +1,115 @@
+# app/batch_report.py
+
+"""
+Headless batch reporting for one or more budget files.
+
+Abstraction Function:
+- batch_report loads each file with the regular loaders, computes its budget summary
+  through BudgetManager and ReportBuilder, optionally renders the spending chart to
+  PNG/SVG with the Agg backend, and emits all summaries as JSON.
+
+Representation Invariant:
+- Never imports PyQt6; matplotlib is imported only when a chart is requested.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from app.budget_manager import BudgetManager
+from app.categorizer import Categorizer
+from app.chart_renderer import LineChartRenderer
+from app.report_builder import ReportBuilder
+from file_io.loader_factory import LoaderFactory
+
+
+def render_chart(series, path, renderer=None):
+    """
+    Renders a chart straight to an image file without a GUI.
+
+    REQUIRES: series is a list of numbers; path ends in a format matplotlib supports (.png, .svg)
+    MODIFIES: file system
+    EFFECTS: Draws the series with the given renderer (line chart by default) and saves it to path.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=(12, 5))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    (renderer or LineChartRenderer()).render(ax, series)
+    figure.savefig(path)
+
+
+def build_report(path, budget_limit=0.0, chart_dir=None, chart_format="png", categorizer=None):
+    """
+    Builds the summary for a single budget file.
+
+    REQUIRES: path is a budget file supported by LoaderFactory; budget_limit >= 0;
+              categorizer is a Categorizer or None
+    MODIFIES: BudgetManager, file system when chart_dir is given
+    EFFECTS: Returns a dict with the file path and its summary, or an error message.
+    """
+    try:
+        data = LoaderFactory.load(path, categorizer)
+    except (OSError, ValueError, KeyError) as e:
+        return {"file": path, "error": str(e)}
+    if not data:
+        return {"file": path, "error": "Could not read budget data"}
+
+    manager = BudgetManager()
+    manager.reset()
+    manager.set_budget(budget_limit)
+    report = {"file": path}
+    report.update(ReportBuilder.summarize(data, manager.budget))
+
+    if chart_dir:
+        os.makedirs(chart_dir, exist_ok=True)
+        name = os.path.splitext(os.path.basename(path))[0]
+        chart_path = os.path.join(chart_dir, f"{name}.{chart_format}")
+        render_chart(ReportBuilder.chart_series(data["Expenses"]), chart_path)
+        report["chart"] = chart_path
+    return report
+
+
+def main(argv=None):
+    """
+    Command-line entry point for headless reporting.
+
+    REQUIRES: argv is a list of command-line arguments or None for sys.argv
+    MODIFIES: stdout or the output file, chart directory
+    EFFECTS: Writes a JSON list of per-file summaries; returns 1 if the rules file or any budget
+             file failed, else 0.
+    """
+    parser = argparse.ArgumentParser(description="Generate budget summaries without the GUI.")
+    parser.add_argument("files", nargs="+", help="Excel (.xlsx) or CSV budget files")
+    parser.add_argument("--budget", type=float, default=0.0, help="budget limit to check spending against")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--chart-dir", help="directory to write one chart per file")
+    parser.add_argument("--chart-format", choices=["png", "svg"], default="png")
+    parser.add_argument("--rules", help="JSON categorization rules for CSV rows without a known category")
+    args = parser.parse_args(argv)
+
+    try:
+        categorizer = Categorizer.from_json(args.rules) if args.rules else None
+    except (OSError, ValueError) as e:
+        print(f"Could not load rules: {e}", file=sys.stderr)
+        return 1
+    reports = [
+        build_report(path, args.budget, args.chart_dir, args.chart_format, categorizer)
+        for path in args.files
+    ]
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+    else:
+        json.dump(reports, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    return 1 if any("error" in report for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
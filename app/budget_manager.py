@@ -9,10 +9,26 @@ Abstraction Function:
 Representation Invariant:
 - budget is a valid Budget object
 - transactions is a list of valid Transaction objects
+- budget_table holds per-household, per-category, per-month limits; every transaction is
+  charged to it (converted, with a converter) as it is added and uncharged as it is removed
+- search_index holds every transaction's description (and any indexed expense items)
+- deduplicator has seen the fingerprint of every transaction in transactions
+- duplicates lists the transactions flagged as duplicates by the most recent add_transactions()
+- store is None or a SqliteStore; transactions[:saved_count] are already persisted in it, and
+  a persisted transaction removed from the session is deleted from it
+- converter is None (all amounts taken as budget.currency) or a CurrencyConverter into
+  budget.currency mirroring transactions; totals then use converted amounts
+- revision changes whenever transactions or their converted amounts change, so views can
+  memoize what they derive from them
 """
 
 from models.budget import Budget
+from models.budget_table import BudgetTable
+from models.category import Category
 from models.transaction import Transaction
+from app.currency_converter import CurrencyConverter
+from app.deduplicator import Deduplicator
+from app.search_index import SearchIndex
 
 class BudgetManager:
     _instance = None
@@ -29,6 +45,14 @@ class BudgetManager:
             cls._instance = super().__new__(cls)
             cls._instance.budget = Budget()
             cls._instance.transactions = []
+            cls._instance.budget_table = BudgetTable()
+            cls._instance.search_index = SearchIndex()
+            cls._instance.deduplicator = Deduplicator()
+            cls._instance.duplicates = []
+            cls._instance.store = None
+            cls._instance.saved_count = 0
+            cls._instance.converter = None
+            cls._instance.revision = 0
         return cls._instance
 
     def set_budget(self, amount):
@@ -37,9 +61,78 @@ class BudgetManager:
 
         REQUIRES: amount >= 0
         MODIFIES: self.budget
-        EFFECTS: Updates the budget limit for the session.
+        EFFECTS: Updates the budget limit for the session, keeping the amount spent so far.
         """
-        self.budget = Budget(amount)
+        spent = self.budget.total_spent
+        self.budget = Budget(amount, self.budget.currency)
+        self.budget.update_spent(spent)
+
+    def set_category_budget(self, category, period, amount, household=BudgetTable.DEFAULT_HOUSEHOLD):
+        """
+        Sets the limit for one category in one month.
+
+        REQUIRES: period is a 'YYYY-MM' string; amount >= 0
+        MODIFIES: self.budget_table
+        EFFECTS: Creates or updates the household's budget; a new budget starts from the session's
+                 spending on that household, category, and month. Other budgets are untouched.
+        """
+        self.budget_table.set_limit(category, period, amount, household)
+
+    def category_budgets_over(self):
+        """
+        Lists the category budgets that are exceeded.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_table
+        EFFECTS: Re-checks only budgets whose spending or limit changed and returns the
+                 (household, category, period) keys that are over budget.
+        """
+        return self.budget_table.over_budget()
+
+    def set_reporting_currency(self, rate_table, currency="USD"):
+        """
+        Reports all spending in one currency, converting each transaction at its date's rate.
+
+        REQUIRES: rate_table is a RateTable (e.g. from RateLoader) covering every transaction currency
+        MODIFIES: self.converter, self.budget, self.budget_table
+        EFFECTS: Converts the session once, vectorized, and recomputes total and category spending
+                 in currency; later additions are converted as they arrive. Call again after
+                 editing the rate table to re-value the budget totals. Raises KeyError, keeping the
+                 previous currency, if a transaction's currency has no rates.
+        """
+        converter = CurrencyConverter(rate_table, currency)
+        converter.append(self.transactions)  # Raises KeyError before anything is replaced
+        self.converter = converter
+        self.revision += 1
+        self.budget.currency = self.converter.reporting
+        self._update_total_spent()
+        self.budget_table.replace_spending(self.transactions, self.converted_amounts())
+
+    def spending_by_category(self):
+        """
+        Totals session spending per category.
+
+        REQUIRES: nothing
+        MODIFIES: self.converter
+        EFFECTS: Returns a dict mapping category -> total in budget.currency; with a converter the
+                 totals are memoized until transactions or rates change.
+        """
+        if self.converter is not None:
+            return self.converter.totals(self.transactions)
+        totals = {}
+        for t in self.transactions:
+            totals[t.category] = totals.get(t.category, 0.0) + t.amount
+        return totals
+
+    def converted_amounts(self):
+        """
+        Returns transaction amounts in the reporting currency.
+
+        REQUIRES: nothing
+        MODIFIES: self.converter
+        EFFECTS: Returns an array aligned with transactions, or None without a converter.
+        """
+        return None if self.converter is None else self.converter.converted(self.transactions)
 
     def add_transaction(self, transaction):
         """
@@ -47,10 +140,87 @@ class BudgetManager:
 
         REQUIRES: transaction is an instance of Transaction
         MODIFIES: self.transactions
-        EFFECTS: Appends the transaction and updates total spent.
+        EFFECTS: Appends the transaction, indexes its description, and updates total spent. With a
+                 converter, raises KeyError and changes nothing if its currency has no rates.
         """
+        amount = transaction.amount
+        if self.converter is not None:
+            amount = float(self.converter.append([transaction])[0])  # Converted first: may raise
         self.transactions.append(transaction)
+        self.revision += 1
+        self.search_index.add_transaction(transaction, len(self.transactions) - 1)
+        self.deduplicator.register(Deduplicator.transaction_fingerprint(transaction))
+        self.budget.update_spent(self.budget.total_spent + amount)
+        self.budget_table.add_spent(
+            transaction.category, BudgetTable.period_of(transaction.date), amount, transaction.household
+        )
+
+    def pop_transaction(self):
+        """
+        Removes the most recently added transaction, e.g. to undo it.
+
+        REQUIRES: self.transactions is not empty
+        MODIFIES: self.transactions, self.budget, search index, deduplicator, attached store
+        EFFECTS: Removes and returns the last transaction in time independent of the session size,
+                 deleting its stored row if it was saved.
+        """
+        transaction = self.transactions.pop()
+        self.revision += 1
+        self.saved_count = min(self.saved_count, len(self.transactions))
+        if self.store is not None and transaction.id is not None:
+            self.store.delete_transactions([transaction])
+        self.search_index.remove_transaction(len(self.transactions))
+        self.deduplicator.forget(Deduplicator.transaction_fingerprint(transaction))
+        amount = transaction.amount if self.converter is None else self.converter.pop()
+        self.budget.update_spent(self.budget.total_spent - amount)
+        self.budget_table.add_spent(
+            transaction.category, BudgetTable.period_of(transaction.date), -amount, transaction.household
+        )
+        return transaction
+
+    def add_transactions(self, transactions, categorizer=None, drop_duplicates=False):
+        """
+        Adds many transactions at once, e.g. from a bank import.
+
+        REQUIRES: transactions is an iterable of Transaction; categorizer is a Categorizer or None
+        MODIFIES: self.transactions, self.duplicates, transactions' categories
+        EFFECTS: Labels transactions whose category is not in Category.all() using the categorizer,
+                 then checks each against every transaction seen this session. Duplicates are listed
+                 in self.duplicates and, if drop_duplicates, skipped. Appends, indexes, and charges
+                 the rest to their budgets in one pass and recomputes total spent once. Returns the
+                 number added. With a converter, raises
+                 KeyError and changes nothing if any transaction's currency has no rates.
+        """
+        transactions = list(transactions)
+        if self.converter is not None:
+            self.converter.check(transactions)  # Validate before any store is touched
+        if categorizer is not None:
+            known = set(Category.all())
+            for transaction in transactions:
+                if transaction.category not in known:
+                    transaction.category = categorizer.categorize(transaction.description, transaction.amount)
+        unique, self.duplicates = self.deduplicator.partition_transactions(transactions)
+        start = len(self.transactions)
+        self.transactions.extend(unique if drop_duplicates else transactions)
+        for row in range(start, len(self.transactions)):
+            self.search_index.add_transaction(self.transactions[row], row)
+        new = self.transactions[start:]
+        self.revision += 1
+        amounts = None if self.converter is None else self.converter.append(new)
         self._update_total_spent()
+        self.budget_table.add_spending(new, amounts)
+        return len(new)
+
+    def near_duplicates(self, days=3, tolerance=0.0):
+        """
+        Finds probable duplicate charges in the session.
+
+        REQUIRES: days >= 0; tolerance >= 0
+        MODIFIES: nothing
+        EFFECTS: Returns (i, j) index pairs into self.transactions of same-category rows with matching
+                 descriptions, amounts within tolerance, and dates at most `days` apart.
+        """
+        return Deduplicator.near_duplicates(self.transactions, days, tolerance)
 
     def _update_total_spent(self):
         """
@@ -58,9 +228,12 @@ class BudgetManager:
 
         REQUIRES: nothing
         MODIFIES: self.budget
-        EFFECTS: Sums all transactions and updates budget's total spent.
+        EFFECTS: Sums all transactions (converted, with a converter) and updates budget's total spent.
         """
-        total = sum(t.amount for t in self.transactions)
+        if self.converter is not None:
+            total = float(self.converter.converted(self.transactions).sum())
+        else:
+            total = sum(t.amount for t in self.transactions)
         self.budget.update_spent(total)
 
     def reset(self):
@@ -69,7 +242,43 @@ class BudgetManager:
 
         REQUIRES: nothing
         MODIFIES: self
-        EFFECTS: Clears all transactions and resets budget to 0.
+        EFFECTS: Clears all transactions and resets budget to 0, keeping the reporting currency.
         """
-        self.budget = Budget()
+        self.budget = Budget(currency=self.budget.currency)
         self.transactions = []
+        self.revision += 1
+        self.budget_table = BudgetTable()
+        self.search_index.remove_transactions()
+        self.deduplicator.clear()
+        self.duplicates = []
+        self.saved_count = 0
+        if self.converter is not None:
+            self.converter.clear()
+
+    def attach_store(self, store):
+        """
+        Attaches an optional persistent store for transactions.
+
+        REQUIRES: store is a SqliteStore or None
+        MODIFIES: self.store
+        EFFECTS: Future calls to save_session() write new transactions to the store.
+        """
+        self.store = store
+        self.saved_count = 0
+
+    def save_session(self, budget_data=None):
+        """
+        Persists the session to the attached store, writing only new transactions.
+
+        REQUIRES: nothing
+        MODIFIES: self.store, self.saved_count
+        EFFECTS: Upserts transactions added since the last save and, if given, replaces the
+                 stored expense items of budget_data. Returns the number of transactions written.
+        """
+        if self.store is None:
+            return 0
+        written = self.store.insert_transactions(self.transactions[self.saved_count:])
+        self.saved_count = len(self.transactions)
+        if budget_data and budget_data.get("Expenses"):
+            self.store.replace_expense_items(budget_data["Expenses"])
+        return written
@@ -0,0 +1,205 @@
+# app/categorizer.py
+
+"""
+Rule-based categorization of raw import descriptions.
+
+Abstraction Function:
+- Categorizer assigns one of the Category names to a description (and optional amount) using
+  user-defined rules, checked in priority order; the first rule that matches wins.
+- A rule is a dict with a "category" and any of:
+    "keywords": list of case-insensitive substrings (any one must occur)
+    "pattern": a case-insensitive regular expression (must match)
+    "min_amount" / "max_amount": inclusive amount bounds (must hold)
+- All keywords of all rules are compiled into one trie-shaped pattern, and all regex rules into
+  one combined pattern, so each description is scanned once no matter how many rules exist.
+
+Representation Invariant:
+- rules[i] has priority i; lower indices win.
+- keyword_rules maps each lowercased keyword to the bitmask of rules that list it.
+- unconditional_mask has the bits of rules without keywords or patterns (amount-only rules).
+"""
+
+import json
+import math
+import re
+
+from models.category import Category
+
+
+class Categorizer:
+    CACHE_SIZE = 100000
+
+    def __init__(self, rules, default=Category.MISCELLANEOUS):
+        """
+        Compiles a list of rules.
+
+        REQUIRES: each rule is a dict with a "category" from Category.all() and at least one condition
+        MODIFIES: self
+        EFFECTS: Builds the combined keyword and regex matchers; raises ValueError on invalid rules.
+        """
+        self.rules = []
+        self.default = default
+        self.keyword_rules = {}
+        self.patterns = {}
+        self.unconditional_mask = 0
+
+        for index, rule in enumerate(rules):
+            if not isinstance(rule, dict):
+                raise ValueError(f"Rule {index} is not an object")
+            category = str(rule.get("category", "")).strip().upper()
+            if category not in Category.all():
+                raise ValueError(f"Rule {index} has unknown category: {rule.get('category')}")
+            keywords = [str(k).lower() for k in rule.get("keywords", []) if str(k)]
+            pattern = rule.get("pattern")
+            min_amount = rule.get("min_amount")
+            max_amount = rule.get("max_amount")
+            for name, bound in (("min_amount", min_amount), ("max_amount", max_amount)):
+                if bound is not None and not Categorizer._is_amount(bound):
+                    raise ValueError(f"Rule {index} has an invalid {name} (expected a finite number): {bound!r}")
+            if not keywords and not pattern and min_amount is None and max_amount is None:
+                raise ValueError(f"Rule {index} has no conditions")
+
+            bit = 1 << index
+            for keyword in keywords:
+                self.keyword_rules[keyword] = self.keyword_rules.get(keyword, 0) | bit
+            if pattern:
+                try:
+                    self.patterns[index] = re.compile(pattern, re.IGNORECASE)
+                except (re.error, TypeError) as e:
+                    raise ValueError(f"Rule {index} has an invalid pattern: {e}") from e
+            if not keywords and not pattern:
+                self.unconditional_mask |= bit
+            self.rules.append((category, bool(keywords), self.patterns.get(index), min_amount, max_amount))
+
+        # Overlapping matches of every keyword in one left-to-right scan
+        self.keyword_matcher = (
+            re.compile(f"(?=({self._trie_pattern(self.keyword_rules)}))") if self.keyword_rules else None
+        )
+        # Prefilter that rejects most descriptions with a single regex search
+        try:
+            self.pattern_matcher = re.compile(
+                "|".join(f"(?:{p.pattern})" for p in self.patterns.values()), re.IGNORECASE
+            )
+        except re.error:
+            self.pattern_matcher = None  # e.g. backreferences that clash once combined
+        self.cache = {}
+
+    @staticmethod
+    def _is_amount(value):
+        """
+        Tests whether a rule bound is usable as an amount.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns True for finite ints and floats (not bools), else False.
+        """
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+    @staticmethod
+    def from_json(path, default=Category.MISCELLANEOUS):
+        """
+        Loads rules from a JSON file.
+
+        REQUIRES: path is a JSON file containing a list of rule dicts
+        MODIFIES: nothing
+        EFFECTS: Returns a compiled Categorizer; raises OSError if the file cannot be read and
+                 ValueError if it is not valid JSON or not a list of valid rules.
+        """
+        with open(path, encoding="utf-8") as f:
+            rules = json.load(f)
+        if not isinstance(rules, list):
+            raise ValueError(f"{path}: rules must be a JSON list")
+        return Categorizer(rules, default)
+
+    @staticmethod
+    def _trie_pattern(keywords):
+        """
+        Builds a regex that matches any keyword, with shared prefixes factored into a trie.
+
+        REQUIRES: keywords is a non-empty collection of non-empty strings
+        MODIFIES: nothing
+        EFFECTS: Returns the pattern source; matching it at a position walks the trie once
+                 instead of trying each keyword in turn.
+        """
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        def emit(node):
+            branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+            optional = "" in node
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 and len(branches[0]) <= 2 else f"(?:{'|'.join(branches)})"
+            return f"(?:{body})?" if optional else body
+
+        return emit(trie)
+
+    def _text_masks(self, text):
+        """
+        Finds which rules' keywords and patterns occur in a description.
+
+        REQUIRES: text is a string
+        MODIFIES: self.cache
+        EFFECTS: Returns (keyword_mask, pattern_mask) bitmasks of rules; memoized per distinct description.
+        """
+        masks = self.cache.get(text)
+        if masks is not None:
+            return masks
+        keyword_mask = 0
+        if self.keyword_matcher is not None:
+            for match in self.keyword_matcher.finditer(text.lower()):
+                found = match.group(1)
+                # The trie matches the longest keyword at this position; shorter keywords may end inside it
+                for end in range(len(found), 0, -1):
+                    keyword_mask |= self.keyword_rules.get(found[:end], 0)
+        pattern_mask = 0
+        if self.patterns and (self.pattern_matcher is None or self.pattern_matcher.search(text)):
+            for index, pattern in self.patterns.items():
+                if pattern.search(text):
+                    pattern_mask |= 1 << index
+        if len(self.cache) >= self.CACHE_SIZE:
+            self.cache.clear()
+        masks = self.cache[text] = (keyword_mask, pattern_mask)
+        return masks
+
+    def categorize(self, description, amount=None):
+        """
+        Picks the category for one description.
+
+        REQUIRES: description is a string; amount is a number or None
+        MODIFIES: self.cache
+        EFFECTS: Returns the category of the highest-priority rule whose conditions all hold,
+                 or the default category when none does.
+        """
+        keyword_mask, pattern_mask = self._text_masks(str(description))
+        mask = keyword_mask | pattern_mask | self.unconditional_mask
+        while mask:
+            lowest = mask & -mask
+            mask ^= lowest
+            category, has_keywords, pattern, min_amount, max_amount = self.rules[lowest.bit_length() - 1]
+            if has_keywords and not keyword_mask & lowest:
+                continue
+            if pattern is not None and not pattern_mask & lowest:
+                continue
+            if min_amount is not None and (amount is None or amount < min_amount):
+                continue
+            if max_amount is not None and (amount is None or amount > max_amount):
+                continue
+            return category
+        return self.default
+
+    def categorize_all(self, descriptions, amounts=None):
+        """
+        Categorizes many rows in one pass.
+
+        REQUIRES: descriptions is an iterable of strings; amounts is None or a parallel iterable
+        MODIFIES: self.cache
+        EFFECTS: Returns the list of categories, one per description.
+        """
+        if amounts is None:
+            return [self.categorize(description) for description in descriptions]
+        return [self.categorize(description, amount) for description, amount in zip(descriptions, amounts)]
@@ -0,0 +1,140 @@
+# app/chart_rasterizer.py
+
+"""
+Renders charts off the GUI thread into RGBA buffers and caches the results.
+
+Abstraction Function:
+- ChartRasterizer draws a ChartRenderer's output with the Agg backend on a worker thread
+  and returns the raw pixels, which the UI can blit without touching matplotlib.
+- Rasters are kept in an LRU cache keyed by a hash of the series, the renderer type and the
+  pixel size, so redisplaying an unchanged chart costs no drawing at all.
+
+Representation Invariant:
+- cache holds at most cache_size rasters, least recently used evicted first.
+- pending holds the Future of every render currently in flight, keyed like the cache.
+- Never imports PyQt6.
+"""
+
+import hashlib
+import struct
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+ChartRaster = namedtuple("ChartRaster", ["width", "height", "rgba"])
+
+
+class ChartRasterizer:
+    def __init__(self, cache_size=32):
+        """
+        Creates a rasterizer with an empty cache and a single render thread.
+
+        REQUIRES: cache_size > 0
+        MODIFIES: self
+        EFFECTS: Rendering is serialized on one worker because matplotlib is not thread-safe
+                 across concurrent draws.
+        """
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-render")
+
+    @staticmethod
+    def cache_key(renderer, series, width, height, dpi=100):
+        """
+        Builds the cache key for one chart.
+
+        REQUIRES: series is a NumPy array, a sequence of numbers, or a short sequence of
+                  (date, amount) pairs; width, height, dpi > 0
+        MODIFIES: nothing
+        EFFECTS: Returns a tuple of the renderer type and settings, the pixel size, and a digest of the series.
+        """
+        if isinstance(series, np.ndarray):
+            # Long time series arrive as arrays, hashed straight from their buffer
+            payload = str(series.dtype).encode("ascii") + np.ascontiguousarray(series).tobytes()
+        else:
+            try:
+                values = [float(value) for value in series]
+                payload = struct.pack(f"{len(values)}d", *values)
+            except TypeError:
+                payload = repr(list(series)).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        # Renderer settings (e.g. the downsampling method) change the picture too
+        settings = repr(sorted(vars(renderer).items()))
+        return type(renderer).__name__, settings, int(width), int(height), int(dpi), digest
+
+    @staticmethod
+    def rasterize(renderer, series, width, height, dpi=100):
+        """
+        Draws a chart into an RGBA buffer with the Agg backend.
+
+        REQUIRES: renderer is a ChartRenderer; width, height, dpi > 0
+        MODIFIES: nothing
+        EFFECTS: Returns a ChartRaster holding the rendered pixels.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        canvas = FigureCanvasAgg(figure)
+        renderer.render(figure.add_subplot(111), series)
+        canvas.draw()
+        w, h = canvas.get_width_height()
+        return ChartRaster(w, h, bytes(canvas.buffer_rgba()))
+
+    def submit(self, renderer, series, width, height, dpi=100):
+        """
+        Requests a raster, reusing a cached or in-flight one when possible.
+
+        REQUIRES: renderer is a ChartRenderer; width, height, dpi > 0
+        MODIFIES: self.cache, self.pending
+        EFFECTS: Returns (key, Future). The Future is already completed on a cache hit;
+                 otherwise it completes with a ChartRaster once the worker has drawn it.
+        """
+        key = self.cache_key(renderer, series, width, height, dpi)
+        with self.lock:
+            raster = self.cache.get(key)
+            if raster is not None:
+                self.cache.move_to_end(key)
+                future = Future()
+                future.set_result(raster)
+                return key, future
+            future = self.pending.get(key)
+            if future is None:
+                # Copy so later changes by the caller cannot alter what the worker draws
+                snapshot = series.copy() if isinstance(series, np.ndarray) else list(series)
+                future = self.executor.submit(self._render, key, renderer, snapshot, width, height, dpi)
+                self.pending[key] = future
+            return key, future
+
+    def _render(self, key, renderer, series, width, height, dpi):
+        """
+        Worker-thread body of submit().
+
+        REQUIRES: called on the render thread
+        MODIFIES: self.cache, self.pending
+        EFFECTS: Rasterizes the chart, stores it in the cache, and returns it.
+        """
+        try:
+            raster = self.rasterize(renderer, series, width, height, dpi)
+            with self.lock:
+                self.cache[key] = raster
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+            return raster
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+
+    def shutdown(self):
+        """
+        Stops the render thread.
+
+        REQUIRES: nothing
+        MODIFIES: self.executor
+        EFFECTS: Cancels queued renders and waits for the current one to finish.
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
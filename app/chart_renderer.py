@@ -41,3 +41,43 @@ class LineChartRenderer(ChartRenderer):
         ax.set_xlabel("Days of the Week")
         ax.set_ylabel("Cost ($)")
         ax.grid(True)
+
+
+class DailySpendingChartRenderer(ChartRenderer):
+    def __init__(self, method="lttb"):
+        """
+        Constructs a renderer for long daily spending histories.
+
+        REQUIRES: method is "lttb" or "minmax"
+        MODIFIES: self
+        EFFECTS: Chooses the downsampling method applied before plotting.
+        """
+        self.method = method
+
+    def render(self, ax, data):
+        """
+        Renders a daily spending series, downsampled to the axes' pixel width.
+
+        REQUIRES: ax is a matplotlib AxesSubplot; data is a ReportBuilder.daily_totals array or a
+                  list of ('YYYY-MM-DD', amount) pairs, sorted by date
+        MODIFIES: ax
+        EFFECTS: Plots about one point per pixel, so draw time is independent of history length.
+                 Charts are static rasters: a different size or range is a new render, which
+                 samples again for that width.
+        """
+        import numpy as np
+        from app.downsampler import Downsampler
+
+        if isinstance(data, np.ndarray):
+            dates, y = data["date"], data["amount"].astype(float)
+        else:
+            dates = np.array([date for date, _ in data], dtype="datetime64[D]")
+            y = np.array([amount for _, amount in data], dtype=float)
+        x = dates.astype(np.int64).astype(float)
+
+        sx, sy = Downsampler.reduce(x, y, ax.bbox.width or 1000, self.method)
+        ax.plot(sx.astype("datetime64[D]"), sy, linestyle="-", color="red", linewidth=1)
+        ax.set_title("Daily Spending")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Cost ($)")
+        ax.grid(True)
@@ -0,0 +1,179 @@
+# app/currency_converter.py
+
+"""
+Converts transaction amounts to a reporting currency, column at a time.
+
+Abstraction Function:
+- CurrencyConverter values each transaction at the rate of its currency on its date, expressed
+  in the reporting currency (via the rate table's base when they differ).
+- The converter mirrors a transaction list as columns: raw amounts, day numbers, currency codes,
+  category codes, and converted amounts. append() converts just the new rows and pop() drops
+  rows from the end, so each edit costs time proportional to the rows it touches. When the
+  rate table changes (its version moves), every row is re-valued from the cached columns with
+  one searchsorted per currency. totals() is memoized until either changes.
+
+Representation Invariant:
+- The first count entries of raw, days, currency_codes, and category_codes describe the mirrored
+  rows, and amounts[:count] are their converted amounts at rate table version version.
+- currencies and categories map names to the codes used in those columns.
+- totals_cache is None or the per-category totals of the first count rows.
+"""
+
+import numpy as np
+
+from models.rate_table import RateTable
+
+
+class CurrencyConverter:
+    COLUMNS = ("raw", "days", "currency_codes", "category_codes", "amounts")
+
+    def __init__(self, rate_table, reporting="USD"):
+        """
+        Creates a converter.
+
+        REQUIRES: rate_table is a RateTable with rates for every currency to convert
+        MODIFIES: self
+        EFFECTS: Converts into the reporting currency; nothing is cached yet.
+        """
+        self.rate_table = rate_table
+        self.reporting = reporting.upper()
+        self.clear()
+
+    def clear(self):
+        """
+        Forgets all converted rows.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Empties the mirror at the rate table's current version.
+        """
+        self.count = 0
+        self.version = self.rate_table.version
+        self.raw = np.empty(64)
+        self.days = np.empty(64, dtype=np.int64)
+        self.currency_codes = np.empty(64, dtype=np.int64)
+        self.category_codes = np.empty(64, dtype=np.int64)
+        self.amounts = np.empty(64)
+        self.currencies = {}
+        self.categories = {}
+        self.totals_cache = None
+
+    def rates(self, currency_codes, days):
+        """
+        Computes conversion factors into the reporting currency.
+
+        REQUIRES: currency_codes index self.currencies; days are day numbers of the same length
+        MODIFIES: self.rate_table (merges pending rates)
+        EFFECTS: Returns a float array of reporting-currency values per unit; raises KeyError for a
+                 currency without rates.
+        """
+        result = np.ones(len(days))
+        for currency, code in self.currencies.items():
+            if currency == self.reporting:
+                continue
+            rows = np.flatnonzero(currency_codes == code)
+            if len(rows):
+                result[rows] = self.rate_table.rates_for(currency, days[rows])
+                if self.reporting != self.rate_table.base:
+                    result[rows] /= self.rate_table.rates_for(self.reporting, days[rows])
+        return result
+
+    def check(self, transactions):
+        """
+        Verifies that transactions can be converted, without converting them.
+
+        REQUIRES: transactions is an iterable of Transaction
+        MODIFIES: self.rate_table (merges pending rates)
+        EFFECTS: Raises KeyError naming the first currency without rates; otherwise does nothing.
+        """
+        currencies = {t.currency.upper() for t in transactions} - {self.reporting}
+        empty = np.empty(0, dtype=np.int64)
+        for currency in sorted(currencies):
+            self.rate_table.rates_for(currency, empty)
+        if currencies and self.reporting != self.rate_table.base:
+            self.rate_table.rates_for(self.reporting, empty)
+
+    def append(self, transactions):
+        """
+        Converts rows appended to the mirrored list.
+
+        REQUIRES: transactions is a list of Transaction
+        MODIFIES: self
+        EFFECTS: Converts the rows in one vectorized call, stores them after the existing rows
+                 (growing the columns geometrically), and returns their converted amounts. Raises
+                 KeyError, leaving the mirror unchanged, if a currency has no rates.
+        """
+        self.check(transactions)
+        n = len(transactions)
+        raw = np.fromiter((t.amount for t in transactions), dtype=float, count=n)
+        days = RateTable.day_numbers([t.date for t in transactions]).reshape(-1)
+        currency_codes = np.fromiter(
+            (self.currencies.setdefault(t.currency, len(self.currencies)) for t in transactions),
+            dtype=np.int64, count=n
+        )
+        category_codes = np.fromiter(
+            (self.categories.setdefault(t.category, len(self.categories)) for t in transactions),
+            dtype=np.int64, count=n
+        )
+        amounts = raw * self.rates(currency_codes, days)
+
+        end = self.count + n
+        if end > len(self.amounts):
+            size = max(end, 2 * len(self.amounts))
+            for name in self.COLUMNS:
+                old = getattr(self, name)
+                new = np.empty(size, dtype=old.dtype)
+                new[:self.count] = old[:self.count]
+                setattr(self, name, new)
+        for name, values in zip(self.COLUMNS, (raw, days, currency_codes, category_codes, amounts)):
+            getattr(self, name)[self.count:end] = values
+        self.count = end
+        self.totals_cache = None
+        return amounts
+
+    def pop(self):
+        """
+        Drops the last mirrored row.
+
+        REQUIRES: count > 0
+        MODIFIES: self
+        EFFECTS: Returns the dropped row's converted amount.
+        """
+        self.count -= 1
+        self.totals_cache = None
+        return float(self.amounts[self.count])
+
+    def converted(self, transactions):
+        """
+        Returns every transaction's amount in the reporting currency.
+
+        REQUIRES: transactions is the mirrored list
+        MODIFIES: self
+        EFFECTS: Returns a float array aligned with transactions. Rows are re-valued from the
+                 cached columns if the rates changed, and rebuilt from transactions only if the
+                 mirror fell out of step with the list.
+        """
+        if self.count != len(transactions):
+            self.clear()
+            self.append(transactions)
+        elif self.version != self.rate_table.version:
+            n = self.count
+            self.amounts[:n] = self.raw[:n] * self.rates(self.currency_codes[:n], self.days[:n])
+            self.version = self.rate_table.version
+            self.totals_cache = None
+        return self.amounts[:self.count]
+
+    def totals(self, transactions):
+        """
+        Sums converted amounts per category.
+
+        REQUIRES: transactions is the mirrored list
+        MODIFIES: self
+        EFFECTS: Returns a dict mapping category -> total in the reporting currency, memoized until
+                 the transactions or rates change.
+        """
+        amounts = self.converted(transactions)
+        if self.totals_cache is None:
+            sums = np.bincount(self.category_codes[:self.count], weights=amounts, minlength=len(self.categories))
+            self.totals_cache = {category: float(sums[code]) for category, code in self.categories.items()}
+        return dict(self.totals_cache)
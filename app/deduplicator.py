@@ -0,0 +1,296 @@
+# app/deduplicator.py
+
+"""
+Detects duplicate rows when overlapping statements or expense sheets are merged.
+
+Abstraction Function:
+- Deduplicator fingerprints each row by its normalized (date, amount, category, description)
+  and remembers the fingerprints seen this session, so exact duplicates are found in linear time.
+- Seen fingerprints live in a set, or in a BloomFilter when memory matters more than the
+  (tunable) chance of flagging a unique row as a duplicate.
+- near_duplicates() finds rows that are probably the same charge posted slightly differently.
+  Rows are bucketed by category (and description) and by date window, and each bucket is
+  sorted by amount, so a row is compared only with rows of similar amount in its own or the
+  next date window.
+
+Representation Invariant:
+- Amounts are compared in whole cents; descriptions lowercased with whitespace collapsed.
+- seen holds the fingerprint of every row registered since the last clear().
+"""
+
+import hashlib
+import math
+from bisect import bisect_left, bisect_right
+from datetime import date as Date
+
+
+class BloomFilter:
+    def __init__(self, capacity=1000000, error_rate=0.001):
+        """
+        Creates an empty Bloom filter sized for the expected number of items.
+
+        REQUIRES: capacity > 0; 0 < error_rate < 1
+        MODIFIES: self
+        EFFECTS: Allocates the bit array and picks the number of hash functions.
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint):
+        """
+        Derives the bit positions of a fingerprint by double hashing.
+
+        REQUIRES: fingerprint is a non-negative int of at least 64 bits of entropy
+        MODIFIES: nothing
+        EFFECTS: Yields self.hashes bit positions.
+        """
+        h1 = fingerprint & 0xFFFFFFFF
+        h2 = (fingerprint >> 32) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, fingerprint):
+        """
+        Adds a fingerprint.
+
+        REQUIRES: fingerprint is an int from Deduplicator.fingerprint
+        MODIFIES: self.bits
+        EFFECTS: Sets the fingerprint's bits.
+        """
+        for position in self._positions(fingerprint):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, fingerprint):
+        """
+        Tests membership.
+
+        REQUIRES: fingerprint is an int from Deduplicator.fingerprint
+        MODIFIES: nothing
+        EFFECTS: Returns False if definitely unseen, True if probably seen.
+        """
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(fingerprint))
+
+
+class Deduplicator:
+    def __init__(self, use_bloom=False, capacity=1000000, error_rate=0.001):
+        """
+        Creates a deduplicator with no rows seen.
+
+        REQUIRES: capacity > 0; 0 < error_rate < 1
+        MODIFIES: self
+        EFFECTS: Uses an exact set, or a Bloom filter when use_bloom is True.
+        """
+        self.use_bloom = use_bloom
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.clear()
+
+    def clear(self):
+        """
+        Forgets every row seen.
+
+        REQUIRES: nothing
+        MODIFIES: self.seen
+        EFFECTS: Starts a fresh session.
+        """
+        self.seen = BloomFilter(self.capacity, self.error_rate) if self.use_bloom else set()
+
+    @staticmethod
+    def cents(amount):
+        """
+        Normalizes an amount to whole cents.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns round(amount * 100) as an int, or 0 for missing/NaN values.
+        """
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            return 0
+        return round(amount * 100) if amount == amount else 0
+
+    @staticmethod
+    def normalize_text(text):
+        """
+        Normalizes a description or item name for comparison.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns the text lowercased with runs of whitespace collapsed.
+        """
+        return " ".join(str(text or "").lower().split())
+
+    @staticmethod
+    def fingerprint(date, amount, category, description):
+        """
+        Hashes a row's normalized identity.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns a 64-bit int that is equal for rows that differ only in formatting.
+        """
+        return Deduplicator._digest(
+            str(date or "").strip(),
+            str(Deduplicator.cents(amount)),
+            str(category or "").strip().upper(),
+            Deduplicator.normalize_text(description)
+        )
+
+    @staticmethod
+    def item_fingerprint(category, item):
+        """
+        Hashes an expense-sheet row, which has no date.
+
+        REQUIRES: item is a dict with "Item", "Projected Cost", "Actual Cost"
+        MODIFIES: nothing
+        EFFECTS: Returns a 64-bit int identifying the row within its category.
+        """
+        return Deduplicator._digest(
+            str(category or "").strip().upper(),
+            Deduplicator.normalize_text(item.get("Item")),
+            str(Deduplicator.cents(item.get("Projected Cost"))),
+            str(Deduplicator.cents(item.get("Actual Cost")))
+        )
+
+    @staticmethod
+    def _digest(*parts):
+        """
+        Hashes normalized key parts.
+
+        REQUIRES: parts are strings
+        MODIFIES: nothing
+        EFFECTS: Returns the first 64 bits of their BLAKE2b digest as an int.
+        """
+        key = "\x1f".join(parts).encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+    @staticmethod
+    def transaction_fingerprint(transaction):
+        """
+        Fingerprints a Transaction.
+
+        REQUIRES: transaction is a Transaction
+        MODIFIES: nothing
+        EFFECTS: Returns its fingerprint.
+        """
+        return Deduplicator.fingerprint(
+            transaction.date, transaction.amount, transaction.category, transaction.description
+        )
+
+    def register(self, fingerprint):
+        """
+        Records a fingerprint and reports whether it was already seen.
+
+        REQUIRES: fingerprint is an int from fingerprint()
+        MODIFIES: self.seen
+        EFFECTS: Returns True if the row is a (probable, with a Bloom filter) duplicate.
+        """
+        if fingerprint in self.seen:
+            return True
+        self.seen.add(fingerprint)
+        return False
+
+    def forget(self, fingerprint):
+        """
+        Removes a fingerprint, e.g. when its row is undone.
+
+        REQUIRES: fingerprint is an int from fingerprint()
+        MODIFIES: self.seen
+        EFFECTS: Discards it from an exact set; a Bloom filter cannot forget, so it is left as is.
+        """
+        if not self.use_bloom:
+            self.seen.discard(fingerprint)
+
+    def partition_transactions(self, transactions):
+        """
+        Splits transactions into new rows and duplicates in one pass.
+
+        REQUIRES: transactions is an iterable of Transaction
+        MODIFIES: self.seen
+        EFFECTS: Returns (unique, duplicates); repeats within the batch count as duplicates too.
+        """
+        unique, duplicates = [], []
+        for transaction in transactions:
+            if self.register(self.transaction_fingerprint(transaction)):
+                duplicates.append(transaction)
+            else:
+                unique.append(transaction)
+        return unique, duplicates
+
+    def merge_expenses(self, base, incoming):
+        """
+        Merges expense sheets, dropping rows already present.
+
+        REQUIRES: base and incoming map category -> list of item dicts
+        MODIFIES: self.seen
+        EFFECTS: Returns (merged, duplicates): merged is a new dict holding base's rows followed by
+                 incoming's new rows; duplicates lists (category, item) for each dropped row.
+                 Repeats within base are kept, but an incoming row is dropped if it matches any
+                 row seen before it, including an earlier identical row of the same incoming
+                 sheet. Categories that gain rows become lists of item dicts; the others keep
+                 base's row container.
+        """
+        merged = dict(base)
+        duplicates = []
+        for category, items in base.items():
+            for item in items:
+                self.register(self.item_fingerprint(category, item))
+        for category, items in incoming.items():
+            added = []
+            for item in items:
+                if self.register(self.item_fingerprint(category, item)):
+                    duplicates.append((category, item))
+                else:
+                    added.append(dict(item))
+            if added:
+                merged[category] = [dict(item) for item in merged.get(category, [])] + added
+            else:
+                merged.setdefault(category, [])
+        return merged, duplicates
+
+    @staticmethod
+    def near_duplicates(transactions, days=3, tolerance=0.0, match_description=True):
+        """
+        Finds pairs of transactions that are probably the same charge.
+
+        REQUIRES: transactions is a list of Transaction; days >= 0; tolerance >= 0 (in currency units)
+        MODIFIES: nothing
+        EFFECTS: Returns (i, j) index pairs, i < j, of transactions in the same category whose amounts
+                 differ by at most tolerance and whose dates are at most `days` apart, and (if
+                 match_description) whose normalized descriptions are equal. Rows are grouped into
+                 windows of days + 1 dates, so a match lies in the same or the next window, and each
+                 window is sorted by amount; a row is compared only with the rows inside both bounds.
+        """
+        width = days + 1
+        buckets = {}
+        for index, transaction in enumerate(transactions):
+            try:
+                ordinal = Date.fromisoformat(str(transaction.date)).toordinal()
+            except ValueError:
+                continue
+            description = Deduplicator.normalize_text(transaction.description) if match_description else None
+            key = (transaction.category, description, ordinal // width)
+            buckets.setdefault(key, []).append((Deduplicator.cents(transaction.amount), ordinal, index))
+        for entries in buckets.values():
+            entries.sort()
+        amounts = {key: [entry[0] for entry in entries] for key, entries in buckets.items()}
+        window = Deduplicator.cents(tolerance)
+
+        pairs = []
+        for key, entries in buckets.items():
+            category, description, bucket = key
+            following = (category, description, bucket + 1)
+            for position, (amount, ordinal, index) in enumerate(entries):
+                # Same window: later rows of higher or equal amount; the rest pair up from their side
+                candidates = entries[position + 1:bisect_right(amounts[key], amount + window, lo=position + 1)]
+                if following in buckets:
+                    others = amounts[following]
+                    candidates += buckets[following][
+                        bisect_left(others, amount - window):bisect_right(others, amount + window)
+                    ]
+                for _, other_ordinal, other_index in candidates:
+                    if abs(other_ordinal - ordinal) <= days:
+                        pairs.append((min(index, other_index), max(index, other_index)))
+        return sorted(pairs)
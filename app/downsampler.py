@@ -0,0 +1,114 @@
+# app/downsampler.py
+
+"""
+Reduces long time series to roughly one point per pixel before plotting.
+
+Abstraction Function:
+- Downsampler picks a visually representative subset of (x, y) points so draw time depends on
+  the canvas width rather than the length of the spending history.
+- lttb keeps the overall shape (Largest-Triangle-Three-Buckets); min_max keeps every bucket's
+  lowest and highest point, so no spike is ever dropped.
+
+Representation Invariant:
+- x is sorted ascending; returned points are a subset of the input in ascending x order.
+- The first and last input points are always kept.
+"""
+
+import numpy as np
+
+
+class Downsampler:
+    @staticmethod
+    def lttb(x, y, threshold):
+        """
+        Downsamples with the Largest-Triangle-Three-Buckets algorithm.
+
+        REQUIRES: x and y are equal-length 1-D arrays, x sorted ascending; threshold >= 3
+        MODIFIES: nothing
+        EFFECTS: Returns (x, y) arrays with at most threshold points.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x)
+        if threshold >= n or threshold < 3:
+            return x, y
+
+        # Bucket edges for the n - 2 interior points, split into threshold - 2 buckets
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+        selected = np.empty(threshold, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = n - 1
+        previous = 0
+        for i in range(threshold - 2):
+            start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+            if i + 2 < len(edges):
+                next_x = x[edges[i + 1]:edges[i + 2]].mean()
+                next_y = y[edges[i + 1]:edges[i + 2]].mean()
+            else:
+                next_x, next_y = x[-1], y[-1]
+            # Twice the triangle area between the previous pick, each candidate, and the next bucket's mean
+            area = np.abs(
+                (x[previous] - next_x) * (y[start:end] - y[previous])
+                - (x[previous] - x[start:end]) * (next_y - y[previous])
+            )
+            previous = start + int(np.argmax(area))
+            selected[i + 1] = previous
+        return x[selected], y[selected]
+
+    @staticmethod
+    def min_max(x, y, buckets):
+        """
+        Downsamples by keeping the minimum and maximum point of each x bucket.
+
+        REQUIRES: x and y are equal-length 1-D arrays, x sorted ascending; buckets > 0
+        MODIFIES: nothing
+        EFFECTS: Returns (x, y) arrays with at most 2 * buckets + 2 points, preserving every peak.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x)
+        if n <= 2 * buckets + 2 or buckets <= 0:
+            return x, y
+
+        span = x[-1] - x[0]
+        if span <= 0:
+            bucket = np.arange(n) * buckets // n
+        else:
+            bucket = np.minimum(((x - x[0]) / span * buckets).astype(np.int64), buckets - 1)
+
+        # x is sorted, so each bucket is a contiguous run of points
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        counts = np.diff(np.r_[starts, n])
+        lows = Downsampler._first_match(y == np.repeat(np.minimum.reduceat(y, starts), counts), bucket)
+        highs = Downsampler._first_match(y == np.repeat(np.maximum.reduceat(y, starts), counts), bucket)
+        keep = np.unique(np.concatenate(([0, n - 1], lows, highs)))
+        return x[keep], y[keep]
+
+    @staticmethod
+    def _first_match(mask, bucket):
+        """
+        Finds the first True position of mask within each bucket.
+
+        REQUIRES: mask and bucket are equal-length arrays; bucket is non-decreasing
+        MODIFIES: nothing
+        EFFECTS: Returns one index per bucket that has a True entry.
+        """
+        positions = np.flatnonzero(mask)
+        _, first = np.unique(bucket[positions], return_index=True)
+        return positions[first]
+
+    @staticmethod
+    def reduce(x, y, width, method="lttb"):
+        """
+        Downsamples a series to about one point per pixel.
+
+        REQUIRES: method is "lttb" or "minmax"; width > 0
+        MODIFIES: nothing
+        EFFECTS: Returns the reduced (x, y) arrays.
+        """
+        width = max(int(width), 3)
+        if method == "minmax":
+            return Downsampler.min_max(x, y, width // 2)
+        if method == "lttb":
+            return Downsampler.lttb(x, y, width)
+        raise ValueError(f"Unknown downsampling method: {method}")
@@ -0,0 +1,186 @@
+# app/forecaster.py
+
+"""
+Projects month-end balances from historical spending, deterministically and by Monte Carlo.
+
+Abstraction Function:
+- A Forecaster models each month as income minus the spending of every category, where
+  category c spends Normal(means[c], stds[c]) (never below zero) and income is
+  Normal(income, income_std). The balance after month m is start_balance plus the net of
+  months 1..m.
+- project() returns the expected path; simulate() draws many paths as NumPy arrays of shape
+  (paths, months, categories) in fixed-size batches, optionally across a process pool, and
+  returns per-month percentiles of the balance.
+
+Representation Invariant:
+- len(categories) == len(means) == len(stds); stds >= 0 and income_std >= 0.
+- Each batch draws from its own child of SeedSequence(seed), so a seeded simulation gives the
+  same result whatever the batch placement or number of workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from app.report_builder import ReportBuilder
+from models.budget_table import BudgetTable
+
+
+def _simulate_batch(args):
+    """
+    Simulates one batch of balance paths.
+
+    REQUIRES: args is (seed, paths, months, means, stds, income, income_std, start_balance)
+              with seed a SeedSequence
+    MODIFIES: nothing
+    EFFECTS: Returns a (paths, months) float array of month-end balances.
+    """
+    seed, paths, months, means, stds, income, income_std, start_balance = args
+    rng = np.random.default_rng(seed)
+    # Categories with no spread add the same amount every month; only the rest are sampled
+    random = stds > 0
+    spending = np.full((paths, months), means[~random].sum())
+    if random.any():
+        draws = rng.standard_normal((paths, months, int(random.sum())))
+        draws *= stds[random]
+        draws += means[random]
+        np.maximum(draws, 0.0, out=draws)
+        spending += draws.sum(axis=2)
+    net = np.full((paths, months), float(income))
+    if income_std > 0:
+        net += rng.standard_normal((paths, months)) * income_std
+    net -= spending
+    np.cumsum(net, axis=1, out=net)
+    net += start_balance
+    return net
+
+
+class Forecaster:
+    PERCENTILES = (5, 25, 50, 75, 95)
+    BATCH_SIZE = 20000
+
+    def __init__(self, categories, means, stds, income=0.0, income_std=0.0, start_balance=0.0):
+        """
+        Constructs a forecaster from per-category monthly spending statistics.
+
+        REQUIRES: means and stds have one entry per category; stds >= 0; income_std >= 0
+        MODIFIES: self
+        EFFECTS: Stores the model.
+        """
+        self.categories = list(categories)
+        self.means = np.asarray(means, dtype=float)
+        self.stds = np.maximum(np.asarray(stds, dtype=float), 0.0)
+        self.income = float(income)
+        self.income_std = max(0.0, float(income_std))
+        self.start_balance = float(start_balance)
+
+    @staticmethod
+    def monthly_history(transactions):
+        """
+        Totals transactions per month and category.
+
+        REQUIRES: transactions is an iterable of Transaction
+        MODIFIES: nothing
+        EFFECTS: Returns (periods, categories, totals) where totals[i, j] is the spending of
+                 categories[j] in month periods[i]; both label lists are sorted.
+        """
+        rows = [(BudgetTable.period_of(t.date), t.category, t.amount) for t in transactions]
+        periods = sorted({row[0] for row in rows})
+        categories = sorted({row[1] for row in rows})
+        period_index = {p: i for i, p in enumerate(periods)}
+        category_index = {c: j for j, c in enumerate(categories)}
+        totals = np.zeros((len(periods), len(categories)))
+        if rows:
+            i = np.fromiter((period_index[row[0]] for row in rows), dtype=np.int64, count=len(rows))
+            j = np.fromiter((category_index[row[1]] for row in rows), dtype=np.int64, count=len(rows))
+            np.add.at(totals, (i, j), np.fromiter((row[2] for row in rows), dtype=float, count=len(rows)))
+        return periods, categories, totals
+
+    @staticmethod
+    def from_history(categories, totals, income=0.0, income_std=0.0, start_balance=0.0):
+        """
+        Fits the model to monthly spending history.
+
+        REQUIRES: totals is a (months, len(categories)) array with at least one month
+        MODIFIES: nothing
+        EFFECTS: Returns a Forecaster using each category's mean and sample standard deviation
+                 (zero with a single month).
+        """
+        totals = np.asarray(totals, dtype=float)
+        stds = totals.std(axis=0, ddof=1) if len(totals) > 1 else np.zeros(totals.shape[1])
+        return Forecaster(categories, totals.mean(axis=0), stds, income, income_std, start_balance)
+
+    @staticmethod
+    def from_budget_data(budget_data, transactions=()):
+        """
+        Fits the model to a loaded budget, preferring transaction history when there is enough.
+
+        REQUIRES: budget_data has Income, Balance, and Expenses; transactions are Transactions
+        MODIFIES: nothing
+        EFFECTS: Uses the Actual Monthly Income and Actual Balance as income and starting balance,
+                 with the projected/actual income gap as income spread. With two or more months of
+                 transactions, categories follow that history; otherwise each category's sheet
+                 actual total is its mean and its projected/actual gap its spread.
+        """
+        income = budget_data.get("Income", {})
+        actual_income = ReportBuilder.cost(income.get("Actual Monthly Income"))
+        income_std = abs(actual_income - ReportBuilder.cost(income.get("Projected Monthly Income")))
+        start_balance = ReportBuilder.cost(budget_data.get("Balance", {}).get("Actual Balance"))
+
+        periods, categories, totals = Forecaster.monthly_history(transactions)
+        if len(periods) > 1:
+            return Forecaster.from_history(categories, totals, actual_income, income_std, start_balance)
+
+        expenses = budget_data.get("Expenses", {})
+        actual = ReportBuilder.category_totals(expenses)
+        projected = ReportBuilder.category_totals(expenses, "Projected Cost")
+        categories = list(actual)
+        return Forecaster(
+            categories,
+            [actual[c] for c in categories],
+            [abs(actual[c] - projected[c]) for c in categories],
+            actual_income, income_std, start_balance
+        )
+
+    def project(self, months=12):
+        """
+        Computes the expected balance path.
+
+        REQUIRES: months > 0
+        MODIFIES: nothing
+        EFFECTS: Returns an array of the month-end balances if every month matches the means.
+        """
+        net = self.income - self.means.sum()
+        return self.start_balance + net * np.arange(1, months + 1)
+
+    def simulate(self, paths=100000, months=12, percentiles=PERCENTILES, seed=None, workers=None):
+        """
+        Runs a Monte Carlo simulation of month-end balances.
+
+        REQUIRES: paths > 0; months > 0; percentiles are in [0, 100]; workers is None or >= 1
+        MODIFIES: nothing
+        EFFECTS: Returns a dict with "percentiles" (percentile -> list of month-end balances),
+                 "mean" (list per month), and "probability_negative" (share of paths below zero
+                 per month). Batches run in a process pool when workers > 1, capped at the CPU
+                 count; with one CPU they run in this process, since a pool only adds start-up cost.
+        """
+        sizes = [min(self.BATCH_SIZE, paths - start) for start in range(0, paths, self.BATCH_SIZE)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        jobs = [
+            (s, size, months, self.means, self.stds, self.income, self.income_std, self.start_balance)
+            for s, size in zip(seeds, sizes)
+        ]
+        workers = min(workers or 1, os.cpu_count() or 1)
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                balances = np.concatenate(list(executor.map(_simulate_batch, jobs)))
+        else:
+            balances = np.concatenate([_simulate_batch(job) for job in jobs])
+
+        values = np.percentile(balances, percentiles, axis=0)
+        return {
+            "percentiles": {p: row.tolist() for p, row in zip(percentiles, values)},
+            "mean": balances.mean(axis=0).tolist(),
+            "probability_negative": (balances < 0).mean(axis=0).tolist()
+        }
@@ -0,0 +1,115 @@
+# app/report_builder.py
+
+"""
+Builds budget summaries from parsed budget data without any UI dependencies.
+
+Abstraction Function:
+- ReportBuilder turns the Income/Balance/Expenses dictionary produced by the loaders
+  into category totals, chart series, and a JSON-serializable summary.
+- daily_totals turns transactions into a per-day spending series for time-series charts.
+
+Representation Invariant:
+- Missing or NaN costs count as 0.0 in every total.
+- This module never imports PyQt6 or matplotlib.
+"""
+
+import numpy as np
+
+from models.budget import Budget
+from models.expense_columns import ExpenseColumns
+
+
+class ReportBuilder:
+    DAILY_DTYPE = np.dtype([("date", "datetime64[D]"), ("amount", float)])
+
+    @staticmethod
+    def cost(value):
+        """
+        Normalizes a cost cell to a float.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns float(value), or 0.0 for None, NaN, and non-numeric values.
+        """
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return 0.0
+        return value if value == value else 0.0
+
+    @staticmethod
+    def category_totals(expenses, column="Actual Cost"):
+        """
+        Sums one cost column per expense category.
+
+        REQUIRES: expenses is a dict mapping category -> ExpenseColumns or list of item dicts
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping category -> total of the given column; columnar
+                 categories are summed in one vectorized call.
+        """
+        return {
+            category: items.total(column) if isinstance(items, ExpenseColumns)
+            else sum(ReportBuilder.cost(item.get(column)) for item in items)
+            for category, items in expenses.items()
+        }
+
+    @staticmethod
+    def chart_series(expenses, length=7):
+        """
+        Builds the fixed-length series plotted by the spending chart.
+
+        REQUIRES: expenses is a dict mapping category -> list of item dicts; length > 0
+        MODIFIES: nothing
+        EFFECTS: Returns the first `length` category totals, padded with zeros.
+        """
+        totals = list(ReportBuilder.category_totals(expenses).values())
+        return totals[:length] + [0] * (length - len(totals[:length]))
+
+    @staticmethod
+    def daily_totals(transactions, amounts=None):
+        """
+        Totals transactions per calendar day.
+
+        REQUIRES: transactions is a sequence of Transaction; amounts is None or an array aligned
+                  with transactions (e.g. converted to the reporting currency)
+        MODIFIES: nothing
+        EFFECTS: Returns a structured array of DAILY_DTYPE with one (date, amount) row per day that
+                 has transactions, sorted by date, using amounts in place of the transactions' own.
+        """
+        dates = np.array([t.date for t in transactions], dtype="datetime64[D]")
+        if amounts is None:
+            amounts = np.fromiter((t.amount for t in transactions), dtype=float, count=len(transactions))
+        days, inverse = np.unique(dates, return_inverse=True)
+        series = np.empty(len(days), dtype=ReportBuilder.DAILY_DTYPE)
+        series["date"] = days
+        series["amount"] = np.bincount(inverse, weights=np.asarray(amounts, dtype=float), minlength=len(days))
+        return series
+
+    @staticmethod
+    def summarize(budget_data, budget=None):
+        """
+        Computes the budget status and totals for one parsed file.
+
+        REQUIRES: budget_data has keys Income, Balance, Expenses; budget is a Budget or None
+        MODIFIES: budget (its total spent is updated)
+        EFFECTS: Returns a JSON-serializable dict with income, balance, category totals,
+                 total spent, remaining budget, and the over-budget flag.
+        """
+        budget = budget if budget is not None else Budget()
+        actual = ReportBuilder.category_totals(budget_data["Expenses"])
+        projected = ReportBuilder.category_totals(budget_data["Expenses"], "Projected Cost")
+        total_spent = sum(actual.values())
+        budget.update_spent(total_spent)
+
+        return {
+            "income": {key: ReportBuilder.cost(value) for key, value in budget_data["Income"].items()},
+            "balance": {key: ReportBuilder.cost(value) for key, value in budget_data["Balance"].items()},
+            "categories": {
+                category: {"projected": projected[category], "actual": actual[category]}
+                for category in actual
+            },
+            "budget_limit": budget.budget_limit,
+            "total_spent": total_spent,
+            "remaining_budget": budget.remaining_budget(),
+            "over_budget": budget.is_over_budget()
+        }
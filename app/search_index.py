@@ -0,0 +1,433 @@
+# app/search_index.py
+
+"""
+In-memory trigram index over expense item names and transaction descriptions.
+
+Abstraction Function:
+- SearchIndex maps every 3-character substring (trigram) of a record's lowercased text to the
+  ids of records containing it. A substring query intersects the posting lists of its trigrams
+  and verifies the few surviving candidates, so queries stay fast over millions of rows.
+  One- and two-character needles are found through the trigrams that contain them.
+- An index can be built on a worker thread (for_expenses) and merged into the live one.
+- Each record remembers where it came from: ("expense", category, row) or ("transaction", position).
+
+Representation Invariant:
+- texts, amounts, dates, refs, and alive all have one entry per record id; live == sum(alive).
+- Posting lists hold ascending record ids; removed records stay in them but have alive[id] == 0.
+- by_category[c][row] is the record of row `row` of category c, whose ref is ("expense", c, row).
+- Texts are indexed with a leading PREFIX_MARK so prefix queries can use trigrams too.
+- tiny holds the ascending ids of records whose marked text is too short for a trigram.
+"""
+
+from array import array
+from bisect import bisect_left
+
+import numpy as np
+
+PREFIX_MARK = "\x02"
+
+
+class SearchIndex:
+    def __init__(self):
+        """
+        Creates an empty index.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Initializes empty record tables and posting lists.
+        """
+        self.clear()
+
+    def clear(self):
+        """
+        Removes every record.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Resets the index to empty.
+        """
+        self.texts = []
+        self.amounts = array("d")
+        self.dates = []
+        self.refs = []
+        self.alive = bytearray()
+        self.live = 0
+        self.postings = {}
+        self.tiny = array("I")
+        self.by_category = {}
+        self.by_position = {}
+
+    def _add(self, text, amount, date, ref):
+        """
+        Adds one record and its trigrams.
+
+        REQUIRES: ref identifies where the record came from
+        MODIFIES: self
+        EFFECTS: Returns the new record id.
+        """
+        record_id = len(self.texts)
+        text = str(text).lower()
+        self.texts.append(text)
+        self.amounts.append(self._amount(amount))
+        self.dates.append(date)
+        self.refs.append(ref)
+        self.alive.append(1)
+        self.live += 1
+
+        marked = PREFIX_MARK + text
+        if len(marked) < 3:
+            self.tiny.append(record_id)
+        for gram in {marked[i:i + 3] for i in range(len(marked) - 2)}:
+            postings = self.postings.get(gram)
+            if postings is None:
+                postings = self.postings[gram] = array("I")
+            postings.append(record_id)
+        return record_id
+
+    def _retire(self, record_id):
+        """
+        Marks one record as removed.
+
+        REQUIRES: record_id is alive
+        MODIFIES: self
+        EFFECTS: Hides the record from searches; its postings are dropped at the next compaction.
+        """
+        self.alive[record_id] = 0
+        self.live -= 1
+
+    def _add_item(self, category, row, item):
+        """
+        Adds the record of one expense row.
+
+        REQUIRES: item has "Item" and "Actual Cost"
+        MODIFIES: self
+        EFFECTS: Returns the new record id.
+        """
+        return self._add(item["Item"], item["Actual Cost"], None, ("expense", category, row))
+
+    @staticmethod
+    def _amount(value):
+        """
+        Normalizes an amount cell for filtering.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns float(value), or 0.0 for None, NaN, and non-numeric values.
+        """
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return 0.0
+        return value if value == value else 0.0
+
+    @staticmethod
+    def for_expenses(expenses):
+        """
+        Builds a separate index of expense items, e.g. on a worker thread.
+
+        REQUIRES: expenses is a dict mapping category -> list of item dicts, not mutated meanwhile
+        MODIFIES: nothing
+        EFFECTS: Returns a new SearchIndex holding just those items, ready to merge().
+        """
+        index = SearchIndex()
+        for category, items in expenses.items():
+            index.index_category(category, items)
+        return index
+
+    def merge(self, other):
+        """
+        Takes over the records of another index, e.g. one built by for_expenses().
+
+        REQUIRES: other is not used afterwards
+        MODIFIES: self
+        EFFECTS: Replaces this index's rows of other's categories and positions with other's
+                 records, appended after the existing ones with their ids shifted; costs time
+                 proportional to other's postings, in vectorized copies.
+        """
+        for category in other.by_category:
+            for record_id in self.by_category.pop(category, []):
+                self._retire(record_id)
+        for position in other.by_position:
+            record_id = self.by_position.pop(position, None)
+            if record_id is not None:
+                self._retire(record_id)
+
+        offset = len(self.texts)
+        self.texts.extend(other.texts)
+        self.amounts.extend(other.amounts)
+        self.dates.extend(other.dates)
+        self.refs.extend(other.refs)
+        self.alive.extend(other.alive)
+        self.live += other.live
+        self.tiny.extend(self._shifted(other.tiny, offset))
+        for gram, postings in other.postings.items():
+            existing = self.postings.get(gram)
+            if existing is None:
+                self.postings[gram] = self._shifted(postings, offset)
+            else:
+                existing.extend(self._shifted(postings, offset))
+        for category, records in other.by_category.items():
+            self.by_category[category] = [record_id + offset for record_id in records]
+        for position, record_id in other.by_position.items():
+            self.by_position[position] = record_id + offset
+        self._compact_if_sparse()
+
+    @staticmethod
+    def _shifted(postings, offset):
+        """
+        Adds an offset to every id of a posting list.
+
+        REQUIRES: postings is an array("I")
+        MODIFIES: nothing
+        EFFECTS: Returns postings itself when offset is 0, otherwise a shifted copy.
+        """
+        if not offset:
+            return postings
+        shifted = array("I")
+        shifted.frombytes((np.frombuffer(postings, dtype=np.uint32) + np.uint32(offset)).tobytes())
+        return shifted
+
+    def index_expenses(self, expenses):
+        """
+        Indexes the item names of every expense category.
+
+        REQUIRES: expenses is a dict mapping category -> list of item dicts
+        MODIFIES: self
+        EFFECTS: Replaces all previously indexed expense items with these.
+        """
+        for category in list(self.by_category):
+            self.remove_category(category)
+        for category, items in expenses.items():
+            self.index_category(category, items)
+
+    def index_category(self, category, items):
+        """
+        (Re)indexes the item names of one expense category.
+
+        REQUIRES: items is a list of item dicts with "Item" and "Actual Cost"
+        MODIFIES: self
+        EFFECTS: Retires the category's old records and indexes the new items.
+        """
+        self.remove_category(category)
+        self.by_category[category] = [self._add_item(category, row, item) for row, item in enumerate(items)]
+
+    def remove_category(self, category):
+        """
+        Removes one expense category's records.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Marks the category's records as removed.
+        """
+        for record_id in self.by_category.pop(category, []):
+            self._retire(record_id)
+        self._compact_if_sparse()
+
+    def update_item(self, category, row, item):
+        """
+        Re-indexes one edited expense row.
+
+        REQUIRES: row indexes an indexed row of category; item has "Item" and "Actual Cost"
+        MODIFIES: self
+        EFFECTS: Replaces the row's record, in time independent of the category's size.
+        """
+        records = self.by_category[category]
+        self._retire(records[row])
+        records[row] = self._add_item(category, row, item)
+        self._compact_if_sparse()
+
+    def insert_item(self, category, row, item):
+        """
+        Indexes an expense row inserted into a category.
+
+        REQUIRES: 0 <= row <= number of indexed rows of category
+        MODIFIES: self
+        EFFECTS: Adds the row's record and renumbers the rows after it.
+        """
+        records = self.by_category.setdefault(category, [])
+        records.insert(row, self._add_item(category, row, item))
+        self._renumber(category, row + 1)
+
+    def remove_item(self, category, row):
+        """
+        Removes an expense row deleted from a category.
+
+        REQUIRES: row indexes an indexed row of category
+        MODIFIES: self
+        EFFECTS: Retires the row's record and renumbers the rows after it.
+        """
+        self._retire(self.by_category[category].pop(row))
+        self._renumber(category, row)
+        self._compact_if_sparse()
+
+    def _renumber(self, category, start):
+        """
+        Points the refs of a category's rows at their current positions.
+
+        REQUIRES: 0 <= start
+        MODIFIES: self.refs
+        EFFECTS: Rewrites the refs of rows start onward; their texts and postings are untouched.
+        """
+        records = self.by_category[category]
+        for row in range(start, len(records)):
+            self.refs[records[row]] = ("expense", category, row)
+
+    def add_transaction(self, transaction, position):
+        """
+        Indexes one transaction's description.
+
+        REQUIRES: transaction is a Transaction; position is its index in BudgetManager.transactions
+        MODIFIES: self
+        EFFECTS: Adds a searchable record for the transaction.
+        """
+        self.by_position[position] = self._add(transaction.description, transaction.amount, transaction.date,
+                                               ("transaction", position))
+
+    def remove_transaction(self, position):
+        """
+        Removes one transaction's record.
+
+        REQUIRES: position was indexed with add_transaction
+        MODIFIES: self
+        EFFECTS: Marks the transaction's record as removed.
+        """
+        record_id = self.by_position.pop(position, None)
+        if record_id is not None:
+            self._retire(record_id)
+
+    def remove_transactions(self):
+        """
+        Removes every transaction record, keeping expense items.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Marks all transaction records as removed.
+        """
+        for record_id in self.by_position.values():
+            self._retire(record_id)
+        self.by_position.clear()
+        self._compact_if_sparse()
+
+    def _compact_if_sparse(self):
+        """
+        Rebuilds the index once most of its records have been removed.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Drops removed records and their postings when they outnumber live ones.
+        """
+        if len(self.alive) < 1024 or self.live * 2 > len(self.alive):
+            return
+        records = [
+            (self.texts[i], self.amounts[i], self.dates[i], self.refs[i])
+            for i in range(len(self.texts)) if self.alive[i]
+        ]
+        self.clear()
+        rows = {}
+        for text, amount, date, ref in records:
+            record_id = self._add(text, amount, date, ref)
+            if ref[0] == "expense":
+                rows.setdefault(ref[1], []).append((ref[2], record_id))
+            else:
+                self.by_position[ref[1]] = record_id
+        for category, pairs in rows.items():
+            pairs.sort()  # Rows inserted after indexing have later ids than the rows below them
+            self.by_category[category] = [record_id for _, record_id in pairs]
+
+    def search(self, query, prefix=False, min_amount=None, max_amount=None,
+               start_date=None, end_date=None, kind=None, limit=None):
+        """
+        Finds records whose text contains (or starts with) the query.
+
+        REQUIRES: query is a string; dates are 'YYYY-MM-DD' strings or None; kind is
+                  "expense", "transaction", or None for both
+        MODIFIES: nothing
+        EFFECTS: Returns the refs of matching records in record order, case-insensitively.
+                 Amount bounds are inclusive; a date filter excludes records without a date.
+                 Only a one-character substring (non-prefix) query scans every record.
+        """
+        query = query.lower()
+        needle = PREFIX_MARK + query if prefix else query
+        if len(needle) >= 3:
+            candidates = self._candidates(needle)
+        elif len(needle) == 2:
+            candidates = self._short_candidates(needle)
+        else:
+            candidates = range(len(self.texts))
+
+        results = []
+        for record_id in candidates:
+            if not self.alive[record_id]:
+                continue
+            text = self.texts[record_id]
+            if not (text.startswith(query) if prefix else query in text):
+                continue
+            ref = self.refs[record_id]
+            if kind is not None and ref[0] != kind:
+                continue
+            amount = self.amounts[record_id]
+            if (min_amount is not None and amount < min_amount) or (max_amount is not None and amount > max_amount):
+                continue
+            if start_date is not None or end_date is not None:
+                date = self.dates[record_id]
+                if date is None or (start_date is not None and date < start_date) \
+                        or (end_date is not None and date > end_date):
+                    continue
+            results.append(ref)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def _candidates(self, needle):
+        """
+        Intersects the posting lists of the needle's trigrams.
+
+        REQUIRES: len(needle) >= 3
+        MODIFIES: nothing
+        EFFECTS: Returns the ascending ids of records containing every trigram of the needle.
+        """
+        grams = {needle[i:i + 3] for i in range(len(needle) - 2)}
+        lists = []
+        for gram in grams:
+            postings = self.postings.get(gram)
+            if postings is None:
+                return []
+            lists.append(postings)
+        lists.sort(key=len)
+        # Start from the rarest trigram; probe larger lists by binary search, comparable ones via a set
+        matches = lists[0]
+        for postings in lists[1:]:
+            if not matches:
+                break
+            if len(matches) * 16 < len(postings):
+                matches = [record_id for record_id in matches if self._contains(postings, record_id)]
+            else:
+                members = set(postings)
+                matches = [record_id for record_id in matches if record_id in members]
+        return matches
+
+    def _short_candidates(self, needle):
+        """
+        Finds the records containing a two-character needle.
+
+        REQUIRES: len(needle) == 2
+        MODIFIES: nothing
+        EFFECTS: Returns the ascending ids of records with a trigram containing the needle, plus
+                 the records too short for any trigram. Every occurrence of the needle lies in
+                 some trigram, so no matching record is missed.
+        """
+        lists = [np.frombuffer(postings, dtype=np.uint32) for gram, postings in self.postings.items() if needle in gram]
+        lists.append(np.frombuffer(self.tiny, dtype=np.uint32))
+        return np.unique(np.concatenate(lists)).tolist()
+
+    @staticmethod
+    def _contains(postings, record_id):
+        """
+        Binary-searches a posting list.
+
+        REQUIRES: postings is sorted ascending
+        MODIFIES: nothing
+        EFFECTS: Returns True if record_id is in postings.
+        """
+        i = bisect_left(postings, record_id)
+        return i < len(postings) and postings[i] == record_id
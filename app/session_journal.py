@@ -0,0 +1,511 @@
+# app/session_journal.py
+
+"""
+Undo/redo journal for session edits.
+
+Abstraction Function:
+- SessionJournal applies edit commands (append, edit, delete item; append transaction; set budget)
+  to a session and keeps them in undo/redo stacks. Each command stores just enough to invert
+  itself, so undo and redo cost time proportional to the change, never to the session size.
+- Each command names the categories it touched and, when it touched one expense row, that row,
+  so views can refresh just the row instead of the whole category.
+- On clear() and every snapshot_interval commands the journal takes a Snapshot: each category's rows stored as
+  tuples of fixed-size chunks. Only chunks the commands since the previous snapshot could have
+  changed are copied; the rest (and unedited ExpenseColumns) are shared with that snapshot, so
+  a snapshot costs time and memory for what was edited, not for the session.
+- undo_to() jumps back many steps at once by restoring the nearest snapshot and replaying the
+  few commands after it, when that is cheaper than reverting every command in turn.
+
+Representation Invariant:
+- session has budget_data (with an "Expenses" dict) and budget (a Budget).
+- step counts the commands applied since clear(); undo_stack holds the last of them, at most
+  depth, oldest dropped first, and snapshots at most depth // snapshot_interval + 1 snapshots
+  in step order, so memory is bounded by the history depth and the size of the edits.
+- A snapshot with step <= self.step describes the session after its first `step` commands.
+- Commands are applied in stack order: redo_stack is cleared whenever a new command executes.
+"""
+
+from collections import deque
+from itertools import chain
+
+from app.budget_manager import BudgetManager
+from models.budget import Budget
+from models.expense_columns import ExpenseColumns
+
+
+class Command:
+    categories = ()
+    row = None  # The one expense row touched, if any
+    shifts_rows = False  # True if rows after row move (an insert or delete)
+    in_snapshot = True  # False if the state it changes is not captured by a Snapshot
+
+    def apply(self, journal):
+        """
+        Performs the edit.
+
+        REQUIRES: Implemented by subclass
+        MODIFIES: journal.session
+        EFFECTS: Applies the change.
+        """
+        raise NotImplementedError("Command subclasses must implement apply()")
+
+    def revert(self, journal):
+        """
+        Undoes the edit.
+
+        REQUIRES: Implemented by subclass; apply() was the last change to the affected rows
+        MODIFIES: journal.session
+        EFFECTS: Restores the state before apply().
+        """
+        raise NotImplementedError("Command subclasses must implement revert()")
+
+
+class AppendItem(Command):
+    def __init__(self, category, item):
+        """
+        Constructs an append of one expense item.
+
+        REQUIRES: item is a dict with "Item", "Projected Cost", "Actual Cost"
+        MODIFIES: self
+        EFFECTS: Describes appending an item to a category.
+        """
+        self.categories = (category,)
+        self.category = category
+        self.item = item
+        self.created = False
+        self.shifts_rows = True
+
+    def apply(self, journal):
+        """
+        Performs the command.
+
+        REQUIRES: nothing
+        MODIFIES: journal.session
+        EFFECTS: Appends the item, creating the category if needed.
+        """
+        self.created = self.category not in journal.expenses
+        rows = journal.rows(self.category)
+        self.row = len(rows)
+        rows.append(self.item)
+
+    def revert(self, journal):
+        """
+        Undoes the command.
+
+        REQUIRES: this is the most recently applied command
+        MODIFIES: journal.session
+        EFFECTS: Removes the appended item (and the category if apply created it).
+        """
+        journal.rows(self.category).pop()
+        if self.created:
+            del journal.expenses[self.category]
+
+
+class EditItem(Command):
+    def __init__(self, category, row, item):
+        """
+        Constructs an edit of one expense item.
+
+        REQUIRES: row indexes an existing item of category
+        MODIFIES: self
+        EFFECTS: Describes replacing one item.
+        """
+        self.categories = (category,)
+        self.category = category
+        self.row = row
+        self.item = item
+        self.previous = None
+
+    def apply(self, journal):
+        """
+        Performs the command.
+
+        REQUIRES: nothing
+        MODIFIES: journal.session
+        EFFECTS: Replaces the row, remembering the previous item.
+        """
+        rows = journal.rows(self.category)
+        self.previous = rows[self.row]
+        rows[self.row] = self.item
+
+    def revert(self, journal):
+        """
+        Undoes the command.
+
+        REQUIRES: this is the most recently applied command
+        MODIFIES: journal.session
+        EFFECTS: Puts the previous item back.
+        """
+        journal.rows(self.category)[self.row] = self.previous
+
+
+class DeleteItem(Command):
+    def __init__(self, category, row):
+        """
+        Constructs a deletion of one expense item.
+
+        REQUIRES: row indexes an existing item of category
+        MODIFIES: self
+        EFFECTS: Describes deleting one item.
+        """
+        self.categories = (category,)
+        self.category = category
+        self.row = row
+        self.previous = None
+        self.shifts_rows = True
+
+    def apply(self, journal):
+        """
+        Performs the command.
+
+        REQUIRES: nothing
+        MODIFIES: journal.session
+        EFFECTS: Removes the row, remembering it.
+        """
+        self.previous = journal.rows(self.category).pop(self.row)
+
+    def revert(self, journal):
+        """
+        Undoes the command.
+
+        REQUIRES: this is the most recently applied command
+        MODIFIES: journal.session
+        EFFECTS: Re-inserts the removed item at its row.
+        """
+        journal.rows(self.category).insert(self.row, self.previous)
+
+
+class AppendTransaction(Command):
+    def __init__(self, transaction):
+        """
+        Constructs the addition of one transaction.
+
+        REQUIRES: transaction is a Transaction
+        MODIFIES: self
+        EFFECTS: Describes adding a transaction to the BudgetManager.
+        """
+        self.transaction = transaction
+        self.in_snapshot = False  # Transactions live in the BudgetManager
+
+    def apply(self, journal):
+        """
+        Performs the command.
+
+        REQUIRES: nothing
+        MODIFIES: journal.session
+        EFFECTS: Adds the transaction to the BudgetManager.
+        """
+        journal.manager.add_transaction(self.transaction)
+
+    def revert(self, journal):
+        """
+        Undoes the command.
+
+        REQUIRES: this is the most recently applied command
+        MODIFIES: journal.session
+        EFFECTS: Removes the last transaction from the BudgetManager.
+        """
+        journal.manager.pop_transaction()
+
+
+class SetBudget(Command):
+    def __init__(self, amount):
+        """
+        Constructs a change of the budget limit.
+
+        REQUIRES: amount >= 0
+        MODIFIES: self
+        EFFECTS: Describes replacing the session budget.
+        """
+        self.amount = amount
+        self.previous = None
+
+    def apply(self, journal):
+        """
+        Performs the command.
+
+        REQUIRES: nothing
+        MODIFIES: journal.session
+        EFFECTS: Installs a new Budget, keeping the previous one for undo.
+        """
+        self.previous = journal.session.budget
+        journal.session.budget = Budget(self.amount, self.previous.currency)
+
+    def revert(self, journal):
+        """
+        Undoes the command.
+
+        REQUIRES: this is the most recently applied command
+        MODIFIES: journal.session
+        EFFECTS: Reinstates the previous Budget.
+        """
+        journal.session.budget = self.previous
+
+
+class Snapshot:
+    def __init__(self, step, chunks, budget):
+        """
+        Captures the session at one point in the journal.
+
+        REQUIRES: chunks maps category -> tuple of row-tuples, or an unedited ExpenseColumns
+        MODIFIES: self
+        EFFECTS: Stores the (partly shared) expense chunks and the budget.
+        """
+        self.step = step
+        self.chunks = chunks
+        self.budget = budget
+
+
+class SessionJournal:
+    CHUNK_SIZE = 256
+
+    def __init__(self, session, depth=100, snapshot_interval=25):
+        """
+        Creates an empty journal for a session.
+
+        REQUIRES: session has budget_data and budget attributes; depth > 0; snapshot_interval > 0
+        MODIFIES: self
+        EFFECTS: Keeps at most depth undoable commands.
+        """
+        self.session = session
+        self.manager = BudgetManager()
+        self.depth = depth
+        self.snapshot_interval = snapshot_interval
+        self.clear()
+
+    @property
+    def expenses(self):
+        """
+        The session's expense categories.
+
+        REQUIRES: nothing
+        MODIFIES: session.budget_data
+        EFFECTS: Returns budget_data["Expenses"], creating it if the session is empty.
+        """
+        return self.session.budget_data.setdefault("Expenses", {})
+
+    def rows(self, category):
+        """
+        Returns a category's rows as a mutable list.
+
+        REQUIRES: nothing
+        MODIFIES: session.budget_data
+        EFFECTS: Creates the category if missing; converts read-only row containers (such as
+                 ExpenseColumns) to a list of item dicts.
+        """
+        rows = self.expenses.get(category)
+        if not isinstance(rows, list):
+            rows = self.expenses[category] = [dict(item) for item in rows or []]
+        return rows
+
+    def clear(self):
+        """
+        Forgets all history, e.g. after loading a new file.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Empties both stacks and snapshots the session as step 0, so undo_to() can return
+                 to it without reverting every command.
+        """
+        self.undo_stack = deque(maxlen=self.depth)
+        self.redo_stack = []
+        self.snapshots = deque(maxlen=self.depth // self.snapshot_interval + 1)
+        self.step = 0
+        self.checkpoint()
+
+    def execute(self, command):
+        """
+        Applies a command and records it for undo.
+
+        REQUIRES: command is a Command
+        MODIFIES: session, self
+        EFFECTS: Applies the command, clears redo history, snapshots every snapshot_interval
+                 steps, and returns the command.
+        """
+        command.apply(self)
+        self.undo_stack.append(command)
+        self.redo_stack.clear()
+        # Snapshots ahead of this point belong to the abandoned redo branch
+        while self.snapshots and self.snapshots[-1].step > self.step:
+            self.snapshots.pop()
+        self.step += 1
+        if self.step % self.snapshot_interval == 0:
+            self.checkpoint()
+        return command
+
+    def can_undo(self):
+        """
+        Reports whether there is anything to undo.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns True if the undo stack is not empty.
+        """
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        """
+        Reports whether there is anything to redo.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns True if the redo stack is not empty.
+        """
+        return bool(self.redo_stack)
+
+    def undo(self):
+        """
+        Reverts the most recent command.
+
+        REQUIRES: can_undo()
+        MODIFIES: session, self
+        EFFECTS: Returns the reverted command (its categories say what to refresh).
+        """
+        command = self.undo_stack.pop()
+        command.revert(self)
+        self.redo_stack.append(command)
+        self.step -= 1
+        return command
+
+    def redo(self):
+        """
+        Re-applies the most recently undone command.
+
+        REQUIRES: can_redo()
+        MODIFIES: session, self
+        EFFECTS: Returns the re-applied command.
+        """
+        command = self.redo_stack.pop()
+        command.apply(self)
+        self.undo_stack.append(command)
+        self.step += 1
+        return command
+
+    def earliest_step(self):
+        """
+        Returns the oldest step undo can return to.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns step minus the number of undoable commands.
+        """
+        return self.step - len(self.undo_stack)
+
+    def undo_to(self, step):
+        """
+        Reverts commands until only the first `step` remain applied.
+
+        REQUIRES: earliest_step() <= step <= self.step
+        MODIFIES: session, self
+        EFFECTS: Returns the reverted commands, newest first, all of which can be redone. Restores
+                 the latest snapshot at or before step and replays the commands after it when that
+                 touches fewer chunks and commands than reverting one by one; transactions are
+                 always popped command by command.
+        """
+        count = self.step - step
+        snapshot = next(
+            (s for s in reversed(self.snapshots) if self.earliest_step() <= s.step <= step), None
+        )
+        if snapshot is None:
+            return [self.undo() for _ in range(count)]
+        since = list(self.undo_stack)[len(self.undo_stack) - (self.step - snapshot.step):]
+        categories = {category for command in since for category in command.categories}
+        restore_cost = (step - snapshot.step) + sum(
+            1 if isinstance(chunks, ExpenseColumns) else len(chunks)
+            for chunks in (snapshot.chunks.get(category, ()) for category in categories)
+        )
+        if restore_cost >= count:
+            return [self.undo() for _ in range(count)]
+
+        undone = [self.undo_stack.pop() for _ in range(count)]
+        for command in undone:
+            if not command.in_snapshot:
+                command.revert(self)
+        self.restore(snapshot, categories, any(isinstance(c, SetBudget) for c in since))
+        for command in since[:step - snapshot.step]:
+            if command.in_snapshot:
+                command.apply(self)
+        self.redo_stack.extend(undone)  # The oldest undone command is redone first
+        self.step = step
+        return undone
+
+    def _touched_chunks(self, commands):
+        """
+        Finds the chunks a run of commands may have changed.
+
+        REQUIRES: commands were applied in order, ending with the current state
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping category -> set of chunk indices, or None when the whole
+                 category must be re-chunked.
+        """
+        touched = {}
+        expenses = self.session.budget_data.get("Expenses", {})
+        for command in commands:
+            for category in command.categories:
+                if touched.get(category, ()) is None:
+                    continue
+                if command.row is None:
+                    touched[category] = None
+                    continue
+                first = command.row // self.CHUNK_SIZE
+                chunks = touched.setdefault(category, set())
+                if command.shifts_rows:
+                    chunks.update(range(first, len(expenses.get(category) or ()) // self.CHUNK_SIZE + 1))
+                else:
+                    chunks.add(first)
+        return touched
+
+    def checkpoint(self):
+        """
+        Snapshots the session, sharing unchanged chunks with the previous snapshot.
+
+        REQUIRES: nothing
+        MODIFIES: self.snapshots
+        EFFECTS: Returns the new Snapshot. Re-chunks only what the commands since the previous
+                 snapshot touched, or every list category when those commands are no longer held.
+        """
+        base = self.snapshots[-1] if self.snapshots else None
+        if base is not None and base.step >= self.earliest_step():
+            previous = base.chunks
+            touched = self._touched_chunks(list(self.undo_stack)[len(self.undo_stack) - (self.step - base.step):])
+        else:
+            previous, touched = {}, {}
+        size = self.CHUNK_SIZE
+        chunks = {}
+        for category, rows in self.session.budget_data.get("Expenses", {}).items():
+            old = previous.get(category)
+            changed = touched.get(category, set())
+            if isinstance(rows, ExpenseColumns):
+                chunks[category] = rows  # Never mutated, so the snapshot can share it whole
+            elif isinstance(old, tuple) and changed is not None:
+                chunks[category] = old if not changed else tuple(
+                    old[i] if i < len(old) and i not in changed else tuple(rows[i * size:(i + 1) * size])
+                    for i in range(-(-len(rows) // size))
+                )
+            else:
+                chunks[category] = tuple(tuple(rows[i:i + size]) for i in range(0, len(rows), size))
+        snapshot = Snapshot(self.step, chunks, self.session.budget)
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def restore(self, snapshot, categories, budget=True):
+        """
+        Rolls expense categories (and the budget) back to a snapshot.
+
+        REQUIRES: snapshot is in self.snapshots
+        MODIFIES: session
+        EFFECTS: Rebuilds each given category from the snapshot's chunks, removing categories it
+                 did not have, and reinstates its budget if budget is True. Does not touch the
+                 stacks or step; undo_to() keeps those consistent.
+        """
+        expenses = self.expenses
+        for category in categories:
+            chunks = snapshot.chunks.get(category)
+            if chunks is None:
+                expenses.pop(category, None)
+            elif isinstance(chunks, ExpenseColumns):
+                expenses[category] = chunks
+            else:
+                expenses[category] = list(chain.from_iterable(chunks))
+        if budget:
+            self.session.budget = snapshot.budget
@@ -0,0 +1,251 @@
+# app/summary_service.py
+
+"""
+Local asyncio HTTP service that serves budget summaries as JSON.
+
+Abstraction Function:
+- SummaryService answers GET /summary?file=<path>&budget=<limit> with the same summary the
+  batch report produces, and GET /health with a liveness check.
+- Parsed files come from a ParsedFileCache; encoded responses are cached per
+  (file, content digest, budget limit) so repeated requests skip both parsing and JSON encoding.
+
+Representation Invariant:
+- Only files inside root are served.
+- Every request gets a response: a malformed file name or non-finite budget is a 400, and any unexpected error
+  while handling a request is a 500 rather than a dropped connection.
+- responses holds at most RESPONSE_CACHE_SIZE entries, least recently used evicted first.
+- Never imports PyQt6.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from app.report_builder import ReportBuilder
+from file_io.parsed_file_cache import ParsedFileCache
+from models.budget import Budget
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class SummaryService:
+    RESPONSE_CACHE_SIZE = 256
+
+    def __init__(self, root=".", cache=None):
+        """
+        Creates a service rooted at a directory of budget files.
+
+        REQUIRES: root is an existing directory
+        MODIFIES: self
+        EFFECTS: Initializes the parsed-file cache and an empty response cache.
+        """
+        self.root = os.path.realpath(root)
+        self.cache = cache or ParsedFileCache()
+        self.responses = OrderedDict()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """
+        Starts listening for HTTP connections.
+
+        REQUIRES: port is free on host
+        MODIFIES: network state
+        EFFECTS: Returns the running asyncio server.
+        """
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves HTTP/1.1 requests on one connection, honouring keep-alive.
+
+        REQUIRES: reader and writer belong to an accepted connection
+        MODIFIES: writer
+        EFFECTS: Parses each request, writes its response, and closes the connection when done.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    status, body = 400, self._error("Malformed request line")
+                    keep_alive = False
+                else:
+                    method, target, version = parts
+                    status, body = await self.respond(method, target)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                writer.write(self._response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, target):
+        """
+        Handles one request, turning unexpected failures into a 500 response.
+
+        REQUIRES: method and target come from a valid request line
+        MODIFIES: caches, stderr
+        EFFECTS: Returns dispatch()'s (status_code, encoded JSON body), or a 500 with the error
+                 reported on stderr if handling raised.
+        """
+        try:
+            return await self.dispatch(method, target)
+        except Exception as e:
+            print(f"Error handling {method} {target}: {e!r}", file=sys.stderr)
+            return 500, self._error("Internal server error")
+
+    async def dispatch(self, method, target):
+        """
+        Routes one request to its handler.
+
+        REQUIRES: method and target come from a valid request line
+        MODIFIES: caches
+        EFFECTS: Returns (status_code, encoded JSON body).
+        """
+        if method != "GET":
+            return 405, self._error("Only GET is supported")
+        url = urlsplit(target)
+        if url.path == "/health":
+            return 200, b'{"status": "ok"}'
+        if url.path != "/summary":
+            return 404, self._error(f"Unknown path: {url.path}")
+
+        query = parse_qs(url.query)
+        if "file" not in query:
+            return 400, self._error("Missing 'file' parameter")
+        try:
+            budget_limit = float(query.get("budget", ["0"])[0])
+        except ValueError:
+            return 400, self._error("'budget' must be a number")
+        if not math.isfinite(budget_limit):
+            return 400, self._error("'budget' must be a number")  # inf and nan are not valid JSON
+
+        try:
+            path = self.resolve(query["file"][0])
+        except ValueError:
+            return 400, self._error("Invalid 'file' parameter")
+        if path is None or not os.path.isfile(path):
+            return 404, self._error("File not found")
+        return await self.summary(path, budget_limit)
+
+    async def summary(self, path, budget_limit):
+        """
+        Returns the encoded summary of one file, using the response cache when possible.
+
+        REQUIRES: path is an existing file inside root
+        MODIFIES: self.cache, self.responses
+        EFFECTS: Returns (status_code, encoded JSON body).
+        """
+        try:
+            digest, data = await self.cache.get(path)
+        except (OSError, ValueError, KeyError) as e:
+            return 422, self._error(str(e))
+        if not data:
+            return 422, self._error("Could not read budget data")
+
+        key = (path, digest, budget_limit)
+        body = self.responses.get(key)
+        if body is not None:
+            self.responses.move_to_end(key)
+            return 200, body
+
+        summary = ReportBuilder.summarize(data, Budget(budget_limit))
+        summary["file"] = os.path.relpath(path, self.root)
+        body = json.dumps(summary).encode("utf-8")
+        self.responses[key] = body
+        if len(self.responses) > self.RESPONSE_CACHE_SIZE:
+            self.responses.popitem(last=False)
+        return 200, body
+
+    def resolve(self, relative_path):
+        """
+        Maps a requested file name to an absolute path inside root.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns the real path, or None if it escapes root; raises ValueError if the name
+                 is not a valid path (e.g. contains a NUL byte).
+        """
+        if "\x00" in relative_path:
+            raise ValueError("File name contains a NUL byte")
+        path = os.path.realpath(os.path.join(self.root, relative_path))
+        if os.path.commonpath([path, self.root]) != self.root:
+            return None
+        return path
+
+    @staticmethod
+    def _error(message):
+        """
+        Encodes an error message as a JSON body.
+
+        REQUIRES: message is a string
+        MODIFIES: nothing
+        EFFECTS: Returns bytes of {"error": message}.
+        """
+        return json.dumps({"error": message}).encode("utf-8")
+
+    @staticmethod
+    def _response(status, body, keep_alive):
+        """
+        Builds a complete HTTP response.
+
+        REQUIRES: status is a key of _REASONS; body is bytes
+        MODIFIES: nothing
+        EFFECTS: Returns the raw response bytes with JSON content headers.
+        """
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the summary service.
+
+    REQUIRES: argv is a list of command-line arguments or None for sys.argv
+    MODIFIES: network state
+    EFFECTS: Serves summaries until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Serve budget summaries over local HTTP.")
+    parser.add_argument("--root", default=".", help="directory containing budget files")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = await SummaryService(args.root).start(args.host, args.port)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
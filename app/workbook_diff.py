@@ -0,0 +1,256 @@
+# app/workbook_diff.py
+
+"""
+Compares two budget workbooks, e.g. this month's with last month's, or an export with its source.
+
+Abstraction Function:
+- WorkbookDiff hash-joins the expense rows of two sessions on (category, item name) and reports
+  the items added, removed, and changed (with projected/actual deltas) per category, plus the
+  change of every Income and Balance figure.
+- compare_files() first fingerprints the sheets of both .xlsx files and parses only sheets whose
+  fingerprints differ; identical sheets are listed as unchanged without being read.
+
+Representation Invariant:
+- Item names are matched after Deduplicator.normalize_text; repeated names within a category are
+  matched by occurrence, the first old row with the first new row and so on.
+- Costs are compared in whole cents, so formatting noise never counts as a change.
+- Every pass is linear in the number of rows compared: one dict lookup per row for the join,
+  then vectorized cost comparisons over the matched rows. Results are JSON-serializable.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from app.deduplicator import Deduplicator
+from app.report_builder import ReportBuilder
+from file_io.excel_loader import ExcelLoader
+from file_io.loader_factory import LoaderFactory
+from models.expense_columns import ExpenseColumns
+
+
+class WorkbookDiff:
+    @staticmethod
+    def change(old, new):
+        """
+        Describes the change of one figure.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns {"old", "new", "delta"} with missing values counted as 0.0.
+        """
+        old, new = ReportBuilder.cost(old), ReportBuilder.cost(new)
+        return {"old": old, "new": new, "delta": new - old}
+
+    @staticmethod
+    def columns(items):
+        """
+        Reads a category as columns.
+
+        REQUIRES: items is an ExpenseColumns or a sequence of item mappings
+        MODIFIES: nothing
+        EFFECTS: Returns (names, projected, actual) with costs as float arrays, missing costs as 0.0.
+        """
+        if isinstance(items, ExpenseColumns):
+            return items.names, np.nan_to_num(items.projected), np.nan_to_num(items.actual)
+        return (
+            [item.get("Item") for item in items],
+            np.array([ReportBuilder.cost(item.get("Projected Cost")) for item in items]),
+            np.array([ReportBuilder.cost(item.get("Actual Cost")) for item in items])
+        )
+
+    @staticmethod
+    def keyed_rows(names):
+        """
+        Indexes a category's rows for the hash join.
+
+        REQUIRES: names is a sequence of item names
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping (normalized name, occurrence) -> row index, in row order.
+        """
+        normalized = list(map(Deduplicator.normalize_text, names))
+        if len(set(normalized)) == len(normalized):
+            return {(name, 0): row for row, name in enumerate(normalized)}  # No repeated names
+        seen = {}
+        rows = {}
+        for row, name in enumerate(normalized):
+            occurrence = seen.get(name, 0)
+            seen[name] = occurrence + 1
+            rows[(name, occurrence)] = row
+        return rows
+
+    @staticmethod
+    def diff_category(old_items, new_items):
+        """
+        Diffs one category.
+
+        REQUIRES: old_items and new_items are ExpenseColumns or sequences of item mappings
+        MODIFIES: nothing
+        EFFECTS: Returns a dict with "added", "removed", and "changed" item lists and the category's
+                 total "projected" and "actual" changes, or None if the rows are the same.
+        """
+        old_names, old_projected, old_actual = WorkbookDiff.columns(old_items)
+        new_names, new_projected, new_actual = WorkbookDiff.columns(new_items)
+        old_rows = WorkbookDiff.keyed_rows(old_names)
+        new_rows = WorkbookDiff.keyed_rows(new_names)
+
+        pairs = [(old_rows[key], row) for key, row in new_rows.items() if key in old_rows]
+        matched_old = np.array([pair[0] for pair in pairs], dtype=np.int64)
+        matched_new = np.array([pair[1] for pair in pairs], dtype=np.int64)
+        differs = (
+            (np.rint(old_projected[matched_old] * 100) != np.rint(new_projected[matched_new] * 100))
+            | (np.rint(old_actual[matched_old] * 100) != np.rint(new_actual[matched_new] * 100))
+        )
+
+        changed = [
+            {
+                "item": str(new_names[j]),
+                "projected": WorkbookDiff.change(old_projected[i], new_projected[j]),
+                "actual": WorkbookDiff.change(old_actual[i], new_actual[j])
+            }
+            for i, j in zip(matched_old[differs].tolist(), matched_new[differs].tolist())
+        ]
+        matched = set(matched_old.tolist())
+        added = [
+            WorkbookDiff.describe(new_names[j], new_projected[j], new_actual[j])
+            for key, j in new_rows.items() if key not in old_rows
+        ]
+        removed = [
+            WorkbookDiff.describe(old_names[i], old_projected[i], old_actual[i])
+            for i in range(len(old_names)) if i not in matched
+        ]
+        if not (added or removed or changed):
+            return None
+        return {
+            "added": added,
+            "removed": removed,
+            "changed": changed,
+            "projected": WorkbookDiff.change(old_projected.sum(), new_projected.sum()),
+            "actual": WorkbookDiff.change(old_actual.sum(), new_actual.sum())
+        }
+
+    @staticmethod
+    def describe(name, projected, actual):
+        """
+        Summarizes an added or removed row.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns {"item", "projected", "actual"}.
+        """
+        return {"item": str(name), "projected": float(projected), "actual": float(actual)}
+
+    @staticmethod
+    def compare(old_data, new_data, unchanged=()):
+        """
+        Diffs two parsed sessions.
+
+        REQUIRES: old_data and new_data are (possibly partial) budget dicts as returned by the
+                  loaders; unchanged names sheets already known to be identical
+        MODIFIES: nothing
+        EFFECTS: Returns a dict with per-figure "summary" changes for Income and Balance, per-category
+                 "categories" diffs (only categories that differ), and the "unchanged" sheet names.
+        """
+        summary = {}
+        for sheet in ExcelLoader.SUMMARY_SHEETS:
+            old_values = old_data.get(sheet) or {}
+            new_values = new_data.get(sheet) or {}
+            changes = {}
+            for key in list(old_values) + [k for k in new_values if k not in old_values]:
+                change = WorkbookDiff.change(old_values.get(key), new_values.get(key))
+                if Deduplicator.cents(change["old"]) != Deduplicator.cents(change["new"]):
+                    changes[key] = change
+            if changes:
+                summary[sheet] = changes
+
+        old_expenses = old_data.get("Expenses", {})
+        new_expenses = new_data.get("Expenses", {})
+        categories = {}
+        for category in list(old_expenses) + [c for c in new_expenses if c not in old_expenses]:
+            result = WorkbookDiff.diff_category(old_expenses.get(category, []), new_expenses.get(category, []))
+            if result is not None:
+                categories[category] = result
+        return {"summary": summary, "categories": categories, "unchanged": sorted(unchanged)}
+
+    @staticmethod
+    def compare_files(old_path, new_path):
+        """
+        Diffs two budget files, parsing only the sheets that differ.
+
+        REQUIRES: old_path and new_path are budget files supported by LoaderFactory
+        MODIFIES: nothing
+        EFFECTS: Returns compare()'s result with the two paths added. For two .xlsx files, sheets
+                 with equal fingerprints are skipped; other files are loaded whole. Raises
+                 ValueError if a file cannot be read.
+        """
+        old_prints = ExcelLoader.sheet_fingerprints(old_path)
+        new_prints = ExcelLoader.sheet_fingerprints(new_path)
+        if old_prints and new_prints:
+            unchanged = {name for name, digest in old_prints.items() if new_prints.get(name) == digest}
+            old_data = WorkbookDiff._load_sheets(old_path, [n for n in old_prints if n not in unchanged])
+            new_data = WorkbookDiff._load_sheets(new_path, [n for n in new_prints if n not in unchanged])
+        else:
+            unchanged = ()
+            old_data = LoaderFactory.load(old_path)
+            new_data = LoaderFactory.load(new_path)
+            if not old_data or not new_data:
+                raise ValueError(f"Could not read budget data from {old_path if not old_data else new_path}")
+        result = {"old": old_path, "new": new_path}
+        result.update(WorkbookDiff.compare(old_data, new_data, unchanged))
+        return result
+
+    @staticmethod
+    def _load_sheets(path, sheet_names):
+        """
+        Parses the given sheets of a workbook.
+
+        REQUIRES: sheet_names are sheets of the workbook at path
+        MODIFIES: nothing
+        EFFECTS: Returns the partial budget dict, or raises ValueError if the sheets cannot be read.
+        """
+        if not sheet_names:
+            return {"Expenses": {}}
+        data = ExcelLoader.load_sheets(path, sheet_names)
+        if not data:
+            raise ValueError(f"Could not read budget data from {path}")
+        return data
+
+
+def main(argv=None):
+    """
+    Command-line entry point for comparing two budget files.
+
+    REQUIRES: argv is a list of command-line arguments or None for sys.argv
+    MODIFIES: stdout or the output file
+    EFFECTS: Writes the diff as JSON; returns 1 if either file could not be read, else 0.
+    """
+    parser = argparse.ArgumentParser(description="Compare two budget files without the GUI.")
+    parser.add_argument("old", help="the earlier Excel (.xlsx) or CSV budget file")
+    parser.add_argument("new", help="the later Excel (.xlsx) or CSV budget file")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    for path in (args.old, args.new):
+        if not os.path.exists(path):
+            print(f"No such file: {path}", file=sys.stderr)
+            return 1
+    try:
+        result = WorkbookDiff.compare_files(args.old, args.new)
+    except (OSError, ValueError, KeyError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# benchmarks/expense_columns.py
+
+"""
+Measures the memory and summing cost of columnar expenses against row dicts.
+
+Abstraction Function:
+- The benchmark builds the same synthetic category as a list of item dicts (the layout
+  df.to_dict(orient="records") produces) and as an ExpenseColumns, then reports the bytes
+  each allocates (via tracemalloc) and the time ReportBuilder.category_totals takes on each.
+
+Representation Invariant:
+- Both layouts hold identical rows, so their totals are equal.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from app.report_builder import ReportBuilder
+from models.expense_columns import ExpenseColumns
+
+
+def allocated(build):
+    """
+    Measures the memory a structure keeps alive.
+
+    REQUIRES: build is a callable with no arguments
+    MODIFIES: nothing
+    EFFECTS: Returns (result, bytes still allocated by build() once it returns).
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def best_time(function, repeat):
+    """
+    Times a function.
+
+    REQUIRES: repeat > 0
+    MODIFIES: nothing
+    EFFECTS: Returns the fastest of repeat calls, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the benchmark.
+
+    REQUIRES: argv is a list of command-line arguments or None for sys.argv
+    MODIFIES: stdout
+    EFFECTS: Prints memory use and summing time for both layouts.
+    """
+    parser = argparse.ArgumentParser(description="Compare row-dict and columnar expense storage.")
+    parser.add_argument("--rows", type=int, default=200000, help="rows in the synthetic category")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args(argv)
+
+    # Fresh strings and floats per row, as a parsed workbook would produce
+    names = [f"Item {i}" for i in range(args.rows)]
+    projected = [float(i % 500) + 0.25 for i in range(args.rows)]
+    actual = [float(i % 700) + 0.5 for i in range(args.rows)]
+
+    records, record_bytes = allocated(lambda: [
+        {"Item": n, "Projected Cost": float(str(p)), "Actual Cost": float(str(a))}
+        for n, p, a in zip(names, projected, actual)
+    ])
+    columns, column_bytes = allocated(lambda: ExpenseColumns(names, projected, actual))
+
+    record_time = best_time(lambda: ReportBuilder.category_totals({"C": records}), args.repeat)
+    column_time = best_time(lambda: ReportBuilder.category_totals({"C": columns}), args.repeat)
+    assert abs(ReportBuilder.category_totals({"C": records})["C"] - columns.total()) < 1e-6 * args.rows
+
+    print(f"rows:           {args.rows}")
+    print(f"row dicts:      {record_bytes / 2 ** 20:8.2f} MiB   sum {record_time * 1000:8.2f} ms")
+    print(f"ExpenseColumns: {column_bytes / 2 ** 20:8.2f} MiB   sum {column_time * 1000:8.2f} ms")
+    print(f"memory saved:   {1 - column_bytes / record_bytes:8.1%}   (item names are shared by both)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
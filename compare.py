@@ -0,0 +1,17 @@
+# compare.py
+
+"""
+Launches the headless comparison of two budget files.
+
+Abstraction Function:
+- Compare forwards command-line arguments to app.workbook_diff without starting the GUI.
+
+Representation Invariant:
+- PyQt6 is never imported.
+"""
+
+import sys
+from app.workbook_diff import main
+
+if __name__ == "__main__":
+    sys.exit(main())
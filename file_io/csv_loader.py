@@ -8,13 +8,27 @@ Abstraction Function:
 
 Representation Invariant:
 - Returned dictionary has keys: "Income", "Balance", "Expenses".
+- Each expense category is an ExpenseColumns.
+- With a categorizer, every expense category is one of Category.all().
 """
 
 import csv
-from file_io.file_parser_interface import FileParserInterface
+from file_io.parser_interface import FileParserInterface
+from models.category import Category
+from models.expense_columns import ExpenseColumns
 
 
 class CsvLoader(FileParserInterface):
+    def __init__(self, categorizer=None):
+        """
+        Constructs a CSV loader.
+
+        REQUIRES: categorizer is a Categorizer or None
+        MODIFIES: self
+        EFFECTS: Rows whose Category is missing or unknown are labelled by the categorizer, if given.
+        """
+        self.categorizer = categorizer
+
     def load_budget_data(self, path):
         """
         Loads CSV file and adapts it to the same structure used by ExcelLoader.
@@ -36,26 +50,29 @@ class CsvLoader(FileParserInterface):
             "Expenses": {}
         }
 
+        columns = {}
+        known = set(Category.all())
         with open(path, newline='', encoding='utf-8') as csvfile:
             reader = csv.DictReader(csvfile)
             for row in reader:
-                category = row["Category"].strip().upper()
+                category = (row.get("Category") or "").strip().upper()
                 item = row["Item"].strip()
                 projected = float(row["Projected Cost"])
                 actual = float(row["Actual Cost"])
+                if self.categorizer is not None and category not in known:
+                    category = self.categorizer.categorize(item, actual)
 
-                if category not in data["Expenses"]:
-                    data["Expenses"][category] = []
+                names, projected_costs, actual_costs = columns.setdefault(category, ([], [], []))
+                names.append(item)
+                projected_costs.append(projected)
+                actual_costs.append(actual)
 
-                data["Expenses"][category].append({
-                    "Item": item,
-                    "Projected Cost": projected,
-                    "Actual Cost": actual
-                })
+        for category, (names, projected_costs, actual_costs) in columns.items():
+            data["Expenses"][category] = ExpenseColumns(names, projected_costs, actual_costs)
 
         # Dummy balance calc (since CSV might not include summary)
-        all_projected = sum(item["Projected Cost"] for cat in data["Expenses"].values() for item in cat)
-        all_actual = sum(item["Actual Cost"] for cat in data["Expenses"].values() for item in cat)
+        all_projected = sum(items.total("Projected Cost") for items in data["Expenses"].values())
+        all_actual = sum(items.total("Actual Cost") for items in data["Expenses"].values())
 
         data["Income"]["Projected Monthly Income"] = all_projected + 500  # Placeholder logic
         data["Income"]["Actual Monthly Income"] = all_actual + 500
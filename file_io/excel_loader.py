@@ -9,11 +9,26 @@ Abstraction Function:
 
 Representation Invariant:
 - Files are read only if they match the template format (e.g., income, balance, expenses).
+- Template-shaped expense sheets are returned as ExpenseColumns; other sheets as lists of row dicts.
 """
 
+import hashlib
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
 import pandas as pd
 
+from models.expense_columns import ExpenseColumns
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_SHARED_STRING_CELL = re.compile(rb'<c\b[^>]*\bt="s"[^>]*>\s*<v>(\d+)</v>')
+
 class ExcelLoader:
+    SUMMARY_SHEETS = ("Income", "Balance")
+
     @staticmethod
     def load_budget_data(file_path):
         """
@@ -24,25 +39,94 @@ class ExcelLoader:
         EFFECTS: Returns a dictionary with Income, Balance, and Expenses from the Excel file.
         """
         try:
-            income_df = pd.read_excel(file_path, sheet_name="Income")
-            balance_df = pd.read_excel(file_path, sheet_name="Balance")
-            expenses = {}
-
-            sheet_names = pd.ExcelFile(file_path).sheet_names
-            for sheet in sheet_names:
-                if sheet not in ["Income", "Balance"]:
-                    df = pd.read_excel(file_path, sheet_name=sheet)
-                    expenses[sheet.upper()] = df.to_dict(orient="records")
-
+            with pd.ExcelFile(file_path) as excel:
+                data = ExcelLoader._parse_sheets(excel, excel.sheet_names)
             return {
-                "Income": income_df.iloc[0].to_dict(),
-                "Balance": balance_df.iloc[0].to_dict(),
-                "Expenses": expenses
+                "Income": data["Income"],
+                "Balance": data["Balance"],
+                "Expenses": data["Expenses"]
             }
         except Exception as e:
             print(f"Error reading Excel file: {e}")
             return {}
 
+    @staticmethod
+    def load_sheets(file_path, sheet_names):
+        """
+        Loads only the named sheets of an Excel file.
+
+        REQUIRES: file_path is a valid path to an .xlsx file; sheet_names are sheets in it
+        MODIFIES: nothing
+        EFFECTS: Returns a partial budget dictionary: "Income"/"Balance" when those sheets are
+                 requested, and "Expenses" holding only the requested category sheets.
+                 Returns {} if the file cannot be read.
+        """
+        try:
+            with pd.ExcelFile(file_path) as excel:
+                return ExcelLoader._parse_sheets(excel, sheet_names)
+        except Exception as e:
+            print(f"Error reading Excel file: {e}")
+            return {}
+
+    @staticmethod
+    def _parse_sheets(excel, sheet_names):
+        """
+        Parses sheets from an open workbook into the budget dictionary layout.
+
+        REQUIRES: excel is an open pandas ExcelFile
+        MODIFIES: nothing
+        EFFECTS: Returns a dict with the parsed Income/Balance rows and category expenses, each
+                 category stored as ExpenseColumns when it matches the template.
+        """
+        data = {"Expenses": {}}
+        for sheet in sheet_names:
+            df = excel.parse(sheet)
+            if sheet in ExcelLoader.SUMMARY_SHEETS:
+                data[sheet] = df.iloc[0].to_dict()
+            else:
+                columns = ExpenseColumns.from_frame(df)
+                data["Expenses"][sheet.upper()] = columns if columns is not None else df.to_dict(orient="records")
+        return data
+
+    @staticmethod
+    def sheet_fingerprints(file_path):
+        """
+        Fingerprints every sheet of an .xlsx workbook without parsing cell data with pandas.
+
+        REQUIRES: file_path is a valid path to an .xlsx file
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping sheet name -> hex digest of the sheet's XML and the shared
+                 strings it references, so a sheet's fingerprint changes only when its own
+                 content does. Returns {} if the file is not a readable .xlsx archive.
+        """
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                names = set(archive.namelist())
+                workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+                rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+                targets = {rel.get("Id"): rel.get("Target") for rel in rels}
+
+                shared_strings = []
+                if "xl/sharedStrings.xml" in names:
+                    for si in ET.fromstring(archive.read("xl/sharedStrings.xml")).iter(_MAIN_NS + "si"):
+                        shared_strings.append("".join(t.text or "" for t in si.iter(_MAIN_NS + "t")))
+
+                fingerprints = {}
+                for sheet in workbook.iter(_MAIN_NS + "sheet"):
+                    target = targets.get(sheet.get(_REL_ID), "")
+                    member = target.lstrip("/") if target.startswith("/") else posixpath.normpath(
+                        posixpath.join("xl", target))
+                    xml = archive.read(member)
+                    digest = hashlib.blake2b(xml, digest_size=16)
+                    for index in _SHARED_STRING_CELL.findall(xml):
+                        i = int(index)
+                        digest.update(shared_strings[i].encode("utf-8") if i < len(shared_strings) else b"")
+                        digest.update(b"\0")
+                    fingerprints[sheet.get("name")] = digest.hexdigest()
+                return fingerprints
+        except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError):
+            return {}
+
     @staticmethod
     def save_budget_data(transactions, budget_data):
         """
@@ -58,7 +142,7 @@ class ExcelLoader:
                 pd.DataFrame([budget_data["Balance"]]).to_excel(writer, sheet_name="Balance", index=False)
 
                 for category, items in budget_data["Expenses"].items():
-                    df = pd.DataFrame(items)
+                    df = pd.DataFrame(items.to_columns() if isinstance(items, ExpenseColumns) else items)
                     df.to_excel(writer, sheet_name=category.title(), index=False)
         except Exception as e:
             print(f"Error saving Excel file: {e}")
@@ -0,0 +1,37 @@
+# file_io/loader_factory.py
+
+"""
+Factory that picks the right loader for a budget file based on its extension.
+
+Abstraction Function:
+- LoaderFactory maps a file path to ExcelLoader or CsvLoader and returns the parsed budget data.
+
+Representation Invariant:
+- Loaders are imported lazily so CSV-only callers never pay for importing pandas.
+"""
+
+import os
+
+
+class LoaderFactory:
+    EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+    CSV_EXTENSIONS = (".csv",)
+
+    @staticmethod
+    def load(path, categorizer=None):
+        """
+        Loads a budget file with the loader matching its extension.
+
+        REQUIRES: path is an existing .xlsx/.xlsm/.xls or .csv file; categorizer is a Categorizer or None
+        MODIFIES: nothing
+        EFFECTS: Returns a dictionary with Income, Balance, and Expenses, with uncategorized CSV
+                 rows labelled by the categorizer, or raises ValueError for unsupported extensions.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension in LoaderFactory.EXCEL_EXTENSIONS:
+            from file_io.excel_loader import ExcelLoader
+            return ExcelLoader.load_budget_data(path)
+        if extension in LoaderFactory.CSV_EXTENSIONS:
+            from file_io.csv_loader import CsvLoader
+            return CsvLoader(categorizer).load_budget_data(path)
+        raise ValueError(f"Unsupported file type: {path}")
@@ -0,0 +1,111 @@
+# file_io/parsed_file_cache.py
+
+"""
+Asynchronous cache of parsed budget files keyed by path, mtime, and content hash.
+
+Abstraction Function:
+- ParsedFileCache returns the parsed budget data for a file, re-parsing only when the
+  file's contents actually changed, and shares one parse between concurrent callers.
+
+Representation Invariant:
+- entries maps absolute path -> (mtime_ns, size, digest, data)
+- pending maps absolute path -> the Future of the parse currently in flight for it
+"""
+
+import asyncio
+import hashlib
+import os
+
+from file_io.loader_factory import LoaderFactory
+
+
+def file_digest(path):
+    """
+    Hashes a file's contents.
+
+    REQUIRES: path is a readable file
+    MODIFIES: nothing
+    EFFECTS: Returns the hex BLAKE2b digest of the file.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParsedFileCache:
+    def __init__(self, loader=LoaderFactory.load):
+        """
+        Creates an empty cache.
+
+        REQUIRES: loader is a callable mapping a path to parsed budget data
+        MODIFIES: self
+        EFFECTS: Initializes empty entry and in-flight tables.
+        """
+        self.loader = loader
+        self.entries = {}
+        self.pending = {}
+
+    async def get(self, path):
+        """
+        Returns (digest, data) for a file, parsing it at most once per content change.
+
+        REQUIRES: path is an existing budget file
+        MODIFIES: self.entries, self.pending
+        EFFECTS: Returns the cached data when mtime/size match or the content hash is unchanged;
+                 otherwise parses the file in a worker thread. Concurrent calls for the same
+                 path await a single parse.
+        """
+        path = os.path.abspath(path)
+        in_flight = self.pending.get(path)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        stat = os.stat(path)
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2], entry[3]
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[path] = future
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(None, self._refresh, path, stat, entry)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so an unawaited failure is not logged
+            raise
+        finally:
+            del self.pending[path]
+        return result
+
+    def _refresh(self, path, stat, entry):
+        """
+        Re-validates or re-parses a file whose mtime or size changed.
+
+        REQUIRES: stat is the current os.stat result for path
+        MODIFIES: self.entries
+        EFFECTS: Reuses the cached data if the content hash still matches; otherwise parses
+                 the file. Returns (digest, data).
+        """
+        digest = file_digest(path)
+        if entry is not None and entry[2] == digest:
+            data = entry[3]
+        else:
+            data = self.loader(path)
+        self.entries[path] = (stat.st_mtime_ns, stat.st_size, digest, data)
+        return digest, data
+
+    def invalidate(self, path=None):
+        """
+        Drops cached entries.
+
+        REQUIRES: nothing
+        MODIFIES: self.entries
+        EFFECTS: Removes the entry for path, or every entry when path is None.
+        """
+        if path is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(os.path.abspath(path), None)
@@ -0,0 +1,61 @@
+# file_io/rate_loader.py
+
+"""
+Loads exchange-rate tables from local CSV files and caches them per file.
+
+Abstraction Function:
+- RateLoader reads rows of Date, Currency, Rate (base-currency units per unit of Currency)
+  into a RateTable, and returns the same table again until the file changes.
+
+Representation Invariant:
+- cache maps absolute path -> (mtime_ns, size, base, RateTable) of the last load.
+"""
+
+import csv
+import os
+
+from models.rate_table import RateTable
+
+
+class RateLoader:
+    cache = {}
+
+    @staticmethod
+    def load(path, base="USD"):
+        """
+        Loads a rate file, reusing the cached table when the file is unchanged.
+
+        REQUIRES: path is a CSV file with Date ('YYYY-MM-DD'), Currency, and Rate columns
+        MODIFIES: RateLoader.cache
+        EFFECTS: Returns a RateTable in the given base currency; raises OSError if the file cannot
+                 be read and ValueError for malformed rows.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = RateLoader.cache.get(path)
+        if entry is not None and entry[:3] == (stat.st_mtime_ns, stat.st_size, base.upper()):
+            return entry[3]
+
+        table = RateTable(base)
+        with open(path, newline="", encoding="utf-8") as f:
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    table.set_rate(row["Currency"].strip(), row["Date"].strip(), float(row["Rate"]))
+                except (KeyError, AttributeError, ValueError) as e:
+                    raise ValueError(f"{path}:{line}: malformed rate row") from e
+        RateLoader.cache[path] = (stat.st_mtime_ns, stat.st_size, base.upper(), table)
+        return table
+
+    @staticmethod
+    def invalidate(path=None):
+        """
+        Drops cached tables.
+
+        REQUIRES: nothing
+        MODIFIES: RateLoader.cache
+        EFFECTS: Removes the entry for path, or every entry when path is None.
+        """
+        if path is None:
+            RateLoader.cache.clear()
+        else:
+            RateLoader.cache.pop(os.path.abspath(path), None)
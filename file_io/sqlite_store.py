@@ -0,0 +1,270 @@
+# file_io/sqlite_store.py
+
+"""
+Optional SQLite storage backend for transactions and expense items.
+
+Abstraction Function:
+- SqliteStore persists transactions and expense items in a local SQLite database
+  so long histories can be queried without holding them all in memory.
+- Dates are stored as 'YYYY-MM-DD' strings, so range queries use plain string comparison.
+- Each stored transaction keeps its row id in Transaction.id, so saving it again updates the
+  row instead of adding a copy, and undoing it can delete exactly that row.
+
+Representation Invariant:
+- The database runs in WAL mode.
+- Tables "transactions" and "expense_items" exist, with indexes on date and category.
+"""
+
+import sqlite3
+
+from models.transaction import Transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL,
+    amount REAL NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    currency TEXT NOT NULL DEFAULT 'USD',
+    household TEXT NOT NULL DEFAULT 'default'
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
+CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions(category, date);
+
+CREATE TABLE IF NOT EXISTS expense_items (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    item TEXT NOT NULL,
+    projected_cost REAL,
+    actual_cost REAL
+);
+CREATE INDEX IF NOT EXISTS idx_expense_items_category ON expense_items(category);
+"""
+
+
+class SqliteStore:
+    BATCH_SIZE = 5000
+
+    def __init__(self, path="money_manager.db"):
+        """
+        Opens (or creates) the SQLite database at the given path.
+
+        REQUIRES: path is a writable file path or ":memory:"
+        MODIFIES: file system
+        EFFECTS: Connects in WAL mode and ensures the schema and indexes exist, adding the
+                 currency and household columns to databases created before they existed.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(transactions)")}
+        if "currency" not in columns:
+            self.connection.execute("ALTER TABLE transactions ADD COLUMN currency TEXT NOT NULL DEFAULT 'USD'")
+        if "household" not in columns:
+            self.connection.execute(
+                f"ALTER TABLE transactions ADD COLUMN household TEXT NOT NULL DEFAULT '{Transaction.DEFAULT_HOUSEHOLD}'"
+            )
+        self.connection.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        REQUIRES: nothing
+        MODIFIES: self.connection
+        EFFECTS: Releases the underlying SQLite connection.
+        """
+        self.connection.close()
+
+    def insert_transactions(self, transactions):
+        """
+        Writes transactions to the store in batches.
+
+        REQUIRES: transactions is an iterable of Transaction objects
+        MODIFIES: database, the transactions' ids
+        EFFECTS: Inside a single commit, gives each transaction without an id the next free row id
+                 and upserts every transaction by id; returns the number of rows written.
+        """
+        written = 0
+        batch = []
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")  # No other writer may take the ids we hand out
+            next_id = self.connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM transactions").fetchone()[0]
+            for t in transactions:
+                if t.id is None:
+                    t.id = next_id
+                    next_id += 1
+                batch.append((t.id, t.date, t.category, t.amount, t.description, t.currency, t.household))
+                if len(batch) >= self.BATCH_SIZE:
+                    self._insert_transaction_batch(batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                self._insert_transaction_batch(batch)
+                written += len(batch)
+        return written
+
+    def _insert_transaction_batch(self, batch):
+        """
+        Writes one batch of transaction rows.
+
+        REQUIRES: batch is a list of (id, date, category, amount, description, currency, household) tuples
+        MODIFIES: database
+        EFFECTS: Inserts or replaces the batch's rows with a single executemany call.
+        """
+        self.connection.executemany(
+            "INSERT INTO transactions (id, date, category, amount, description, currency, household) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET date = excluded.date, category = excluded.category, "
+            "amount = excluded.amount, description = excluded.description, "
+            "currency = excluded.currency, household = excluded.household",
+            batch
+        )
+
+    def delete_transactions(self, transactions):
+        """
+        Deletes stored transactions.
+
+        REQUIRES: transactions is an iterable of Transaction objects
+        MODIFIES: database, the transactions' ids
+        EFFECTS: Deletes the rows of those with an id in one commit and clears their ids, so saving
+                 them again inserts fresh rows; returns the number of rows deleted.
+        """
+        stored = [t for t in transactions if t.id is not None]
+        with self.connection:
+            cursor = self.connection.executemany("DELETE FROM transactions WHERE id = ?", [(t.id,) for t in stored])
+        for t in stored:
+            t.id = None
+        return cursor.rowcount
+
+    def replace_expense_items(self, expenses):
+        """
+        Stores the expense items of a session, replacing the given categories.
+
+        REQUIRES: expenses is a dict mapping category -> list of item dicts
+        MODIFIES: database
+        EFFECTS: Deletes stored rows for each given category and inserts the new ones in one commit.
+        """
+        with self.connection:
+            for category, items in expenses.items():
+                self.connection.execute("DELETE FROM expense_items WHERE category = ?", (category,))
+                self.connection.executemany(
+                    "INSERT INTO expense_items (category, item, projected_cost, actual_cost) VALUES (?, ?, ?, ?)",
+                    [
+                        (category, str(item["Item"]), item["Projected Cost"], item["Actual Cost"])
+                        for item in items
+                    ]
+                )
+
+    def load_expense_items(self):
+        """
+        Reads all stored expense items.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping category -> list of item dicts, in insertion order.
+        """
+        expenses = {}
+        rows = self.connection.execute(
+            "SELECT category, item, projected_cost, actual_cost FROM expense_items ORDER BY id"
+        )
+        for category, item, projected, actual in rows:
+            expenses.setdefault(category, []).append({
+                "Item": item,
+                "Projected Cost": projected,
+                "Actual Cost": actual
+            })
+        return expenses
+
+    def transactions_in_range(self, start_date=None, end_date=None, category=None):
+        """
+        Returns stored transactions within a date range.
+
+        REQUIRES: start_date and end_date are 'YYYY-MM-DD' strings or None
+        MODIFIES: nothing
+        EFFECTS: Returns Transaction objects (with their ids) with start_date <= date <= end_date,
+                 optionally limited to one category, ordered by date.
+        """
+        where, params = self._range_filter(start_date, end_date, category)
+        rows = self.connection.execute(
+            f"SELECT id, date, category, amount, description, currency, household FROM transactions{where} "
+            "ORDER BY date, id",
+            params
+        )
+        transactions = []
+        for row in rows:
+            t = Transaction(*row[1:])
+            t.id = row[0]
+            transactions.append(t)
+        return transactions
+
+    def total_by_category(self, start_date=None, end_date=None):
+        """
+        Sums transaction amounts per category.
+
+        REQUIRES: start_date and end_date are 'YYYY-MM-DD' strings or None
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping category -> total amount within the range, summed as stored
+                 (use BudgetManager.set_reporting_currency for converted totals).
+        """
+        where, params = self._range_filter(start_date, end_date)
+        rows = self.connection.execute(
+            f"SELECT category, SUM(amount) FROM transactions{where} GROUP BY category",
+            params
+        )
+        return dict(rows)
+
+    def total_by_period(self, period="month", start_date=None, end_date=None, category=None):
+        """
+        Sums transaction amounts per day, month, or year.
+
+        REQUIRES: period is one of "day", "month", "year"
+        MODIFIES: nothing
+        EFFECTS: Returns an ordered list of (period_key, total) tuples, e.g. ("2024-03", 120.0).
+        """
+        lengths = {"day": 10, "month": 7, "year": 4}
+        if period not in lengths:
+            raise ValueError(f"Unknown period: {period}")
+        where, params = self._range_filter(start_date, end_date, category)
+        key = f"substr(date, 1, {lengths[period]})"
+        rows = self.connection.execute(
+            f"SELECT {key} AS period, SUM(amount) FROM transactions{where} GROUP BY period ORDER BY period",
+            params
+        )
+        return list(rows)
+
+    def count_transactions(self):
+        """
+        Returns the number of stored transactions.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns the row count of the transactions table.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    @staticmethod
+    def _range_filter(start_date=None, end_date=None, category=None):
+        """
+        Builds a WHERE clause for the optional date range and category.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns (sql_fragment, params) usable in a parameterized query.
+        """
+        clauses = []
+        params = []
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if start_date is not None:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date is not None:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
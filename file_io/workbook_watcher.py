@@ -0,0 +1,139 @@
+# file_io/workbook_watcher.py
+
+"""
+Detects edits to a loaded workbook and re-parses only the sheets that changed.
+
+Abstraction Function:
+- WorkbookWatcher remembers the mtime and per-sheet fingerprints of one workbook.
+- check() compares them with the file on disk, reloads just the changed sheets, and patches
+  the session's budget data in place.
+
+Representation Invariant:
+- fingerprints describes the workbook as of the last successful check (or load).
+- An empty fingerprints dict means sheet-level detection is unavailable and any change
+  triggers a full reload.
+"""
+
+import os
+
+from file_io.excel_loader import ExcelLoader
+
+
+class WorkbookChanges:
+    def __init__(self, categories=(), summary=False):
+        """
+        Describes what a reload changed.
+
+        REQUIRES: categories is an iterable of uppercase category names
+        MODIFIES: self
+        EFFECTS: Stores the changed (added, edited or removed) categories and whether
+                 Income or Balance changed.
+        """
+        self.categories = set(categories)
+        self.summary = summary
+
+    def __bool__(self):
+        """
+        Reports whether anything changed.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns True if any category or the summary sheets changed.
+        """
+        return bool(self.categories) or self.summary
+
+
+class WorkbookWatcher:
+    def __init__(self, path):
+        """
+        Starts tracking a workbook.
+
+        REQUIRES: path is an existing workbook that was just loaded
+        MODIFIES: self
+        EFFECTS: Records the file's current mtime and sheet fingerprints.
+        """
+        self.path = path
+        self.mtime = self._mtime()
+        self.fingerprints = ExcelLoader.sheet_fingerprints(path)
+
+    def _mtime(self):
+        """
+        Reads the workbook's modification time.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns st_mtime_ns, or None if the file is currently missing.
+        """
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def has_changed(self):
+        """
+        Cheap polling check used when no file-system notifications are available.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns True if the file exists and its mtime differs from the last check.
+        """
+        mtime = self._mtime()
+        return mtime is not None and mtime != self.mtime
+
+    def check(self, budget_data):
+        """
+        Reloads changed sheets and patches budget_data in place.
+
+        REQUIRES: budget_data was loaded from self.path
+        MODIFIES: budget_data, self
+        EFFECTS: Returns a WorkbookChanges describing what was patched; it is empty when
+                 nothing changed or the file could not be read (e.g. mid-save).
+        """
+        mtime = self._mtime()
+        if mtime is None or mtime == self.mtime:
+            return WorkbookChanges()
+
+        fingerprints = ExcelLoader.sheet_fingerprints(self.path)
+        if not fingerprints or not self.fingerprints:
+            return self._full_reload(budget_data, mtime, fingerprints)
+
+        changed = [name for name, digest in fingerprints.items() if self.fingerprints.get(name) != digest]
+        removed = [name for name in self.fingerprints if name not in fingerprints]
+        if any(name in ExcelLoader.SUMMARY_SHEETS for name in removed):
+            return self._full_reload(budget_data, mtime, fingerprints)
+
+        patch = ExcelLoader.load_sheets(self.path, changed) if changed else {"Expenses": {}}
+        if not patch:
+            return WorkbookChanges()
+
+        for name in ExcelLoader.SUMMARY_SHEETS:
+            if name in patch:
+                budget_data[name] = patch[name]
+        budget_data["Expenses"].update(patch["Expenses"])
+        for name in removed:
+            budget_data["Expenses"].pop(name.upper(), None)
+
+        self.mtime = mtime
+        self.fingerprints = fingerprints
+        return WorkbookChanges(
+            [name.upper() for name in changed + removed if name not in ExcelLoader.SUMMARY_SHEETS],
+            any(name in ExcelLoader.SUMMARY_SHEETS for name in changed)
+        )
+
+    def _full_reload(self, budget_data, mtime, fingerprints):
+        """
+        Falls back to re-reading the whole workbook.
+
+        REQUIRES: budget_data was loaded from self.path
+        MODIFIES: budget_data, self
+        EFFECTS: Replaces budget_data's contents and reports every category as changed.
+        """
+        data = ExcelLoader.load_budget_data(self.path)
+        if not data:
+            return WorkbookChanges()
+        categories = set(budget_data.get("Expenses", {})) | set(data["Expenses"])
+        budget_data.clear()
+        budget_data.update(data)
+        self.mtime = mtime
+        self.fingerprints = fingerprints
+        return WorkbookChanges(categories, True)
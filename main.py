@@ -9,10 +9,13 @@ Abstraction Function:
 Representation Invariant:
 - App starts in full-screen mode.
 - Screens are properly registered in the QStackedWidget.
+- The BudgetManager has a SqliteStore attached for the whole run.
 """
 
 import sys
 from PyQt6.QtWidgets import QApplication, QStackedWidget
+from app.budget_manager import BudgetManager
+from file_io.sqlite_store import SqliteStore
 from ui.welcome_screen import WelcomeScreen
 from ui.main_window import MainWindow
 
@@ -22,9 +25,12 @@ def main():
 
     REQUIRES: Python 3.8+, PyQt6 installed
     MODIFIES: UI window
-    EFFECTS: Displays the full-screen budget management app.
+    EFFECTS: Displays the full-screen budget management app, persisting sessions to the local
+             SQLite database.
     """
     app = QApplication(sys.argv)
+    store = SqliteStore()
+    BudgetManager().attach_store(store)
     stacked_widget = QStackedWidget()
 
     # Screens
@@ -43,7 +49,9 @@ def main():
     stacked_widget.setCurrentWidget(welcome)
     stacked_widget.showFullScreen()
 
-    sys.exit(app.exec())
+    status = app.exec()
+    store.close()
+    sys.exit(status)
 
 if __name__ == "__main__":
     main()
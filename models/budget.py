@@ -6,6 +6,7 @@ Represents the user's budget configuration and tracking for their expenses.
 Abstraction Function:
 - A Budget represents the user's budget limit and total money spent.
 - It tracks the remaining amount and whether the user is over budget.
+- Amounts are in currency, the reporting currency spending is converted to.
 
 Representation Invariant:
 - budget_limit >= 0
@@ -13,16 +14,17 @@ Representation Invariant:
 """
 
 class Budget:
-    def __init__(self, budget_limit=0.0):
+    def __init__(self, budget_limit=0.0, currency="USD"):
         """
         Constructs a new Budget with an optional limit.
 
         REQUIRES: budget_limit >= 0
         MODIFIES: self
-        EFFECTS: Initializes the budget with a given limit and resets total spent.
+        EFFECTS: Initializes the budget with a given limit and currency and resets total spent.
         """
         self.budget_limit = max(0.0, budget_limit)
         self.total_spent = 0.0
+        self.currency = currency.upper()
 
     def update_spent(self, amount):
         """
@@ -0,0 +1,223 @@
+# models/budget_table.py
+
+"""
+Represents many budgets at once, one per (household, category, period).
+
+Abstraction Function:
+- Row i of a BudgetTable is the budget keys[i] with limit limits[i] and spending spent[i].
+- Limits and spending are NumPy arrays aligned with the rows, so remaining amounts and
+  over-budget flags are evaluated for all budgets in one vectorized pass, and only budgets
+  whose spending or limit changed since the last evaluation (dirty rows) are re-checked.
+- Spending is kept up to date incrementally: every transaction added or removed is charged to
+  its (household, category, month) key, including keys that have no budget yet, so creating a
+  budget never rescans the transactions.
+- Like Budget, remaining is never negative and a budget is over when spent > limit.
+
+Representation Invariant:
+- index maps each key to its row; keys[index[k]] == k
+- unbudgeted maps keys without a row to the spending charged to them so far
+- limits >= 0 and spent >= 0 for every row
+- remaining[i] and over[i] are current for every row with dirty[i] == False
+"""
+
+import numpy as np
+
+from models.transaction import Transaction
+
+
+class BudgetTable:
+    DEFAULT_HOUSEHOLD = Transaction.DEFAULT_HOUSEHOLD
+
+    def __init__(self, capacity=64):
+        """
+        Creates an empty table.
+
+        REQUIRES: capacity > 0
+        MODIFIES: self
+        EFFECTS: Preallocates arrays for capacity budgets.
+        """
+        self.keys = []
+        self.index = {}
+        self.unbudgeted = {}
+        self.limits = np.zeros(capacity)
+        self.spent = np.zeros(capacity)
+        self.remaining = np.zeros(capacity)
+        self.over = np.zeros(capacity, dtype=bool)
+        self.dirty = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        """
+        Returns the number of budgets.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns len(self.keys).
+        """
+        return len(self.keys)
+
+    @staticmethod
+    def period_of(date):
+        """
+        Maps a transaction date to its budget period.
+
+        REQUIRES: date is a 'YYYY-MM-DD' string
+        MODIFIES: nothing
+        EFFECTS: Returns the month, 'YYYY-MM'.
+        """
+        return str(date)[:7]
+
+    def _row(self, key):
+        """
+        Finds or creates the row of a key.
+
+        REQUIRES: key is a (household, category, period) tuple
+        MODIFIES: self
+        EFFECTS: Returns the row index, growing the arrays geometrically when full. A new row
+                 starts with the spending already charged to its key.
+        """
+        row = self.index.get(key)
+        if row is not None:
+            return row
+        row = len(self.keys)
+        if row == len(self.limits):
+            size = 2 * row
+            for name in ("limits", "spent", "remaining", "over", "dirty"):
+                old = getattr(self, name)
+                new = np.zeros(size, dtype=old.dtype)
+                new[:row] = old
+                setattr(self, name, new)
+        self.keys.append(key)
+        self.index[key] = row
+        self.spent[row] = max(0.0, self.unbudgeted.pop(key, 0.0))
+        self.dirty[row] = True
+        return row
+
+    def set_limit(self, category, period, amount, household=DEFAULT_HOUSEHOLD):
+        """
+        Sets the limit of one budget, creating it if needed.
+
+        REQUIRES: amount >= 0
+        MODIFIES: self
+        EFFECTS: Stores the limit and marks the budget for re-evaluation.
+        """
+        row = self._row((household, category, period))
+        self.limits[row] = max(0.0, amount)
+        self.dirty[row] = True
+
+    def set_limits(self, budgets):
+        """
+        Sets many limits at once.
+
+        REQUIRES: budgets is an iterable of (household, category, period, amount)
+        MODIFIES: self
+        EFFECTS: Stores every limit and marks those budgets for re-evaluation.
+        """
+        for household, category, period, amount in budgets:
+            self.set_limit(category, period, amount, household)
+
+    def add_spent(self, category, period, amount, household=DEFAULT_HOUSEHOLD):
+        """
+        Adds (or, with a negative amount, removes) spending for one budget.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Updates the budget's spending if it exists; otherwise remembers the spending for
+                 a budget created later.
+        """
+        if not amount:
+            return
+        key = (household, category, period)
+        row = self.index.get(key)
+        if row is None:
+            self.unbudgeted[key] = self.unbudgeted.get(key, 0.0) + amount
+        else:
+            self.spent[row] = max(0.0, self.spent[row] + amount)
+            self.dirty[row] = True
+
+    def add_spending(self, transactions, amounts=None):
+        """
+        Charges many transactions at once, e.g. a bulk import.
+
+        REQUIRES: transactions is a sequence of Transaction; amounts is None or an array aligned
+                  with transactions (e.g. converted to the reporting currency)
+        MODIFIES: self
+        EFFECTS: Groups the transactions by (household, category, month), sums each group in one
+                 bincount, and charges the sums, using amounts in place of the transactions' own
+                 amounts when given. Costs time linear in len(transactions) only.
+        """
+        n = len(transactions)
+        groups = {}
+        codes = np.fromiter(
+            (groups.setdefault((t.household, t.category, self.period_of(t.date)), len(groups)) for t in transactions),
+            dtype=np.int64, count=n
+        )
+        if amounts is None:
+            weights = np.fromiter((t.amount for t in transactions), dtype=float, count=n)
+        else:
+            weights = np.asarray(amounts, dtype=float)
+        sums = np.bincount(codes, weights=weights, minlength=len(groups))
+        for (household, category, period), code in groups.items():
+            self.add_spent(category, period, float(sums[code]), household)
+
+    def replace_spending(self, transactions, amounts=None):
+        """
+        Recomputes all spending, e.g. after amounts were converted at new rates.
+
+        REQUIRES: as for add_spending
+        MODIFIES: self
+        EFFECTS: Discards the spending charged so far, charges the transactions afresh, and marks
+                 only budgets whose spending changed as dirty.
+        """
+        n = len(self)
+        before = self.spent[:n].copy()
+        dirty = self.dirty[:n].copy()
+        self.spent[:n] = 0.0
+        self.unbudgeted = {}
+        self.add_spending(transactions, amounts)
+        self.dirty[:n] = dirty | (self.spent[:n] != before)
+
+    def evaluate(self):
+        """
+        Re-checks every dirty budget in one vectorized pass.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Updates remaining and over for dirty rows, clears their dirty flags, and returns
+                 the indices of the rows that were re-checked.
+        """
+        rows = np.flatnonzero(self.dirty[:len(self)])
+        if len(rows):
+            limits = self.limits[rows]
+            spent = self.spent[rows]
+            self.remaining[rows] = np.maximum(limits - spent, 0.0)
+            self.over[rows] = spent > limits
+            self.dirty[rows] = False
+        return rows
+
+    def over_budget(self):
+        """
+        Lists the budgets that are exceeded.
+
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS: Evaluates pending changes and returns the keys of over-budget rows.
+        """
+        self.evaluate()
+        return [self.keys[row] for row in np.flatnonzero(self.over[:len(self)])]
+
+    def status(self, category, period, household=DEFAULT_HOUSEHOLD):
+        """
+        Reports one budget.
+
+        REQUIRES: the budget exists
+        MODIFIES: self
+        EFFECTS: Returns a dict with limit, spent, remaining, and over_budget.
+        """
+        self.evaluate()
+        row = self.index[(household, category, period)]
+        return {
+            "limit": float(self.limits[row]),
+            "spent": float(self.spent[row]),
+            "remaining": float(self.remaining[row]),
+            "over_budget": bool(self.over[row])
+        }
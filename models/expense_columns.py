@@ -0,0 +1,202 @@
+# models/expense_columns.py
+
+"""
+Stores one expense category column by column instead of as a list of row dicts.
+
+Abstraction Function:
+- ExpenseColumns is the sequence of rows ExpenseRow(self, i), where row i has
+  "Item" names[i], "Projected Cost" projected[i], and "Actual Cost" actual[i].
+- Costs live in float64 NumPy arrays (8 bytes per value instead of a float object and a dict
+  slot), so column totals are computed with one vectorized call.
+- An ExpenseRow is a read-only mapping onto its row, so item["Actual Cost"] and
+  item.get("Item") work as they do on the dicts the loaders used to return.
+
+Representation Invariant:
+- len(names) == len(projected) == len(actual)
+- projected and actual are read-only; missing costs are stored as NaN.
+- Instances are never mutated; editing a category replaces it with a list of dicts.
+"""
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+
+class ExpenseRow(Mapping):
+    __slots__ = ("columns", "row")
+
+    def __init__(self, columns, row):
+        """
+        Constructs a view of one row.
+
+        REQUIRES: 0 <= row < len(columns)
+        MODIFIES: self
+        EFFECTS: Creates a mapping that reads the row from columns.
+        """
+        self.columns = columns
+        self.row = row
+
+    def __getitem__(self, key):
+        """
+        Reads one cell.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns the cell's value as a Python object, or raises KeyError for unknown keys.
+        """
+        if key == "Item":
+            return self.columns.names[self.row]
+        if key == "Projected Cost":
+            return float(self.columns.projected[self.row])
+        if key == "Actual Cost":
+            return float(self.columns.actual[self.row])
+        raise KeyError(key)
+
+    def __iter__(self):
+        """
+        Iterates over the column names.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Yields the keys of ExpenseColumns.COLUMNS.
+        """
+        return iter(ExpenseColumns.COLUMNS)
+
+    def __len__(self):
+        """
+        Returns the number of cells.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns 3.
+        """
+        return len(ExpenseColumns.COLUMNS)
+
+    def __repr__(self):
+        """
+        Describes the row.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns the repr of the row as a dict.
+        """
+        return repr(dict(self))
+
+
+class ExpenseColumns(Sequence):
+    COLUMNS = ("Item", "Projected Cost", "Actual Cost")
+
+    def __init__(self, names, projected, actual):
+        """
+        Builds a category from its columns.
+
+        REQUIRES: names, projected, and actual have equal lengths
+        MODIFIES: self
+        EFFECTS: Stores names as a tuple and costs as read-only float64 arrays.
+        """
+        self.names = tuple(names)
+        self.projected = ExpenseColumns._costs(projected)
+        self.actual = ExpenseColumns._costs(actual)
+        if not len(self.names) == len(self.projected) == len(self.actual):
+            raise ValueError("Expense columns must have equal lengths")
+
+    @staticmethod
+    def _costs(values):
+        """
+        Converts a cost column to a read-only array.
+
+        REQUIRES: values is a sequence of numbers, None, or NaN
+        MODIFIES: nothing
+        EFFECTS: Returns a float64 array with None stored as NaN.
+        """
+        array = np.array(values, dtype=float)
+        array.setflags(write=False)
+        return array
+
+    @staticmethod
+    def from_frame(df):
+        """
+        Builds a category from a parsed sheet.
+
+        REQUIRES: df is a pandas DataFrame
+        MODIFIES: nothing
+        EFFECTS: Returns an ExpenseColumns when df has exactly the template columns with numeric
+                 costs, otherwise None so callers can keep the sheet as row dicts.
+        """
+        if list(df.columns) != list(ExpenseColumns.COLUMNS):
+            return None
+        try:
+            return ExpenseColumns(
+                df["Item"].tolist(),
+                df["Projected Cost"].to_numpy(dtype=float, na_value=np.nan),
+                df["Actual Cost"].to_numpy(dtype=float, na_value=np.nan)
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns len(self.names).
+        """
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        Returns a row view, or a list of row views for a slice.
+
+        REQUIRES: index is an int or slice
+        MODIFIES: nothing
+        EFFECTS: Returns ExpenseRow(s); raises IndexError when out of range.
+        """
+        if isinstance(index, slice):
+            return [ExpenseRow(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("expense row out of range")
+        return ExpenseRow(self, index)
+
+    def __iter__(self):
+        """
+        Iterates over the rows.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Yields an ExpenseRow per row, in order.
+        """
+        return (ExpenseRow(self, i) for i in range(len(self)))
+
+    def total(self, column="Actual Cost"):
+        """
+        Sums a cost column.
+
+        REQUIRES: column is "Projected Cost" or "Actual Cost"
+        MODIFIES: nothing
+        EFFECTS: Returns the total as a float, with NaN (missing) costs counted as 0.0.
+        """
+        values = self.projected if column == "Projected Cost" else self.actual
+        return float(np.nansum(values))
+
+    def to_columns(self):
+        """
+        Exposes the columns for bulk consumers such as pandas.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns a dict mapping each column name to its values.
+        """
+        return {"Item": list(self.names), "Projected Cost": self.projected, "Actual Cost": self.actual}
+
+    def to_records(self):
+        """
+        Copies the rows into editable dicts.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns a list of item dicts equal to the rows.
+        """
+        return [dict(row) for row in self]
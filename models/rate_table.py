@@ -0,0 +1,121 @@
+# models/rate_table.py
+
+"""
+Exchange rates indexed by (currency, date).
+
+Abstraction Function:
+- A RateTable maps (currency, date) to the number of base-currency units one unit of that
+  currency was worth on that date. A date without its own rate uses the most recent earlier
+  rate, and dates before a currency's first rate use that first rate.
+- Each currency's rates are kept as parallel NumPy arrays of day numbers and rates, so a whole
+  column of (currency, date) pairs is looked up with one searchsorted per currency.
+
+Representation Invariant:
+- rates[base] is never stored; the base currency always converts at 1.0.
+- For each currency, days is sorted ascending without repeats and aligned with its rates; rows
+  added by set_rate wait in pending until the next lookup.
+- version increases on every change, so results derived from the table can be memoized on it.
+"""
+
+import numpy as np
+
+
+class RateTable:
+    def __init__(self, base="USD"):
+        """
+        Creates an empty table.
+
+        REQUIRES: base is an ISO 4217 code
+        MODIFIES: self
+        EFFECTS: Only the base currency can be converted until rates are added.
+        """
+        self.base = base.upper()
+        self.rates = {}
+        self.pending = {}
+        self.version = 0
+
+    @staticmethod
+    def day_numbers(dates):
+        """
+        Converts dates to day numbers.
+
+        REQUIRES: dates is a 'YYYY-MM-DD' string or a sequence of them
+        MODIFIES: nothing
+        EFFECTS: Returns days since 1970-01-01 as an int64 array (or a 0-d array for one date).
+        """
+        return np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+
+    def set_rate(self, currency, date, rate):
+        """
+        Records the rate of a currency on a date.
+
+        REQUIRES: rate > 0; date is a 'YYYY-MM-DD' string
+        MODIFIES: self
+        EFFECTS: Adds or replaces the rate and bumps version.
+        """
+        currency = currency.upper()
+        if currency == self.base:
+            return
+        self.pending.setdefault(currency, {})[int(self.day_numbers(date))] = float(rate)
+        self.version += 1
+
+    def currencies(self):
+        """
+        Lists the currencies that can be converted.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns a sorted list including the base currency.
+        """
+        return sorted(set(self.rates) | set(self.pending) | {self.base})
+
+    def _series(self, currency):
+        """
+        Returns a currency's rates, merging rows waiting in pending.
+
+        REQUIRES: currency is uppercase
+        MODIFIES: self.rates, self.pending
+        EFFECTS: Returns (days, rates) arrays, or raises KeyError if the currency has no rates.
+        """
+        added = self.pending.pop(currency, None)
+        if added:
+            days, rates = self.rates.get(currency, (np.empty(0, dtype=np.int64), np.empty(0)))
+            merged = dict(zip(days.tolist(), rates.tolist()))
+            merged.update(added)
+            days = np.array(sorted(merged), dtype=np.int64)
+            self.rates[currency] = (days, np.array([merged[day] for day in days.tolist()]))
+        if currency not in self.rates:
+            raise KeyError(f"No exchange rate for {currency}")
+        return self.rates[currency]
+
+    def rate(self, currency, date):
+        """
+        Looks up one rate.
+
+        REQUIRES: date is a 'YYYY-MM-DD' string
+        MODIFIES: self.rates, self.pending
+        EFFECTS: Returns the base-currency value of one unit of currency on date, or raises
+                 KeyError if the currency has no rates.
+        """
+        currency = currency.upper()
+        if currency == self.base:
+            return 1.0
+        days, rates = self._series(currency)
+        position = np.searchsorted(days, int(self.day_numbers(date)), side="right") - 1
+        return float(rates[max(position, 0)])
+
+    def rates_for(self, currency, days):
+        """
+        Looks up one currency's rates on many days.
+
+        REQUIRES: days is an int64 array of day numbers (see day_numbers)
+        MODIFIES: self.rates, self.pending
+        EFFECTS: Returns a float array of base-currency values per unit, or raises KeyError if the
+                 currency has no rates.
+        """
+        currency = currency.upper()
+        if currency == self.base:
+            return np.ones(len(days))
+        series_days, rates = self._series(currency)
+        positions = np.searchsorted(series_days, days, side="right") - 1
+        return rates[np.maximum(positions, 0)]
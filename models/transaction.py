@@ -5,27 +5,36 @@ Represents a single expense or financial transaction.
 
 Abstraction Function:
 - Each Transaction stores when the transaction occurred, what it was for,
-  how much it cost, and a short description of the item/service.
+  how much it cost (in its currency), and a short description of the item/service.
 
 Representation Invariant:
 - date != None and is a string in format 'YYYY-MM-DD'
 - category != None
 - amount >= 0
+- currency is an uppercase ISO 4217 code, "USD" unless given
+- household names whose budgets the transaction counts against, DEFAULT_HOUSEHOLD unless given
+- id is None until the transaction is persisted, then its row id in the store
 """
 
 class Transaction:
-    def __init__(self, date, category, amount, description=""):
+    DEFAULT_HOUSEHOLD = "default"
+
+    def __init__(self, date, category, amount, description="", currency="USD", household=DEFAULT_HOUSEHOLD):
         """
         Constructs a new Transaction with given attributes.
 
         REQUIRES: date and category are not None; amount >= 0
         MODIFIES: self
-        EFFECTS: Initializes a transaction with date, category, amount, and optional description.
+        EFFECTS: Initializes a transaction with date, category, amount, and optional description,
+                 currency, and household.
         """
         self.date = date
         self.category = category
         self.amount = max(0.0, amount)
         self.description = description
+        self.currency = currency.upper()
+        self.household = household
+        self.id = None
 
     def to_dict(self):
         """
@@ -39,5 +48,7 @@ class Transaction:
             "Date": self.date,
             "Category": self.category,
             "Amount": self.amount,
-            "Description": self.description
+            "Description": self.description,
+            "Currency": self.currency,
+            "Household": self.household
         }
@@ -0,0 +1,17 @@
+# report.py
+
+"""
+Launches headless batch reporting for budget files.
+
+Abstraction Function:
+- Report forwards command-line arguments to app.batch_report without starting the GUI.
+
+Representation Invariant:
+- PyQt6 is never imported.
+"""
+
+import sys
+from app.batch_report import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+# serve.py
+
+"""
+Launches the local budget summary HTTP service.
+
+Abstraction Function:
+- Serve forwards command-line arguments to app.summary_service without starting the GUI.
+
+Representation Invariant:
+- PyQt6 is never imported.
+"""
+
+from app.summary_service import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# tests/test_deduplicator.py
+
+"""
+Checks Deduplicator against brute-force comparisons on randomized rows.
+"""
+
+import random
+from datetime import date as Date, timedelta
+
+import pytest
+
+from app.deduplicator import BloomFilter, Deduplicator
+from models.transaction import Transaction
+
+START = Date(2024, 1, 1)
+
+
+def random_transactions(rng, count, span=20):
+    return [
+        Transaction(
+            (START + timedelta(days=rng.randrange(span))).isoformat(),
+            rng.choice(["FOOD", "HOUSING"]),
+            rng.choice([1, 1.5, 2, 2.01, 3, 10]),
+            rng.choice(["Coffee", "coffee ", "  COFFEE", "rent", ""])
+        )
+        for _ in range(count)
+    ]
+
+
+def brute_force_near(transactions, days, tolerance, match_description):
+    pairs = []
+    for i, a in enumerate(transactions):
+        for j in range(i + 1, len(transactions)):
+            b = transactions[j]
+            if a.category != b.category:
+                continue
+            if abs(Deduplicator.cents(a.amount) - Deduplicator.cents(b.amount)) > Deduplicator.cents(tolerance):
+                continue
+            if abs(Date.fromisoformat(a.date).toordinal() - Date.fromisoformat(b.date).toordinal()) > days:
+                continue
+            if match_description and Deduplicator.normalize_text(a.description) != \
+                    Deduplicator.normalize_text(b.description):
+                continue
+            pairs.append((i, j))
+    return pairs
+
+
+def key(transaction):
+    return (transaction.date, Deduplicator.cents(transaction.amount), transaction.category,
+            Deduplicator.normalize_text(transaction.description))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_near_duplicates_match_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(20):
+        transactions = random_transactions(rng, rng.randrange(0, 60), span=rng.choice([3, 20, 400]))
+        days = rng.randrange(0, 6)
+        tolerance = rng.choice([0.0, 0.01, 0.5, 1.0, 10.0])
+        match_description = rng.random() < 0.5
+        assert Deduplicator.near_duplicates(transactions, days, tolerance, match_description) == \
+            brute_force_near(transactions, days, tolerance, match_description)
+
+
+def test_near_duplicates_skip_unparseable_dates():
+    transactions = [Transaction("2024-01-01", "FOOD", 5.0, "x"), Transaction("not a date", "FOOD", 5.0, "x"),
+                    Transaction("2024-01-02", "FOOD", 5.0, "x")]
+    assert Deduplicator.near_duplicates(transactions, days=1) == [(0, 2)]
+
+
+@pytest.mark.parametrize("use_bloom", [False, True])
+def test_partition_matches_brute_force(use_bloom):
+    rng = random.Random(7)
+    deduplicator = Deduplicator(use_bloom=use_bloom, capacity=10000)
+    seen = set()
+    for _ in range(20):
+        batch = random_transactions(rng, 50)
+        unique, duplicates = deduplicator.partition_transactions(batch)
+        expected_unique = []
+        for transaction in batch:
+            if key(transaction) not in seen:
+                seen.add(key(transaction))
+                expected_unique.append(transaction)
+        if use_bloom:
+            # A Bloom filter may flag a unique row, but never misses a duplicate
+            assert set(map(id, unique)) <= set(map(id, expected_unique))
+        else:
+            assert unique == expected_unique
+        assert len(unique) + len(duplicates) == len(batch)
+
+
+def test_fingerprint_ignores_formatting():
+    assert Deduplicator.fingerprint("2024-01-01", 5, "food", "  Coffee   Shop") == \
+        Deduplicator.fingerprint(" 2024-01-01", 5.001, "FOOD", "coffee shop")
+    assert Deduplicator.fingerprint("2024-01-01", 5, "FOOD", "coffee") != \
+        Deduplicator.fingerprint("2024-01-01", 5.01, "FOOD", "coffee")
+
+
+def test_forget_allows_a_row_again():
+    deduplicator = Deduplicator()
+    fingerprint = Deduplicator.fingerprint("2024-01-01", 5, "FOOD", "coffee")
+    assert not deduplicator.register(fingerprint)
+    assert deduplicator.register(fingerprint)
+    deduplicator.forget(fingerprint)
+    assert not deduplicator.register(fingerprint)
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    rng = random.Random(11)
+    capacity, error_rate = 20000, 0.01
+    bloom = BloomFilter(capacity, error_rate)
+    added = {rng.getrandbits(64) for _ in range(capacity)}
+    for fingerprint in added:
+        bloom.add(fingerprint)
+    assert all(fingerprint in bloom for fingerprint in added)
+    others = [f for f in (rng.getrandbits(64) for _ in range(20000)) if f not in added]
+    false_positives = sum(fingerprint in bloom for fingerprint in others)
+    assert false_positives / len(others) < 3 * error_rate
+
+
+def test_merge_expenses_drops_incoming_rows_already_present():
+    base = {
+        "FOOD": [{"Item": "Coffee", "Projected Cost": 5, "Actual Cost": 4},
+                 {"Item": "Coffee", "Projected Cost": 5, "Actual Cost": 4}],
+        "RENT": [{"Item": "rent", "Projected Cost": 900, "Actual Cost": 900}]
+    }
+    incoming = {
+        "FOOD": [{"Item": " coffee", "Projected Cost": 5.001, "Actual Cost": 4},
+                 {"Item": "Tea", "Projected Cost": 2, "Actual Cost": 2}],
+        "RENT": [{"Item": "rent", "Projected Cost": 900, "Actual Cost": 900}],
+        "PETS": []
+    }
+    merged, duplicates = Deduplicator().merge_expenses(base, incoming)
+    # Repeats within base are kept
+    assert [item["Item"] for item in merged["FOOD"]] == ["Coffee", "Coffee", "Tea"]
+    # Categories without new rows keep base's container
+    assert merged["RENT"] is base["RENT"]
+    assert merged["PETS"] == []
+    assert [(category, item["Item"]) for category, item in duplicates] == [("FOOD", " coffee"), ("RENT", "rent")]
+    assert base["FOOD"][-1]["Item"] == "Coffee"  # Base is not modified
+
+
+def test_merge_expenses_drops_repeats_within_one_incoming_sheet():
+    row = {"Item": "Gym", "Projected Cost": 30, "Actual Cost": 30}
+    merged, duplicates = Deduplicator().merge_expenses({}, {"HEALTH": [row, dict(row), dict(row)]})
+    assert merged["HEALTH"] == [row]
+    assert len(duplicates) == 2
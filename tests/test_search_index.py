@@ -0,0 +1,150 @@
+# tests/test_search_index.py
+
+"""
+Checks SearchIndex against a brute-force scan of the same records.
+
+Each test drives an index and a plain model (category -> row texts and amounts, position ->
+transaction) through the same random edits, then compares every search with a linear scan.
+Small alphabets and short texts make trigram collisions, tiny records, and compaction common.
+"""
+
+import random
+
+import pytest
+
+from app.search_index import SearchIndex
+from models.transaction import Transaction
+
+ALPHABET = "ab c"
+DATES = ["2024-01-01", "2024-01-15", "2024-02-01", "2024-03-10"]
+
+
+def random_text(rng):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 7))).upper() \
+        if rng.random() < 0.2 else "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 7)))
+
+
+def random_item(rng):
+    return {"Item": random_text(rng), "Projected Cost": 0.0, "Actual Cost": float(rng.randrange(0, 10))}
+
+
+def brute_force(model, transactions, query, prefix=False, min_amount=None, max_amount=None,
+                start_date=None, end_date=None, kind=None):
+    query = query.lower()
+    records = []
+    if kind in (None, "expense"):
+        for category, items in model.items():
+            for row, item in enumerate(items):
+                records.append((str(item["Item"]).lower(), item["Actual Cost"], None, ("expense", category, row)))
+    if kind in (None, "transaction"):
+        for position, t in transactions.items():
+            records.append((t.description.lower(), t.amount, t.date, ("transaction", position)))
+    results = []
+    for text, amount, date, ref in records:
+        if not (text.startswith(query) if prefix else query in text):
+            continue
+        if (min_amount is not None and amount < min_amount) or (max_amount is not None and amount > max_amount):
+            continue
+        if start_date is not None or end_date is not None:
+            if date is None or (start_date is not None and date < start_date) \
+                    or (end_date is not None and date > end_date):
+                continue
+        results.append(ref)
+    return sorted(results)
+
+
+def check_queries(rng, index, model, transactions, count=40):
+    for _ in range(count):
+        query = "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 5)))
+        options = {"prefix": rng.random() < 0.3}
+        if rng.random() < 0.3:
+            options["kind"] = rng.choice(["expense", "transaction"])
+        if rng.random() < 0.2:
+            options["min_amount"], options["max_amount"] = sorted(rng.sample(range(10), 2))
+        if rng.random() < 0.2:
+            options["start_date"], options["end_date"] = sorted(rng.sample(DATES, 2))
+        found = index.search(query, **options)
+        assert len(found) == len(set(found))
+        assert sorted(found) == brute_force(model, transactions, query, **options)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_random_edits_match_brute_force(seed):
+    rng = random.Random(seed)
+    index = SearchIndex()
+    model = {}
+    transactions = {}
+    for _ in range(400):
+        op = rng.random()
+        category = rng.choice(["FOOD", "HOUSING", "PETS"])
+        items = model.get(category)
+        if op < 0.1:
+            model[category] = [random_item(rng) for _ in range(rng.randrange(0, 300))]
+            index.index_category(category, model[category])
+        elif op < 0.15:
+            model.pop(category, None)
+            index.remove_category(category)
+        elif op < 0.2:
+            # A worker-thread build merged into the live index replaces those categories
+            built = {c: [random_item(rng) for _ in range(rng.randrange(0, 200))] for c in rng.sample(list(model) or [category], 1)}
+            model.update(built)
+            index.merge(SearchIndex.for_expenses(built))
+        elif op < 0.4 and items:
+            row = rng.randrange(len(items))
+            items[row] = random_item(rng)
+            index.update_item(category, row, items[row])
+        elif op < 0.55 and items is not None:
+            row = rng.randrange(len(items) + 1)
+            items.insert(row, random_item(rng))
+            index.insert_item(category, row, items[row])
+        elif op < 0.7 and items:
+            row = rng.randrange(len(items))
+            del items[row]
+            index.remove_item(category, row)
+        elif op < 0.85:
+            position = len(transactions)
+            transactions[position] = Transaction(rng.choice(DATES), category, float(rng.randrange(10)), random_text(rng))
+            index.add_transaction(transactions[position], position)
+        elif op < 0.95 and transactions:
+            position = max(transactions)
+            del transactions[position]
+            index.remove_transaction(position)
+        elif op < 0.97:
+            transactions.clear()
+            index.remove_transactions()
+        if rng.random() < 0.1:
+            check_queries(rng, index, model, transactions, count=10)
+    check_queries(rng, index, model, transactions, count=200)
+    assert index.live == sum(index.alive)
+
+
+def test_compaction_keeps_rows_in_order():
+    rng = random.Random(42)
+    index = SearchIndex()
+    items = [{"Item": f"row {i}", "Projected Cost": 0.0, "Actual Cost": 1.0} for i in range(1500)]
+    index.index_category("FOOD", items)
+    # Inserted rows get later record ids than the rows below them
+    for _ in range(50):
+        row = rng.randrange(len(items) + 1)
+        items.insert(row, {"Item": f"new {row}", "Projected Cost": 0.0, "Actual Cost": 1.0})
+        index.insert_item("FOOD", row, items[row])
+    # Retire most records so the index compacts
+    for _ in range(1200):
+        row = rng.randrange(len(items))
+        del items[row]
+        index.remove_item("FOOD", row)
+    assert len(index.alive) < len(items) + 1250  # Compacted: fewer records than were ever added
+    for row, record_id in enumerate(index.by_category["FOOD"]):
+        assert index.refs[record_id] == ("expense", "FOOD", row)
+        assert index.texts[record_id] == items[row]["Item"]
+    assert sorted(index.search("new")) == brute_force({"FOOD": items}, {}, "new")
+
+
+def test_short_and_empty_texts_are_found():
+    index = SearchIndex()
+    items = [{"Item": text, "Projected Cost": 0.0, "Actual Cost": 0.0} for text in ["", "a", "ab", "ba", "abc"]]
+    index.index_category("FOOD", items)
+    assert index.search("a") == [("expense", "FOOD", row) for row in (1, 2, 3, 4)]
+    assert index.search("ab") == [("expense", "FOOD", 2), ("expense", "FOOD", 4)]
+    assert index.search("a", prefix=True) == [("expense", "FOOD", 1), ("expense", "FOOD", 2), ("expense", "FOOD", 4)]
+    assert len(index.search("")) == len(items)
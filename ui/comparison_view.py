@@ -0,0 +1,90 @@
+# ui/comparison_view.py
+
+"""
+Dialog showing the differences between two budget workbooks.
+
+Abstraction Function:
+- ComparisonView lists a WorkbookDiff result: Income/Balance changes as text and one table row per
+  added, removed, or changed expense item with its projected and actual deltas.
+
+Representation Invariant:
+- The table has the columns of COLUMN_KEYS and is read-only.
+"""
+
+from PyQt6.QtWidgets import QDialog, QLabel, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout
+
+from utils.currency_formatter import CurrencyFormatter
+
+
+class ComparisonView(QDialog):
+    COLUMN_KEYS = ["Category", "Item", "Change", "Projected", "Actual"]
+
+    def __init__(self, result, parent=None, currency="USD"):
+        """
+        Builds the comparison dialog.
+
+        REQUIRES: result is a dict returned by WorkbookDiff.compare or compare_files; currency is
+                  the ISO 4217 code the workbooks' figures are in
+        MODIFIES: self
+        EFFECTS: Shows the summary changes, the unchanged sheets, and a table of item changes,
+                 with amounts formatted in currency.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Workbook Comparison")
+        self.resize(900, 600)
+        layout = QVBoxLayout(self)
+
+        if "old" in result:
+            layout.addWidget(QLabel(f"Comparing {result['old']} with {result['new']}"))
+        lines = [
+            f"{sheet} - {key}: {CurrencyFormatter.format_amount(change['old'], currency)} -> "
+            f"{CurrencyFormatter.format_amount(change['new'], currency)} "
+            f"({self.signed(change['delta'], currency)})"
+            for sheet, changes in result["summary"].items()
+            for key, change in changes.items()
+        ]
+        layout.addWidget(QLabel("\n".join(lines) or "Income and Balance unchanged"))
+        if result["unchanged"]:
+            layout.addWidget(QLabel("Unchanged sheets (skipped): " + ", ".join(result["unchanged"])))
+
+        rows = []
+        for category, diff in result["categories"].items():
+            for item in diff["added"]:
+                rows.append((
+                    category, item["item"], "Added",
+                    self.signed(item["projected"], currency), self.signed(item["actual"], currency)
+                ))
+            for item in diff["removed"]:
+                rows.append((
+                    category, item["item"], "Removed",
+                    self.signed(-item["projected"], currency), self.signed(-item["actual"], currency)
+                ))
+            for item in diff["changed"]:
+                rows.append((
+                    category, item["item"], "Changed",
+                    self.signed(item["projected"]["delta"], currency), self.signed(item["actual"]["delta"], currency)
+                ))
+
+        self.table = QTableWidget(len(rows), len(self.COLUMN_KEYS))
+        self.table.setHorizontalHeaderLabels(self.COLUMN_KEYS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        layout.addWidget(self.table)
+
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        layout.addWidget(close_button)
+
+    @staticmethod
+    def signed(delta, currency):
+        """
+        Formats a change with an explicit sign.
+
+        REQUIRES: delta is a float; currency is an ISO 4217 code
+        MODIFIES: nothing
+        EFFECTS: Returns e.g. "+$12.50" or "-€3.00".
+        """
+        sign = "-" if delta < 0 else "+"
+        return sign + CurrencyFormatter.format_amount(abs(delta), currency)
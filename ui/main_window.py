@@ -9,48 +9,127 @@ Abstraction Function:
 Representation Invariant:
 - parent is a QStackedWidget
 - chart_canvas is not None
+- journal records every edit made through this window since the last load or reload
+- dirty is True iff budget_data's expenses may differ from the loaded file: set by every sheet
+  edit, undo, redo, and merge; cleared only by a load or save (a reload keeps edits to sheets
+  that did not change on disk, so it leaves dirty as it is)
+- chart_key identifies the raster most recently requested for chart_canvas
+- daily_series is None or the daily spending of BudgetManager's transactions at daily_revision,
+  a (manager revision, rate table version) pair
+- workbook_watcher is None or tracks the file budget_data was loaded from; merging another
+  workbook in stops the watch, since the session then mirrors neither file
+- category_boxes has a panel for every default category and every category in budget_data;
+  only panels in or near the scrolled view hold a table, listed in category_sections,
+  and each held table shows its category's current rows
+- index_future is None once the search index holds every category's current rows; while a
+  load's index is being built on the worker, stale_categories lists categories edited since
+- forecast_future is None or the most recently requested forecast; only its result is shown
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as Date
+
+from PyQt6.QtCore import QEvent, QFileSystemWatcher, QRect, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QKeySequence, QPixmap, QShortcut
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QFileDialog, QTableWidget, QTableWidgetItem,
+    QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QTableWidgetItem,
     QLabel, QLineEdit, QHBoxLayout, QGroupBox, QGridLayout, QScrollArea
 )
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from models.budget import Budget
 from models.category import Category
-from app.chart_renderer import LineChartRenderer
+from models.transaction import Transaction
+from app.budget_manager import BudgetManager
+from app.chart_rasterizer import ChartRasterizer
+from app.chart_renderer import DailySpendingChartRenderer, LineChartRenderer
+from app.deduplicator import Deduplicator
+from app.forecaster import Forecaster
+from app.report_builder import ReportBuilder
+from app.search_index import SearchIndex
+from app.session_journal import AppendItem, AppendTransaction, DeleteItem, EditItem, SessionJournal, SetBudget
+from app.workbook_diff import WorkbookDiff
 from file_io.excel_loader import ExcelLoader
+from file_io.workbook_watcher import WorkbookWatcher
+from ui.comparison_view import ComparisonView
+from ui.widget_factory import TablePool
+from utils.currency_formatter import CurrencyFormatter
 
 class MainWindow(QWidget):
+    COLUMN_KEYS = ["Item", "Projected Cost", "Actual Cost"]
+    POLL_INTERVAL_MS = 2000
+    RELOAD_DELAY_MS = 300
+    CHART_WIDTH = 1200
+    CHART_HEIGHT = 500
+    PANEL_HEIGHT = 240
+    PANEL_COLUMNS = 3
+    FORECAST_PATHS = 100000
+    FORECAST_MONTHS = 12
+    MIN_QUERY_LENGTH = 2
+
+    # Emitted from worker threads; Qt queues delivery onto the GUI thread
+    chart_rendered = pyqtSignal(object, object)
+    search_index_built = pyqtSignal(object, object)
+    forecast_ready = pyqtSignal(object, object)
+
     def __init__(self, parent):
         """
         Constructs the main dashboard screen.
 
         REQUIRES: parent is QStackedWidget
         MODIFIES: self
-        EFFECTS: Builds all input fields, category tables, chart, and action buttons.
+        EFFECTS: Builds all input fields, category panels, chart, and action buttons.
         """
         super().__init__()
         self.parent = parent
         self.budget_data = {}
         self.budget = Budget()
+        self.journal = SessionJournal(self)
+        self.dirty = False
+        self.chart_renderer = LineChartRenderer()
+        self.daily_renderer = DailySpendingChartRenderer()
+        self.daily_series = None
+        self.daily_revision = None
+        self.chart_rasterizer = ChartRasterizer()
+        self.chart_key = None
+        self.chart_rendered.connect(self.show_chart)
+        self.index_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-index")
+        self.index_future = None
+        self.stale_categories = set()
+        self.search_index_built.connect(self.adopt_search_index)
+        self.forecast_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forecast")
+        self.forecast_future = None
+        self.forecast_ready.connect(self.show_forecast)
+
+        # Workbook auto-reload: file-system notifications with mtime polling as a fallback
+        self.workbook_watcher = None
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self.schedule_reload)
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.timeout.connect(self.reload_changed_sheets)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.poll_workbook)
 
         # Outer layout
         layout = QVBoxLayout()
 
         # Scroll Area for vertical flow
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
+        self.scroll_area = QScrollArea()
+        self.scroll_widget = QWidget()
+        scroll_layout = QVBoxLayout(self.scroll_widget)
+        self.scroll_area.setWidget(self.scroll_widget)
+        self.scroll_area.setWidgetResizable(True)
 
         # Upload + Budget Input
         self.upload_button = QPushButton("Upload Excel File")
         self.upload_button.clicked.connect(self.upload_file)
         scroll_layout.addWidget(self.upload_button)
+        self.compare_button = QPushButton("Compare With Another Workbook")
+        self.compare_button.clicked.connect(self.compare_workbook)
+        scroll_layout.addWidget(self.compare_button)
+        self.merge_button = QPushButton("Merge Another Workbook")
+        self.merge_button.clicked.connect(self.merge_workbook)
+        scroll_layout.addWidget(self.merge_button)
 
         budget_layout = QHBoxLayout()
         self.budget_input = QLineEdit()
@@ -61,39 +140,83 @@ class MainWindow(QWidget):
         budget_layout.addWidget(self.set_budget_button)
         scroll_layout.addLayout(budget_layout)
 
+        # Undo / redo of session edits
+        history_layout = QHBoxLayout()
+        self.undo_button = QPushButton("Undo")
+        self.undo_button.clicked.connect(self.undo)
+        self.redo_button = QPushButton("Redo")
+        self.redo_button.clicked.connect(self.redo)
+        self.undo_all_button = QPushButton("Undo All")
+        self.undo_all_button.clicked.connect(self.undo_all)
+        history_layout.addWidget(self.undo_button)
+        history_layout.addWidget(self.redo_button)
+        history_layout.addWidget(self.undo_all_button)
+        scroll_layout.addLayout(history_layout)
+
+        # Row edits act on the table holding the keyboard focus, so the buttons never take it
+        rows_layout = QHBoxLayout()
+        self.add_row_button = QPushButton("Add Row")
+        self.add_row_button.clicked.connect(self.add_row)
+        self.delete_row_button = QPushButton("Delete Row")
+        self.delete_row_button.clicked.connect(self.delete_row)
+        for button in (self.add_row_button, self.delete_row_button):
+            button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            rows_layout.addWidget(button)
+        scroll_layout.addLayout(rows_layout)
+
+        # Manual transaction entry
+        transaction_layout = QHBoxLayout()
+        self.transaction_date = QLineEdit()
+        self.transaction_date.setPlaceholderText("Date (YYYY-MM-DD)")
+        self.transaction_category = QLineEdit()
+        self.transaction_category.setPlaceholderText("Category")
+        self.transaction_amount = QLineEdit()
+        self.transaction_amount.setPlaceholderText("Amount")
+        self.transaction_description = QLineEdit()
+        self.transaction_description.setPlaceholderText("Description")
+        self.add_transaction_button = QPushButton("Add Transaction")
+        self.add_transaction_button.clicked.connect(self.add_transaction)
+        for widget in (self.transaction_date, self.transaction_category, self.transaction_amount,
+                       self.transaction_description, self.add_transaction_button):
+            transaction_layout.addWidget(widget)
+        scroll_layout.addLayout(transaction_layout)
+        QShortcut(QKeySequence.StandardKey.Undo, self, activated=self.undo)
+        QShortcut(QKeySequence.StandardKey.Redo, self, activated=self.redo)
+
         self.income_label = QLabel("Income: Not Loaded")
         self.balance_label = QLabel("Balance: Not Loaded")
         scroll_layout.addWidget(self.income_label)
         scroll_layout.addWidget(self.balance_label)
 
-        # Categories
-        self.categories = Category.all()
-        self.category_sections = {}
+        # Live search over item names
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search items")
+        self.search_input.textChanged.connect(self.filter_tables)
+        scroll_layout.addWidget(self.search_input)
 
-        grid = QGridLayout()
-        row, col = 0, 0
-        for category in self.categories:
-            box = QGroupBox(category)
-            box_layout = QVBoxLayout()
-            table = QTableWidget()
-            table.setColumnCount(3)
-            table.setHorizontalHeaderLabels(["Item", "Projected Cost", "Actual Cost"])
-            box_layout.addWidget(table)
-            box.setLayout(box_layout)
-            self.category_sections[category] = table
-            grid.addWidget(box, row, col)
-            col += 1
-            if col > 2:
-                col = 0
-                row += 1
-        scroll_layout.addLayout(grid)
+        # Categories: empty panels are cheap placeholders; tables are attached only while in view
+        self.categories = []
+        self.category_boxes = {}
+        self.category_sections = {}
+        self.table_pool = TablePool()
+        self.visible_rows = None
+        self.category_grid = QGridLayout()
+        scroll_layout.addLayout(self.category_grid)
+        self.sync_panels()
+        self.panel_timer = QTimer(self)
+        self.panel_timer.setSingleShot(True)
+        self.panel_timer.timeout.connect(self.update_visible_panels)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(lambda _: self.schedule_panel_update())
 
         # Budget status
         self.budget_status = QLabel("Budget Status: Not Set")
         scroll_layout.addWidget(self.budget_status)
+        self.forecast_label = QLabel("Forecast: Not Loaded")
+        scroll_layout.addWidget(self.forecast_label)
 
         # Chart
-        self.chart_canvas = FigureCanvas(plt.Figure(figsize=(12, 5)))
+        self.chart_canvas = QLabel()
+        self.chart_canvas.setMinimumHeight(self.CHART_HEIGHT)
         scroll_layout.addWidget(self.chart_canvas)
 
         # Buttons
@@ -104,9 +227,31 @@ class MainWindow(QWidget):
         scroll_layout.addWidget(self.back_button)
         scroll_layout.addWidget(self.save_button)
 
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.scroll_area)
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """
+        Attaches tables to the panels in view once the window is shown.
+
+        REQUIRES: event is a QShowEvent
+        MODIFIES: category panels
+        EFFECTS: Schedules a panel update.
+        """
+        super().showEvent(event)
+        self.schedule_panel_update()
+
+    def resizeEvent(self, event):
+        """
+        Re-checks which panels are in view after a resize.
+
+        REQUIRES: event is a QResizeEvent
+        MODIFIES: category panels
+        EFFECTS: Schedules a panel update.
+        """
+        super().resizeEvent(event)
+        self.schedule_panel_update()
+
     def upload_file(self):
         """
         Opens a file and loads budget data.
@@ -117,21 +262,174 @@ class MainWindow(QWidget):
         """
         file_path, _ = QFileDialog.getOpenFileName(self, "Open Excel File", "", "Excel Files (*.xlsx)")
         if file_path:
-            self.budget_data = ExcelLoader.load_budget_data(file_path)
-            self.update_ui()
+            self.load_budget_data(file_path)
+
+    def compare_workbook(self):
+        """
+        Compares another workbook with the one being viewed.
+
+        REQUIRES: a workbook is loaded
+        MODIFIES: budget_status QLabel
+        EFFECTS: Asks for the other (earlier) workbook and shows its differences from the current
+                 one. Without unsaved edits or merges the two files are compared directly, skipping
+                 identical sheets; otherwise the current session, edits included, is compared.
+        """
+        if not self.budget_data:
+            self.budget_status.setText("Load a workbook before comparing.")
+            return
+        file_path, _ = QFileDialog.getOpenFileName(self, "Compare With", "", "Excel Files (*.xlsx)")
+        if not file_path:
+            return
+        try:
+            if self.workbook_watcher is not None and not self.dirty:
+                result = WorkbookDiff.compare_files(file_path, self.workbook_watcher.path)
+            else:
+                other = ExcelLoader.load_budget_data(file_path)
+                if not other:
+                    raise ValueError(f"Could not read budget data from {file_path}")
+                result = WorkbookDiff.compare(other, self.budget_data)
+        except (OSError, ValueError, KeyError) as e:
+            self.budget_status.setText(f"Comparison failed: {e}")
+            return
+        ComparisonView(result, self, BudgetManager().budget.currency).exec()
+
+    def merge_workbook(self):
+        """
+        Merges another workbook's expense rows into the one being viewed.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, UI widgets
+        EFFECTS: Asks for a workbook and merges it with merge_budget_data().
+        """
+        file_path, _ = QFileDialog.getOpenFileName(self, "Merge Workbook", "", "Excel Files (*.xlsx)")
+        if file_path:
+            self.merge_budget_data(file_path)
+
+    def merge_budget_data(self, file_path):
+        """
+        Appends the expense rows of a workbook that are not already in the session.
+
+        REQUIRES: file_path is a valid .xlsx file path
+        MODIFIES: self.budget_data, self.workbook_watcher, self.journal, self.dirty, UI widgets
+        EFFECTS: Drops rows whose (category, item, costs) match a row already present, in one
+                 linear pass, and appends the rest to their categories. Income and Balance are
+                 taken from the workbook only if the session has none. Stops watching the loaded
+                 file and reports how many rows were merged and skipped. Returns the number of
+                 rows merged, or None if the file could not be read.
+        """
+        other = ExcelLoader.load_budget_data(file_path)
+        if not other:
+            self.budget_status.setText(f"Could not read budget data from {file_path}")
+            return None
+        expenses = self.budget_data.get("Expenses", {})
+        merged, duplicates = Deduplicator().merge_expenses(expenses, other.get("Expenses", {}))
+        added = sum(len(rows) for rows in merged.values()) - sum(len(rows) for rows in expenses.values())
+        for sheet in ExcelLoader.SUMMARY_SHEETS:
+            if not self.budget_data.get(sheet) and other.get(sheet):
+                self.budget_data[sheet] = other[sheet]
+        self.budget_data["Expenses"] = merged
+        self.dirty = True
+
+        # The session now differs from the watched file; a reload would discard the merged rows
+        if self.file_watcher.files():
+            self.file_watcher.removePaths(self.file_watcher.files())
+        self.poll_timer.stop()
+        self.workbook_watcher = None
+        self.journal.clear()
+        self.update_ui()
+        self.budget_status.setText(f"Merged {added} rows; skipped {len(duplicates)} duplicates.")
+        return added
+
+    def load_budget_data(self, file_path):
+        """
+        Loads a workbook, shows it, and starts watching it for edits.
+
+        REQUIRES: file_path is a valid .xlsx file path
+        MODIFIES: self.budget_data, self.workbook_watcher, self.dirty, UI widgets
+        EFFECTS: Returns True if the file was loaded; later edits to it are picked up automatically.
+        """
+        data = ExcelLoader.load_budget_data(file_path)
+        if not data:
+            return False
+        self.budget_data = data
+        self.journal.clear()
+        self.dirty = False
+        self.update_ui()
+        self.watch_workbook(file_path)
+        return True
+
+    def watch_workbook(self, file_path):
+        """
+        Starts auto-reload for the given workbook.
+
+        REQUIRES: file_path is the workbook budget_data was loaded from
+        MODIFIES: self.workbook_watcher, file_watcher, poll_timer
+        EFFECTS: Watches the file via file-system notifications, polling its mtime if those are unavailable.
+        """
+        if self.file_watcher.files():
+            self.file_watcher.removePaths(self.file_watcher.files())
+        self.poll_timer.stop()
+        self.workbook_watcher = WorkbookWatcher(file_path)
+        if not self.file_watcher.addPath(file_path):
+            self.poll_timer.start(self.POLL_INTERVAL_MS)
+
+    def schedule_reload(self, file_path):
+        """
+        Debounces change notifications while a workbook is being saved.
+
+        REQUIRES: file_path is the watched workbook
+        MODIFIES: reload_timer, file_watcher
+        EFFECTS: Re-arms the watch (editors often replace the file on save) and reloads shortly after.
+        """
+        if file_path not in self.file_watcher.files() and not self.file_watcher.addPath(file_path):
+            self.poll_timer.start(self.POLL_INTERVAL_MS)
+        self.reload_timer.start(self.RELOAD_DELAY_MS)
+
+    def poll_workbook(self):
+        """
+        Polling fallback for auto-reload.
+
+        REQUIRES: nothing
+        MODIFIES: reload_timer
+        EFFECTS: Schedules a reload when the watched workbook's mtime changed.
+        """
+        if self.workbook_watcher is not None and self.workbook_watcher.has_changed():
+            self.reload_timer.start(self.RELOAD_DELAY_MS)
+
+    def reload_changed_sheets(self):
+        """
+        Re-parses only the edited sheets of the watched workbook.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, UI widgets
+        EFFECTS: Patches budget_data and refreshes only the affected labels, tables, and chart.
+        """
+        if self.workbook_watcher is None or not self.budget_data:
+            return
+        changes = self.workbook_watcher.check(self.budget_data)
+        if not changes:
+            return
+        self.journal.clear()  # Recorded row positions no longer match the reloaded sheets
+        if changes.summary:
+            self.update_summary_labels()
+        if changes.categories:
+            self.update_tables(changes.categories)
+            self.update_budget_status()
+            self.update_chart()
+        self.update_forecast()
 
     def set_budget(self):
         """
         Updates the budget using user input.
 
         REQUIRES: valid number typed into budget_input
-        MODIFIES: self.budget
-        EFFECTS: Updates current budget object.
+        MODIFIES: self.budget, self.journal
+        EFFECTS: Updates current budget object as an undoable edit.
         """
         try:
             amount = float(self.budget_input.text())
-            self.budget = Budget(amount)
-            self.budget_status.setText(f"Budget Set: ${amount:.2f}")
+            self.journal.execute(SetBudget(amount))
+            self.budget_status.setText(f"Budget Set: {self.money(amount)}")
             self.budget_input.clear()
         except ValueError:
             self.budget_status.setText("Invalid input!")
@@ -147,38 +445,492 @@ class MainWindow(QWidget):
         if not self.budget_data:
             return
 
+        self.update_summary_labels()
+        self.update_tables()
+        self.update_budget_status()
+        self.update_forecast()
+        self.update_chart()
+
+    def update_summary_labels(self):
+        """
+        Shows the Income and Balance figures.
+
+        REQUIRES: self.budget_data has Income and Balance
+        MODIFIES: income_label, balance_label
+        EFFECTS: Displays projected/actual income and balance.
+        """
         income = self.budget_data["Income"]
         balance = self.budget_data["Balance"]
         self.income_label.setText(
-            f"Projected Income: ${income['Projected Monthly Income']} | "
-            f"Actual Income: ${income['Actual Monthly Income']}"
+            f"Projected Income: {self.money(income['Projected Monthly Income'])} | "
+            f"Actual Income: {self.money(income['Actual Monthly Income'])}"
         )
         self.balance_label.setText(
-            f"Projected Balance: ${balance['Projected Balance']} | "
-            f"Actual Balance: ${balance['Actual Balance']} | "
-            f"Difference: ${balance['Difference']}"
+            f"Projected Balance: {self.money(balance['Projected Balance'])} | "
+            f"Actual Balance: {self.money(balance['Actual Balance'])} | "
+            f"Difference: {self.money(balance['Difference'])}"
         )
 
-        self.update_tables()
-        self.update_budget_status()
-        self.update_chart()
+    def money(self, amount):
+        """
+        Formats an amount in the session's reporting currency.
 
-    def update_tables(self):
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns e.g. "$1,234.56" or "€1,234.56"; missing and non-numeric amounts show as 0.
+        """
+        return CurrencyFormatter.format_amount(ReportBuilder.cost(amount), BudgetManager().budget.currency)
+
+    def update_tables(self, categories=None):
         """
         Fills the category tables with expense data.
 
         REQUIRES: self.budget_data["Expenses"] exists
+        MODIFIES: category QTableWidgets, BudgetManager's search index
+        EFFECTS: Refreshes the given categories (all when None): panels in view are refilled now,
+                 the rest are filled when scrolled into view; tables of categories with no data
+                 are emptied. Re-indexes those categories for search (all of them on a worker
+                 thread) and re-applies the filter.
+        """
+        expenses = self.budget_data["Expenses"]
+        search_index = BudgetManager().search_index
+        if categories is None:
+            self.build_search_index(expenses)
+        elif self.index_future is not None:
+            self.stale_categories.update(categories)  # Re-indexed once the build lands
+        else:
+            for category in categories:
+                if category in expenses:
+                    search_index.index_category(category, expenses[category])
+                else:
+                    search_index.remove_category(category)
+
+        self.sync_panels()
+        for category, table in self.category_sections.items():
+            if categories is None or category in categories:
+                self.fill_table(category, table)
+        self.filter_tables(self.search_input.text())
+        self.schedule_panel_update()
+
+    def build_search_index(self, expenses):
+        """
+        Re-indexes every expense category off the GUI thread.
+
+        REQUIRES: expenses is budget_data["Expenses"]
+        MODIFIES: BudgetManager's search index, index_future, stale_categories
+        EFFECTS: Drops the indexed expense items now and indexes a copy of the category dict on the
+                 worker; adopt_search_index merges the result. A newer build supersedes this one.
+        """
+        BudgetManager().search_index.index_expenses({})
+        self.stale_categories = set()
+        future = self.index_executor.submit(SearchIndex.for_expenses, dict(expenses))
+        self.index_future = future
+        future.add_done_callback(self._emit_search_index)
+
+    def _emit_search_index(self, future):
+        """
+        Forwards a finished index build from the worker thread to the GUI thread.
+
+        REQUIRES: future is a completed build Future
+        MODIFIES: nothing
+        EFFECTS: Emits search_index_built unless the build failed or was cancelled.
+        """
+        if not future.cancelled() and future.exception() is None:
+            self.search_index_built.emit(future, future.result())
+
+    def adopt_search_index(self, future, index):
+        """
+        Merges a finished index build into the live search index.
+
+        REQUIRES: index was built by future
+        MODIFIES: BudgetManager's search index, index_future, stale_categories, category tables
+        EFFECTS: Unless a newer build was started, merges the index, re-indexes categories edited
+                 during the build, and re-applies the search filter.
+        """
+        if future is not self.index_future:
+            return
+        self.index_future = None
+        search_index = BudgetManager().search_index
+        search_index.merge(index)
+        expenses = self.budget_data.get("Expenses", {})
+        for category in self.stale_categories:
+            if category in expenses:
+                search_index.index_category(category, expenses[category])
+            else:
+                search_index.remove_category(category)
+        self.stale_categories = set()
+        self.filter_tables(self.search_input.text())
+
+    def fill_table(self, category, table):
+        """
+        Shows one category's rows in a table.
+
+        REQUIRES: table is the table attached to category's panel
+        MODIFIES: table
+        EFFECTS: Replaces the table's cells with the category's items; no edit is recorded.
+        """
+        items = self.budget_data.get("Expenses", {}).get(category, [])
+        table.blockSignals(True)  # Filling cells is not a user edit
+        table.setRowCount(len(items))
+        for row, item in enumerate(items):
+            self.fill_row(table, row, item)
+        table.blockSignals(False)
+
+    def fill_row(self, table, row, item):
+        """
+        Shows one item in a table row.
+
+        REQUIRES: 0 <= row < table.rowCount(); the caller blocks the table's signals
+        MODIFIES: table
+        EFFECTS: Replaces the row's cells with the item's name and formatted costs.
+        """
+        table.setItem(row, 0, QTableWidgetItem(item["Item"]))
+        table.setItem(row, 1, QTableWidgetItem(self.money(item["Projected Cost"])))
+        table.setItem(row, 2, QTableWidgetItem(self.money(item["Actual Cost"])))
+
+    def refresh_row(self, category, row):
+        """
+        Brings one edited, inserted, or deleted row of a category up to date.
+
+        REQUIRES: the category's rows differ from what is indexed and shown by at most that row
+        MODIFIES: BudgetManager's search index, the category's table, visible_rows
+        EFFECTS: Re-indexes and redraws just that row, inserting or removing it when the row count
+                 changed, and re-applies the search filter to it; costs time independent of the
+                 category's size (apart from renumbering the rows below an insert or delete).
+        """
+        rows = self.budget_data.get("Expenses", {}).get(category)
+        table = self.category_sections.get(category)
+        search_index = BudgetManager().search_index
+        building = self.index_future is not None
+        if building:
+            self.stale_categories.add(category)  # Re-indexed once the build lands
+            indexed = table.rowCount() if table is not None else len(rows or ())
+        else:
+            indexed = len(search_index.by_category.get(category, ()))
+        if rows is None or row is None or abs(len(rows) - indexed) > 1:
+            self.update_tables({category})
+            return
+
+        if table is not None:
+            table.blockSignals(True)
+        if len(rows) > indexed:
+            if not building:
+                search_index.insert_item(category, row, rows[row])
+            if table is not None:
+                table.insertRow(row)
+        elif len(rows) < indexed:
+            if not building:
+                search_index.remove_item(category, row)
+            if table is not None:
+                table.removeRow(row)
+        elif not building:
+            search_index.update_item(category, row, rows[row])
+        if table is not None:
+            if row < len(rows):
+                self.fill_row(table, row, rows[row])
+            table.blockSignals(False)
+
+        if self.visible_rows is not None and not building:
+            query = self.search_input.text().strip()
+            self.visible_rows[category] = {
+                r for _, c, r in search_index.search(query, kind="expense") if c == category
+            }
+            if table is not None and row < len(rows):
+                table.setRowHidden(row, row not in self.visible_rows[category])
+
+    def sync_panels(self):
+        """
+        Creates and removes category panels to match the loaded data.
+
+        REQUIRES: nothing
+        MODIFIES: self.categories, category_boxes, category_grid
+        EFFECTS: Keeps a placeholder panel for every default category and every category in
+                 budget_data, in that order, and lays them out PANEL_COLUMNS per row.
+        """
+        categories = Category.all()
+        defaults = set(categories)
+        categories += [c for c in self.budget_data.get("Expenses", {}) if c not in defaults]
+        if categories == self.categories:
+            return
+
+        for category in set(self.category_boxes) - set(categories):
+            if category in self.category_sections:
+                self.release_panel(category)
+            box = self.category_boxes.pop(category)
+            self.category_grid.removeWidget(box)
+            box.deleteLater()
+        for index, category in enumerate(categories):
+            box = self.category_boxes.get(category)
+            if box is None:
+                box = self.category_boxes[category] = QGroupBox(category)
+                box.setLayout(QVBoxLayout())
+                box.setMinimumHeight(self.PANEL_HEIGHT)
+            else:
+                self.category_grid.removeWidget(box)
+            self.category_grid.addWidget(box, index // self.PANEL_COLUMNS, index % self.PANEL_COLUMNS)
+        self.categories = categories
+
+    def schedule_panel_update(self):
+        """
+        Coalesces scroll and resize events into one panel update.
+
+        REQUIRES: nothing
+        MODIFIES: panel_timer
+        EFFECTS: Runs update_visible_panels once control returns to the event loop.
+        """
+        self.panel_timer.start(0)
+
+    def update_visible_panels(self):
+        """
+        Attaches tables to panels in view and releases the others.
+
+        REQUIRES: nothing
+        MODIFIES: category panels, category_sections, table_pool
+        EFFECTS: Panels within one panel height of the scrolled view get a filled table; tables
+                 of panels further away go back to the pool.
+        """
+        # Let the scroll area grow and place newly added panels before testing them
+        QApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest.value)
+        viewport = self.scroll_area.viewport()
+        offset = self.scroll_area.verticalScrollBar().value()
+        view = QRect(0, offset, viewport.width(), viewport.height())
+        view = view.adjusted(0, -self.PANEL_HEIGHT, 0, self.PANEL_HEIGHT)
+        shown = self.isVisible()
+        for category, box in self.category_boxes.items():
+            in_view = shown and box.geometry().intersects(view)
+            if in_view and category not in self.category_sections:
+                self.bind_panel(category)
+            elif not in_view and category in self.category_sections:
+                self.release_panel(category)
+
+    def bind_panel(self, category):
+        """
+        Gives a panel a table from the pool.
+
+        REQUIRES: category's panel has no table
+        MODIFIES: category_sections, table_pool, the panel
+        EFFECTS: Fills the table with the category's rows and the current search filter.
+        """
+        table = self.table_pool.acquire()
+        table.itemChanged.connect(lambda item, c=category: self.edit_item(c, item))
+        self.category_boxes[category].layout().addWidget(table)
+        table.show()
+        self.category_sections[category] = table
+        self.fill_table(category, table)
+        self.apply_filter(category, table)
+
+    def release_panel(self, category):
+        """
+        Returns a panel's table to the pool.
+
+        REQUIRES: category's panel has a table
+        MODIFIES: category_sections, table_pool, the panel
+        EFFECTS: Detaches the table; the panel keeps its size as an empty placeholder.
+        """
+        table = self.category_sections.pop(category)
+        table.itemChanged.disconnect()
+        self.category_boxes[category].layout().removeWidget(table)
+        self.table_pool.release(table)
+
+    def edit_item(self, category, table_item):
+        """
+        Records a cell edited by the user.
+
+        REQUIRES: table_item belongs to the table of category
+        MODIFIES: self.budget_data, self.journal
+        EFFECTS: Applies the edit as an undoable EditItem; invalid costs are reverted in the table.
+        """
+        rows = self.budget_data.get("Expenses", {}).get(category)
+        row = table_item.row()
+        if rows is None or row >= len(rows):
+            return
+        key = self.COLUMN_KEYS[table_item.column()]
+        text = table_item.text().strip()
+        try:
+            value = text if key == "Item" else CurrencyFormatter.parse_amount(text, BudgetManager().budget.currency)
+        except ValueError:
+            self.refresh_row(category, row)  # Puts the previous value back in the cell
+            return
+        item = dict(rows[row])
+        item[key] = value
+        self.refresh_after(self.journal.execute(EditItem(category, row, item)))
+
+    def undo(self):
+        """
+        Reverts the most recent edit.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, self.budget, self.journal
+        EFFECTS: Undoes one edit, if any, and refreshes what it touched.
+        """
+        if self.journal.can_undo():
+            self.refresh_after(self.journal.undo())
+
+    def undo_all(self):
+        """
+        Reverts every edit still in the history.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, self.budget, self.journal, self.dirty
+        EFFECTS: Jumps back to the oldest undoable state (through a journal snapshot when that is
+                 cheaper) and refreshes the categories, budget, chart, and forecast it touched;
+                 every reverted edit can be redone.
+        """
+        if not self.journal.can_undo():
+            return
+        commands = self.journal.undo_to(self.journal.earliest_step())
+        categories = {category for command in commands for category in command.categories}
+        if categories:
+            self.dirty = True
+            self.update_tables(categories)
+        self.update_chart()
+        if self.budget_data.get("Expenses") is not None:
+            self.update_budget_status()
+            self.update_forecast()
+
+    def focused_category(self):
+        """
+        Finds the category whose table has the keyboard focus.
+
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS: Returns the category, or None if no category table (or its cell editor) has focus.
+        """
+        widget = QApplication.focusWidget()
+        if widget is None:
+            return None
+        for category, table in self.category_sections.items():
+            if widget is table or table.isAncestorOf(widget):
+                return category
+        return None
+
+    def add_row(self):
+        """
+        Appends an empty expense row to the focused category.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, self.journal
+        EFFECTS: Applies an undoable AppendItem, or asks the user to pick a table first.
+        """
+        category = self.focused_category()
+        if category is None:
+            self.budget_status.setText("Select a category table first.")
+            return
+        item = {"Item": "", "Projected Cost": 0.0, "Actual Cost": 0.0}
+        self.refresh_after(self.journal.execute(AppendItem(category, item)))
+
+    def delete_row(self):
+        """
+        Deletes the selected expense row of the focused category.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, self.journal
+        EFFECTS: Applies an undoable DeleteItem, or asks the user to pick a row first.
+        """
+        category = self.focused_category()
+        rows = self.budget_data.get("Expenses", {}).get(category)
+        row = self.category_sections[category].currentRow() if category is not None else -1
+        if rows is None or not 0 <= row < len(rows):
+            self.budget_status.setText("Select a row to delete.")
+            return
+        self.refresh_after(self.journal.execute(DeleteItem(category, row)))
+
+    def add_transaction(self):
+        """
+        Adds the transaction typed into the transaction fields.
+
+        REQUIRES: nothing
+        MODIFIES: BudgetManager, self.journal, transaction fields
+        EFFECTS: Applies an undoable AppendTransaction in the budget's currency (category
+                 Miscellaneous when left blank) and clears the fields; reports invalid input or a
+                 currency without rates instead.
+        """
+        manager = BudgetManager()
+        try:
+            date = Date.fromisoformat(self.transaction_date.text().strip()).isoformat()
+            amount = CurrencyFormatter.parse_amount(self.transaction_amount.text(), manager.budget.currency)
+        except ValueError:
+            self.budget_status.setText("Invalid transaction: enter a YYYY-MM-DD date and an amount.")
+            return
+        category = self.transaction_category.text().strip().upper() or Category.MISCELLANEOUS
+        transaction = Transaction(
+            date, category, amount, self.transaction_description.text().strip(), manager.budget.currency
+        )
+        try:
+            command = self.journal.execute(AppendTransaction(transaction))
+        except KeyError as e:
+            self.budget_status.setText(f"Could not add transaction: {e}")
+            return
+        for field in (self.transaction_date, self.transaction_category,
+                      self.transaction_amount, self.transaction_description):
+            field.clear()
+        self.refresh_after(command)
+
+    def redo(self):
+        """
+        Re-applies the most recently undone edit.
+
+        REQUIRES: nothing
+        MODIFIES: self.budget_data, self.budget, self.journal
+        EFFECTS: Redoes one edit, if any, and refreshes what it touched.
+        """
+        if self.journal.can_redo():
+            self.refresh_after(self.journal.redo())
+
+    def refresh_after(self, command):
+        """
+        Refreshes only the widgets an edit affected.
+
+        REQUIRES: command was just applied or reverted
+        MODIFIES: UI widgets, self.dirty
+        EFFECTS: Redraws the edited rows (or, for commands without one row, category tables),
+                 budget status, forecast, and (after sheet or transaction edits) chart.
+        """
+        for category in set(command.categories):
+            self.refresh_row(category, command.row)
+        if command.categories:
+            self.dirty = True
+        if command.categories or isinstance(command, AppendTransaction):
+            self.update_chart()
+        if self.budget_data.get("Expenses") is not None:
+            self.update_budget_status()
+            self.update_forecast()
+        else:
+            self.budget_status.setText(f"Budget Set: {self.money(self.budget.budget_limit)}")
+
+    def filter_tables(self, text):
+        """
+        Shows only the table rows whose item name contains the search text.
+
+        REQUIRES: text is a string
         MODIFIES: category QTableWidgets
-        EFFECTS: Fills tables with data from Excel
+        EFFECTS: Hides non-matching rows using the search index; text shorter than
+                 MIN_QUERY_LENGTH shows every row. The filter is remembered for tables attached later.
         """
+        query = text.strip()
+        visible = None
+        if len(query) >= self.MIN_QUERY_LENGTH:
+            visible = {}
+            for _, category, row in BudgetManager().search_index.search(query, kind="expense"):
+                visible.setdefault(category, set()).add(row)
+
+        self.visible_rows = visible
         for category, table in self.category_sections.items():
-            if category in self.budget_data["Expenses"]:
-                items = self.budget_data["Expenses"][category]
-                table.setRowCount(len(items))
-                for row, item in enumerate(items):
-                    table.setItem(row, 0, QTableWidgetItem(item["Item"]))
-                    table.setItem(row, 1, QTableWidgetItem(f"${item['Projected Cost']}"))
-                    table.setItem(row, 2, QTableWidgetItem(f"${item['Actual Cost']}"))
+            self.apply_filter(category, table)
+
+    def apply_filter(self, category, table):
+        """
+        Applies the current search filter to one table.
+
+        REQUIRES: table shows category's rows
+        MODIFIES: table
+        EFFECTS: Hides the rows the last search excluded; shows every row when there is no search.
+        """
+        rows = None if self.visible_rows is None else self.visible_rows.get(category, set())
+        table.setUpdatesEnabled(False)  # Otherwise every hidden row re-lays out the table
+        for row in range(table.rowCount()):
+            table.setRowHidden(row, rows is not None and row not in rows)
+        table.setUpdatesEnabled(True)
 
     def update_budget_status(self):
         """
@@ -188,34 +940,135 @@ class MainWindow(QWidget):
         MODIFIES: budget_status QLabel
         EFFECTS: Sets warning or remaining budget message.
         """
-        total_spent = sum(
-            sum(item["Actual Cost"] for item in category if item["Actual Cost"] is not None)
-            for category in self.budget_data["Expenses"].values()
-        )
+        total_spent = sum(ReportBuilder.category_totals(self.budget_data["Expenses"]).values())
         self.budget.update_spent(total_spent)
 
         if self.budget.is_over_budget():
-            self.budget_status.setText(f"Warning: Over Budget! ${total_spent:.2f} spent.")
+            self.budget_status.setText(f"Warning: Over Budget! {self.money(total_spent)} spent.")
         else:
-            self.budget_status.setText(f"Budget Remaining: ${self.budget.remaining_budget():.2f}")
+            self.budget_status.setText(f"Budget Remaining: {self.money(self.budget.remaining_budget())}")
+
+    def update_forecast(self):
+        """
+        Requests the Monte Carlo forecast of the month-end balance.
+
+        REQUIRES: self.budget_data is loaded
+        MODIFIES: forecast_future
+        EFFECTS: Fits and simulates FORECAST_PATHS paths over FORECAST_MONTHS months on the forecast
+                 worker, from a snapshot of the current data and session transactions; a request
+                 still waiting for the worker is cancelled. show_forecast displays the result.
+        """
+        if self.forecast_future is not None:
+            self.forecast_future.cancel()
+        # Row lists are copied because edits replace their items while the worker reads them
+        snapshot = dict(self.budget_data)
+        snapshot["Expenses"] = {
+            category: list(rows) if isinstance(rows, list) else rows
+            for category, rows in self.budget_data.get("Expenses", {}).items()
+        }
+        future = self.forecast_executor.submit(
+            MainWindow.forecast, snapshot, list(BudgetManager().transactions),
+            self.FORECAST_PATHS, self.FORECAST_MONTHS
+        )
+        self.forecast_future = future
+        future.add_done_callback(self._emit_forecast)
+
+    @staticmethod
+    def forecast(budget_data, transactions, paths, months):
+        """
+        Runs one forecast; called on the forecast worker.
+
+        REQUIRES: budget_data has Income, Balance, and Expenses; transactions are Transactions
+        MODIFIES: nothing
+        EFFECTS: Returns Forecaster.simulate's result for the fitted model, seeded so equal data
+                 gives an equal forecast.
+        """
+        forecaster = Forecaster.from_budget_data(budget_data, transactions)
+        return forecaster.simulate(paths, months, seed=0)
+
+    def _emit_forecast(self, future):
+        """
+        Forwards a finished forecast from the worker thread to the GUI thread.
+
+        REQUIRES: future is a completed forecast Future
+        MODIFIES: nothing
+        EFFECTS: Emits forecast_ready unless the forecast failed or was cancelled.
+        """
+        if not future.cancelled() and future.exception() is None:
+            self.forecast_ready.emit(future, future.result())
+
+    def show_forecast(self, future, result):
+        """
+        Shows a finished forecast.
+
+        REQUIRES: result is a Forecaster.simulate result over FORECAST_MONTHS months
+        MODIFIES: forecast_label, forecast_future
+        EFFECTS: Unless a newer forecast was requested, shows the final month's median, 5th-95th
+                 percentile range, and chance of a negative balance.
+        """
+        if future is not self.forecast_future:
+            return
+        self.forecast_future = None
+        low, median, high = (result["percentiles"][p][-1] for p in (5, 50, 95))
+        self.forecast_label.setText(
+            f"{self.FORECAST_MONTHS}-Month Forecast: {self.money(median)} "
+            f"(90% range {self.money(low)} to {self.money(high)}) | "
+            f"Chance of Negative Balance: {result['probability_negative'][-1]:.0%}"
+        )
 
     def update_chart(self):
         """
-        Draws weekly spending trend chart.
+        Draws the spending chart.
 
         REQUIRES: budget_data["Expenses"] exists
-        MODIFIES: self.chart_canvas
-        EFFECTS: Displays a line graph of costs per day.
+        MODIFIES: self.chart_canvas, daily_series
+        EFFECTS: With session transactions, requests their daily spending history (downsampled to
+                 the canvas width); otherwise the weekly trend of the expense sheets. Rendering runs
+                 on the background rasterizer and shows when ready; cached rasters are shown
+                 immediately and unchanged charts are skipped.
         """
-        expenses = self.budget_data["Expenses"]
-        cost_data = [sum(item["Actual Cost"] for item in category) for category in expenses.values()]
-        cost_data = cost_data[:7] + [0] * (7 - len(cost_data))
+        manager = BudgetManager()
+        if manager.transactions:
+            rates = None if manager.converter is None else manager.converter.rate_table.version
+            if self.daily_revision != (manager.revision, rates):
+                self.daily_series = ReportBuilder.daily_totals(manager.transactions, manager.converted_amounts())
+                self.daily_revision = (manager.revision, rates)
+            renderer, series = self.daily_renderer, self.daily_series
+        else:
+            renderer, series = self.chart_renderer, ReportBuilder.chart_series(self.budget_data["Expenses"])
+        width = max(self.chart_canvas.width(), self.CHART_WIDTH)
+        key, future = self.chart_rasterizer.submit(renderer, series, width, self.CHART_HEIGHT)
+        if key == self.chart_key:
+            return
+        self.chart_key = key
+        if future.done():
+            self.show_chart(key, future.result())
+        else:
+            future.add_done_callback(lambda f: self._emit_chart(key, f))
 
-        self.chart_canvas.figure.clear()
-        ax = self.chart_canvas.figure.add_subplot(111)
-        renderer = LineChartRenderer()
-        renderer.render(ax, cost_data)
-        self.chart_canvas.draw()
+    def _emit_chart(self, key, future):
+        """
+        Forwards a finished render from the worker thread to the GUI thread.
+
+        REQUIRES: future is a completed render Future
+        MODIFIES: nothing
+        EFFECTS: Emits chart_rendered with the raster unless the render failed or was cancelled.
+        """
+        if not future.cancelled() and future.exception() is None:
+            self.chart_rendered.emit(key, future.result())
+
+    def show_chart(self, key, raster):
+        """
+        Blits a finished raster onto the chart canvas.
+
+        REQUIRES: raster is a ChartRaster
+        MODIFIES: self.chart_canvas
+        EFFECTS: Displays the raster unless a newer chart has been requested since.
+        """
+        if key != self.chart_key:
+            return
+        image = QImage(raster.rgba, raster.width, raster.height, QImage.Format.Format_RGBA8888)
+        self.chart_canvas.setPixmap(QPixmap.fromImage(image))
 
     def go_back(self):
         """
@@ -232,8 +1085,13 @@ class MainWindow(QWidget):
         Saves data to file and exits the app.
 
         REQUIRES: valid budget data
-        MODIFIES: file system
-        EFFECTS: Creates Excel file and closes app.
+        MODIFIES: file system, BudgetManager's attached store
+        EFFECTS: Creates Excel file, saves the session to the store (if attached), and closes app.
         """
         ExcelLoader.save_budget_data([], self.budget_data)
+        self.dirty = False
+        BudgetManager().save_session(self.budget_data)
+        self.chart_rasterizer.shutdown()
+        self.index_executor.shutdown(wait=False, cancel_futures=True)
+        self.forecast_executor.shutdown(wait=False, cancel_futures=True)
         self.close()
@@ -5,22 +5,28 @@ Provides a factory method to build preformatted table widgets for categories.
 
 Abstraction Function:
 - WidgetFactory creates reusable QTableWidgets to display budget data by category.
+- TablePool keeps released tables so panels scrolled back into view reuse them instead of
+  constructing new widgets.
 
 Representation Invariant:
 - Tables must have 3 columns: Item, Projected Cost, Actual Cost
+- Pooled tables are empty, hidden, and number at most max_size.
 """
 
 from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
 
+from utils.currency_formatter import CurrencyFormatter
+
 class WidgetFactory:
     @staticmethod
-    def create_budget_table(items):
+    def create_budget_table(items, currency="USD"):
         """
         Creates a new table widget from the given item data.
 
-        REQUIRES: items is a list of dictionaries with keys 'Item', 'Projected Cost', 'Actual Cost'
+        REQUIRES: items is a list of dictionaries with keys 'Item', 'Projected Cost', 'Actual Cost';
+                  currency is an ISO 4217 code
         MODIFIES: nothing
-        EFFECTS: Returns a QTableWidget filled with provided item data.
+        EFFECTS: Returns a QTableWidget filled with provided item data, costs shown in currency.
         """
         table = QTableWidget()
         table.setColumnCount(3)
@@ -29,7 +35,50 @@ class WidgetFactory:
 
         for row, item in enumerate(items):
             table.setItem(row, 0, QTableWidgetItem(item.get("Item", "")))
-            table.setItem(row, 1, QTableWidgetItem(f"${item.get('Projected Cost', 0):.2f}"))
-            table.setItem(row, 2, QTableWidgetItem(f"${item.get('Actual Cost', 0):.2f}"))
+            table.setItem(row, 1, QTableWidgetItem(CurrencyFormatter.format_amount(item.get("Projected Cost", 0), currency)))
+            table.setItem(row, 2, QTableWidgetItem(CurrencyFormatter.format_amount(item.get("Actual Cost", 0), currency)))
 
         return table
+
+
+class TablePool:
+    def __init__(self, max_size=12):
+        """
+        Creates an empty pool.
+
+        REQUIRES: max_size >= 0
+        MODIFIES: self
+        EFFECTS: Keeps up to max_size released tables for reuse.
+        """
+        self.max_size = max_size
+        self.free = []
+
+    def acquire(self):
+        """
+        Hands out an empty table.
+
+        REQUIRES: nothing
+        MODIFIES: self.free
+        EFFECTS: Returns a pooled table, or a new one from WidgetFactory when the pool is empty.
+        """
+        if self.free:
+            return self.free.pop()
+        return WidgetFactory.create_budget_table([])
+
+    def release(self, table):
+        """
+        Takes back a table that is no longer shown.
+
+        REQUIRES: table came from acquire() and is not in the pool
+        MODIFIES: table, self.free
+        EFFECTS: Empties and detaches the table, then pools it, or deletes it when the pool is full.
+        """
+        table.blockSignals(True)
+        table.setRowCount(0)
+        table.blockSignals(False)
+        table.hide()
+        table.setParent(None)
+        if len(self.free) < self.max_size:
+            self.free.append(table)
+        else:
+            table.deleteLater()
@@ -5,6 +5,8 @@ Helper to format currency consistently throughout the app.
 
 Abstraction Function:
 - CurrencyFormatter ensures all currency values are displayed as strings like "$1,234.56".
+- Other currencies use their symbol when known ("€1,234.56") and their code otherwise ("CHF 1,234.56").
+- parse_amount reads such strings back, so edited table cells accept what the app displays.
 
 Representation Invariant:
 - format_dollar returns a properly formatted dollar string given a float.
@@ -12,6 +14,8 @@ Representation Invariant:
 
 
 class CurrencyFormatter:
+    SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥", "INR": "₹"}
+
     @staticmethod
     def format_dollar(amount):
         """
@@ -22,3 +26,34 @@ class CurrencyFormatter:
         EFFECTS: Returns a string representing the currency format.
         """
         return f"${amount:,.2f}"
+
+    @staticmethod
+    def format_amount(amount, currency="USD"):
+        """
+        Formats a float in the given currency (e.g., €1,234.56 or CHF 1,234.56).
+
+        REQUIRES: amount is a float or int; currency is an ISO 4217 code
+        MODIFIES: nothing
+        EFFECTS: Returns a string with the currency's symbol, or its code when it has none listed.
+        """
+        currency = currency.upper()
+        symbol = CurrencyFormatter.SYMBOLS.get(currency)
+        return f"{symbol}{amount:,.2f}" if symbol else f"{currency} {amount:,.2f}"
+
+    @staticmethod
+    def parse_amount(text, currency="USD"):
+        """
+        Reads back an amount typed or shown in the given currency (e.g., "€1,234.56" or "12.5").
+
+        REQUIRES: text is a string; currency is an ISO 4217 code
+        MODIFIES: nothing
+        EFFECTS: Returns the amount as a float, ignoring thousands separators and a leading symbol
+                 or code of currency (or "$"); raises ValueError if text is not a number.
+        """
+        currency = currency.upper()
+        text = text.replace(",", "").strip()
+        for prefix in (CurrencyFormatter.SYMBOLS.get(currency), currency, "$"):
+            if prefix and text.startswith(prefix):
+                text = text[len(prefix):]
+                break
+        return float(text.strip())